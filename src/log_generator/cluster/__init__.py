@@ -0,0 +1,4 @@
+from .controller import Controller
+from .agent import Agent
+
+__all__ = ['Controller', 'Agent']
@@ -0,0 +1,145 @@
+# src/cluster/__main__.py
+import argparse
+import asyncio
+import json
+
+from cluster.controller import Controller
+from cluster.agent import Agent
+from cluster.protocol import DEFAULT_PORT, parse_address
+from generators.stamping import new_run_id
+from main import build_formatter, check_common_args, check_stamp_visible
+
+
+def check_controller_args(parser, args):
+    """Validate the scenario before waiting for agents, with the same checks as main"""
+    check_common_args(parser, args)
+    if args.spike_types and not set(args.spike_types) <= set(args.type):
+        parser.error("--spike-types must be among the generated log types")
+    if args.count < 0 or 0 < args.count < args.agents:
+        parser.error("--count must be 0 (no limit) or at least --agents, so every agent gets a share")
+    # Agents build the same formatter from the shard
+    try:
+        formatter = build_formatter(args.format, args)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.stamp:
+        check_stamp_visible(parser, formatter)
+
+
+def run_controller(args):
+    host, port = parse_address(args.listen, default_host='0.0.0.0')
+    scenario = {
+        'types': args.type,
+        'rate': args.rate,
+        'duration': args.duration,
+        'count': args.count,
+        'format': args.format,
+        'layout': args.layout,
+        'seed': args.seed,
+        'entropy': args.entropy,
+        'run_id': (args.run_id or new_run_id()) if args.stamp else None
+    }
+    if args.spike_factor > 1:
+        scenario['spike'] = {
+            'start': args.spike_start,
+            'duration': args.spike_duration,
+            'period': args.spike_period,
+            'factor': args.spike_factor,
+            'types': args.spike_types or args.type
+        }
+    if scenario['run_id']:
+        print(f"Run id: {scenario['run_id']}")
+
+    controller = Controller(scenario, args.agents, host, port, start_delay=args.start_delay,
+                            register_timeout=args.register_timeout,
+                            report_interval=args.report_interval)
+
+    async def run():
+        await controller.start()
+        print(f"Controller listening on {host}:{controller.port}, waiting for {args.agents} agents")
+        return await controller.run()
+
+    summary = asyncio.run(run())
+    print(json.dumps(summary, indent=2))
+
+
+def run_agent(args):
+    host, port = parse_address(args.controller)
+    agent = Agent(host, port, agent_id=args.agent_id, log_dir=args.log_dir, files=args.files,
+                  file_skew=args.file_skew, max_open_files=args.max_open_files,
+                  stats_interval=args.stats_interval)
+    asyncio.run(agent.run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Coordinated log generation across several hosts')
+    roles = parser.add_subparsers(dest='role', required=True)
+
+    controller = roles.add_parser('controller', help='Hand out scenario shards and aggregate stats')
+    controller.add_argument('--listen', default=f'0.0.0.0:{DEFAULT_PORT}',
+                            help=f'Address to listen on (default: 0.0.0.0:{DEFAULT_PORT})')
+    controller.add_argument('--agents', type=int, required=True, help='Number of agents to wait for')
+    controller.add_argument('--type', nargs='+', default=['application'],
+                            help='Type(s) of logs to generate: application, error, metrics, graphql or '
+                                 'an installed plugin (default: application)')
+    controller.add_argument('--rate', type=float, default=100,
+                            help='Total logs per second per type across all agents (default: 100)')
+    controller.add_argument('--duration', type=float, default=0,
+                            help='Seconds to run for (0 for no limit, default: 0)')
+    controller.add_argument('--count', type=int, default=0,
+                            help='Total logs across all agents (0 for no limit, default: 0)')
+    controller.add_argument('--format', default='json',
+                            help='Log format: json, text, multiline, cri, docker, pattern or an installed '
+                                 'plugin (default: json)')
+    controller.add_argument('--layout', default='logfmt', help='Layout for the pattern format (default: logfmt)')
+    controller.add_argument('--seed', type=int, default=0, help='First random seed; agent i uses seed + i')
+    controller.add_argument('--entropy', type=float, default=0.0,
+                            help='Share (0-1) of unique values in generated records (default: 0.0)')
+    controller.add_argument('--stamp', action='store_true', help='Sequence-stamp records for verification')
+    controller.add_argument('--run-id', help='Run id for --stamp (default: random)')
+    controller.add_argument('--spike-factor', type=float, default=1,
+                            help='Rate multiplier during synchronized spikes (default: 1, no spikes)')
+    controller.add_argument('--spike-start', type=float, default=10,
+                            help='Seconds into the run when the first spike begins (default: 10)')
+    controller.add_argument('--spike-duration', type=float, default=30,
+                            help='Length of each spike in seconds (default: 30)')
+    controller.add_argument('--spike-period', type=float, default=0,
+                            help='Seconds between spike starts, 0 for a single spike (default: 0)')
+    controller.add_argument('--spike-types', nargs='+',
+                            help='Types whose rate is multiplied during a spike (default: all)')
+    controller.add_argument('--start-delay', type=float, default=2.0,
+                            help='Seconds between handing out shards and the common start (default: 2.0)')
+    controller.add_argument('--register-timeout', type=float, default=60.0,
+                            help='Seconds to wait for agents to register (default: 60)')
+    controller.add_argument('--report-interval', type=float, default=5.0,
+                            help='Seconds between aggregated reports (default: 5.0)')
+
+    agent = roles.add_parser('agent', help='Generate one shard for a controller')
+    agent.add_argument('--controller', default=f'127.0.0.1:{DEFAULT_PORT}',
+                       help=f'Controller address (default: 127.0.0.1:{DEFAULT_PORT})')
+    agent.add_argument('--agent-id', help='Agent id (default: host name and process id)')
+    agent.add_argument('--log-dir',
+                       help='Directory for log files; the agent writes to a subdirectory named after its id')
+    agent.add_argument('--files', type=int, default=1,
+                       help='Number of files to fan output out across (default: 1)')
+    agent.add_argument('--file-skew', type=float, default=0.0,
+                       help='Zipf exponent for per-file rates when fanning out (default: 0.0)')
+    agent.add_argument('--max-open-files', type=int, default=64,
+                       help='Maximum open file handles when fanning out (default: 64)')
+    agent.add_argument('--stats-interval', type=float, default=1.0,
+                       help='Seconds between stats reports to the controller (default: 1.0)')
+    args = parser.parse_args()
+    if args.role == 'controller':
+        check_controller_args(parser, args)
+
+    try:
+        if args.role == 'controller':
+            run_controller(args)
+        else:
+            run_agent(args)
+    except KeyboardInterrupt:
+        print("\nStopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# src/cluster/agent.py
+import asyncio
+import os
+import random
+import re
+import socket
+import time
+
+from registry import FORMATTERS, GENERATORS
+from generators.stamping import SequenceStamper
+from scheduling.profiles import ConstantRate, IncidentWindow, BurstProfile
+from scheduling.scheduler import Scheduler, Stream
+from generators.base_generator import determine_log_dir
+from .protocol import HELLO, START, STATS, DONE, STOP, ProtocolError, send_message, read_message
+
+
+class Agent:
+    """
+    Generates one shard of a cluster scenario. The agent connects to the
+    controller, waits for its shard and the shared start time, runs the
+    scheduler and reports cumulative counters until the shard is finished.
+    Each agent writes into a subdirectory of the log directory named after
+    its id, so agents sharing a host (or a volume) never share files.
+
+    Usage:
+        agent = Agent('10.0.0.5', 7070)
+        asyncio.run(agent.run())
+    """
+
+    def __init__(self, controller_host, controller_port, agent_id=None, log_dir=None,
+                 files=1, file_skew=0.0, max_open_files=64, stats_interval=1.0):
+        """
+        Initialize the agent.
+
+        Args:
+            controller_host: Controller address
+            controller_port: Controller port
+            agent_id: Id of this agent (default: host name and process id)
+            log_dir: Directory for the generated logs; the agent writes to a
+                     subdirectory named after its id
+            files: Number of files to fan output out across (1 for the rotating log file)
+            file_skew: Zipf exponent for per-file rates when fanning out
+            max_open_files: Maximum open file handles when fanning out
+            stats_interval: Seconds between stats messages
+        """
+        self.controller_host = controller_host
+        self.controller_port = controller_port
+        self.agent_id = agent_id or f'{socket.gethostname()}-{os.getpid()}'
+        self.log_dir = os.path.join(determine_log_dir(log_dir),
+                                    re.sub(r'[^0-9A-Za-z._-]', '_', self.agent_id).lstrip('.') or 'agent')
+        self.files = files
+        self.file_skew = file_skew
+        self.max_open_files = max_open_files
+        self.stats_interval = stats_interval
+        self.streams = []
+        self.started = None
+
+    def build_scheduler(self, shard):
+        """
+        Create the generators and scheduler for a shard.
+
+        Args:
+            shard: Shard dict sent by the controller
+
+        Returns:
+            Scheduler: Scheduler driving one stream per log type
+        """
+        random.seed(shard['seed'])
+        if shard['format'] == 'pattern':
+            formatter = FORMATTERS.get('pattern')(layout=shard.get('layout', 'logfmt'))
+        else:
+            formatter = FORMATTERS.get(shard['format'])()
+
+        window = None
+        spike = shard.get('spike')
+        if spike:
+            window = IncidentWindow(spike['start'], spike['duration'], spike.get('period', 0))
+
+        self.streams = []
+        for log_type in shard['types']:
+            sink = None
+            if self.files > 1:
+                from sinks.fan_out import FanOutSink
+                sink = FanOutSink(self.log_dir, log_type, file_count=self.files,
+                                  skew=self.file_skew, max_open=self.max_open_files)
+            stamper = None
+            if shard.get('run_id'):
+                stamper = SequenceStamper(shard['run_id'], f'{self.agent_id}-{log_type}')
+            generator = GENERATORS.get(log_type)(formatter, self.log_dir, sink=sink, stamper=stamper,
+                                                 entropy=shard.get('entropy', 0.0))
+
+            profile = ConstantRate(shard['rate'])
+            if window is not None:
+                factor = spike['factor'] if log_type in spike.get('types', shard['types']) else 1
+                profile = BurstProfile(profile, window, factor=factor)
+            self.streams.append(Stream(generator, profile))
+        return Scheduler(self.streams)
+
+    def stats(self):
+        """
+        Get cumulative counters for the running shard.
+
+        Returns:
+            dict: Totals and per-type counts and bytes
+        """
+        types = {}
+        for stream in self.streams:
+            types[stream.generator.get_log_type()] = {'count': stream.count, 'bytes': stream.bytes}
+        return {
+            'count': sum(t['count'] for t in types.values()),
+            'bytes': sum(t['bytes'] for t in types.values()),
+            'elapsed': time.monotonic() - self.started if self.started else 0.0,
+            'types': types
+        }
+
+    async def run(self):
+        """Connect, run one shard and report until it is finished or stopped"""
+        reader, writer = await asyncio.open_connection(self.controller_host, self.controller_port)
+        try:
+            await send_message(writer, HELLO, agent_id=self.agent_id, time=time.time())
+            message = await read_message(reader)
+            if message is None or message['type'] == STOP:
+                print("Controller did not assign a shard")
+                return
+            if message['type'] != START:
+                raise ProtocolError(f"Expected start message, got {message['type']}")
+
+            shard = message['shard']
+            # Estimate the controller's clock offset (ignores half the round trip)
+            offset = message['controller_time'] - time.time()
+            scheduler = self.build_scheduler(shard)
+            print(f"Agent {self.agent_id}: shard {shard['index']} "
+                  f"({', '.join(shard['types'])} at {shard['rate']}/s each)")
+
+            delay = message['start_at'] - offset - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            self.started = time.monotonic()
+            loop = asyncio.get_running_loop()
+            run = loop.run_in_executor(None, scheduler.run, shard.get('count', 0), shard.get('duration', 0))
+            listener = asyncio.create_task(self._listen(reader, scheduler))
+            try:
+                while True:
+                    done, _ = await asyncio.wait({run}, timeout=self.stats_interval)
+                    if done:
+                        break
+                    await send_message(writer, STATS, agent_id=self.agent_id, stats=self.stats())
+            finally:
+                scheduler.stop()
+                await run
+                listener.cancel()
+                for stream in self.streams:
+                    stream.generator.sink.close()
+            await send_message(writer, DONE, agent_id=self.agent_id, stats=self.stats())
+        finally:
+            writer.close()
+
+    async def _listen(self, reader, scheduler):
+        """Stop the scheduler when the controller says so or goes away"""
+        try:
+            while True:
+                message = await read_message(reader)
+                if message is None or message['type'] == STOP:
+                    scheduler.stop()
+                    return
+        except (ProtocolError, ConnectionError):
+            scheduler.stop()
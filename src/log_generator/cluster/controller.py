@@ -0,0 +1,217 @@
+# src/cluster/controller.py
+import asyncio
+import time
+from .protocol import HELLO, START, STATS, DONE, STOP, ProtocolError, send_message, read_message
+
+
+class _AgentConnection:
+    def __init__(self, agent_id, writer):
+        self.agent_id = agent_id
+        self.writer = writer
+        self.stats = {'count': 0, 'bytes': 0, 'elapsed': 0.0, 'types': {}}
+        self.done = False
+
+
+class Controller:
+    """
+    Coordinates generation across several agents. The controller waits for
+    the expected number of agents to register, splits the scenario into one
+    shard per agent (rate, count and seed), starts all agents at the same
+    wall-clock time and aggregates their live counters.
+
+    Scenario keys:
+        types      List of log types
+        rate       Total records per second per type across all agents
+        duration   Seconds to run (0 for no limit)
+        count      Total records across all agents (0 for no limit, otherwise at
+                   least one per agent)
+        format     Output format name (plus 'layout' for the pattern format)
+        seed       First seed; agent i uses seed + i
+        entropy    Share of unique values in generated records (0-1)
+        run_id     Optional run id; agents then stamp records for verification
+        spike      Optional {'start', 'duration', 'period', 'factor', 'types'}
+
+    Usage:
+        controller = Controller({'types': ['application'], 'rate': 10000, 'duration': 60,
+                                 'format': 'json', 'seed': 1}, expected_agents=3)
+        summary = asyncio.run(controller.run())
+    """
+
+    def __init__(self, scenario, expected_agents, host='0.0.0.0', port=7070, start_delay=2.0,
+                 register_timeout=60.0, report_interval=5.0):
+        """
+        Initialize the controller.
+
+        Args:
+            scenario: Scenario dict (see class docstring)
+            expected_agents: Number of agents to wait for before starting
+            host: Address to listen on
+            port: Port to listen on (0 for any free port)
+            start_delay: Seconds between sending shards and the common start time
+            register_timeout: Seconds to wait for agents to register
+            report_interval: Seconds between aggregated reports
+        """
+        if expected_agents < 1:
+            raise ValueError("expected_agents must be at least 1")
+        # A shard count of 0 means no limit to the agent, so every agent
+        # needs a share of at least one record
+        count = scenario.get('count', 0)
+        if count < 0 or 0 < count < expected_agents:
+            raise ValueError("count must be 0 (no limit) or at least the number of agents")
+        self.scenario = scenario
+        self.expected_agents = expected_agents
+        self.host = host
+        self.port = port
+        self.start_delay = start_delay
+        self.register_timeout = register_timeout
+        self.report_interval = report_interval
+        self.agents = []
+        self.started = False
+        self.server = None
+        self._registered = asyncio.Event()
+        self._last_report = (time.monotonic(), 0, 0)
+
+    async def start(self):
+        """Start listening for agents"""
+        self.server = await asyncio.start_server(self._handle_agent, self.host, self.port)
+        if self.port == 0:
+            self.port = self.server.sockets[0].getsockname()[1]
+
+    async def run(self):
+        """
+        Run the scenario to completion.
+
+        Returns:
+            dict: Aggregated statistics
+        """
+        if self.server is None:
+            await self.start()
+        try:
+            await asyncio.wait_for(self._registered.wait(), self.register_timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Only {len(self.agents)} of {self.expected_agents} agents registered")
+
+        await self._start_agents()
+        try:
+            while not all(agent.done for agent in self.agents):
+                await asyncio.sleep(min(self.report_interval, 0.2))
+                if time.monotonic() - self._last_report[0] >= self.report_interval:
+                    print(self.report(), flush=True)
+        finally:
+            await self.stop()
+        return self.summary()
+
+    def shards(self):
+        """
+        Split the scenario into one shard per registered agent.
+
+        Returns:
+            list: Shard dicts
+        """
+        count = len(self.agents)
+        total = self.scenario.get('count', 0)
+        shards = []
+        for index in range(count):
+            shard = dict(self.scenario)
+            shard['index'] = index
+            shard['rate'] = self.scenario['rate'] / count
+            shard['seed'] = self.scenario.get('seed', 0) + index
+            if total:
+                shard['count'] = total // count + (1 if index < total % count else 0)
+            shards.append(shard)
+        return shards
+
+    async def _start_agents(self):
+        self.started = True
+        start_at = time.time() + self.start_delay
+        for agent, shard in zip(self.agents, self.shards()):
+            await send_message(agent.writer, START, shard=shard, start_at=start_at,
+                               controller_time=time.time())
+        self._last_report = (time.monotonic() + self.start_delay, 0, 0)
+        print(f"Started {len(self.agents)} agents at {time.strftime('%H:%M:%S', time.localtime(start_at))}")
+
+    async def stop(self):
+        """Tell all agents to stop and close the listener"""
+        for agent in self.agents:
+            if not agent.done:
+                try:
+                    await send_message(agent.writer, STOP)
+                except ConnectionError:
+                    pass
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def _handle_agent(self, reader, writer):
+        agent = None
+        try:
+            message = await read_message(reader)
+            if message is None or message['type'] != HELLO:
+                return
+            if self.started or len(self.agents) >= self.expected_agents:
+                await send_message(writer, STOP)
+                return
+            agent = _AgentConnection(message['agent_id'], writer)
+            self.agents.append(agent)
+            print(f"Agent {agent.agent_id} registered ({len(self.agents)}/{self.expected_agents})")
+            if len(self.agents) == self.expected_agents:
+                self._registered.set()
+
+            while True:
+                message = await read_message(reader)
+                if message is None:
+                    break
+                if message['type'] in (STATS, DONE):
+                    agent.stats = message['stats']
+                if message['type'] == DONE:
+                    break
+        except (ProtocolError, ConnectionError) as e:
+            print(f"Agent connection error: {e}")
+        finally:
+            if agent is not None:
+                agent.done = True
+            writer.close()
+
+    def summary(self):
+        """
+        Aggregate the latest counters of all agents.
+
+        Returns:
+            dict: Cluster totals, per-type totals and per-agent counters
+        """
+        types = {}
+        for agent in self.agents:
+            for log_type, counters in agent.stats.get('types', {}).items():
+                totals = types.setdefault(log_type, {'count': 0, 'bytes': 0})
+                totals['count'] += counters['count']
+                totals['bytes'] += counters['bytes']
+        elapsed = max((agent.stats.get('elapsed', 0.0) for agent in self.agents), default=0.0)
+        count = sum(agent.stats.get('count', 0) for agent in self.agents)
+        total_bytes = sum(agent.stats.get('bytes', 0) for agent in self.agents)
+        return {
+            'agents': len(self.agents),
+            'count': count,
+            'bytes': total_bytes,
+            'elapsed': round(elapsed, 3),
+            'records_per_sec': round(count / elapsed, 1) if elapsed > 0 else 0.0,
+            'types': types,
+            'per_agent': {agent.agent_id: agent.stats.get('count', 0) for agent in self.agents}
+        }
+
+    def report(self):
+        """
+        Format the aggregated counters with the rate since the last report.
+
+        Returns:
+            str: Human-readable status line
+        """
+        s = self.summary()
+        now = time.monotonic()
+        last_time, last_count, last_bytes = self._last_report
+        interval = now - last_time
+        rate = (s['count'] - last_count) / interval if interval > 0 else 0.0
+        byte_rate = (s['bytes'] - last_bytes) / interval if interval > 0 else 0.0
+        self._last_report = (now, s['count'], s['bytes'])
+        running = sum(1 for agent in self.agents if not agent.done)
+        return (f"agents={running}/{s['agents']} records={s['count']} rate={rate:.1f}/s "
+                f"throughput={byte_rate / 1e6:.3f} MB/s")
@@ -0,0 +1,65 @@
+# src/cluster/protocol.py
+import json
+
+DEFAULT_PORT = 7070
+
+# Message types
+HELLO = 'hello'      # agent -> controller: registration
+START = 'start'      # controller -> agent: shard and start time
+STATS = 'stats'      # agent -> controller: cumulative counters
+DONE = 'done'        # agent -> controller: shard finished
+STOP = 'stop'        # controller -> agent: stop generating
+
+
+class ProtocolError(Exception):
+    """Raised for malformed or unexpected messages"""
+    pass
+
+
+async def send_message(writer, message_type, **fields):
+    """
+    Send one message as a line of JSON.
+
+    Args:
+        writer: asyncio.StreamWriter
+        message_type: One of the message type constants
+        **fields: Message payload
+    """
+    writer.write(json.dumps({'type': message_type, **fields}).encode() + b'\n')
+    await writer.drain()
+
+
+async def read_message(reader):
+    """
+    Read one message.
+
+    Args:
+        reader: asyncio.StreamReader
+
+    Returns:
+        dict: The message, or None when the connection was closed
+
+    Raises:
+        ProtocolError: If the line is not a JSON message
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        message = json.loads(line)
+    except ValueError as e:
+        raise ProtocolError(f"Invalid message: {e}")
+    if not isinstance(message, dict) or 'type' not in message:
+        raise ProtocolError(f"Invalid message: {line[:100]!r}")
+    return message
+
+
+def parse_address(address, default_host='127.0.0.1'):
+    """
+    Parse 'host:port', 'host' or ':port'.
+
+    Returns:
+        tuple: (host, port)
+    """
+    host, _, port = address.rpartition(':') if ':' in address else (address, '', '')
+    return host or default_host, int(port) if port else DEFAULT_PORT
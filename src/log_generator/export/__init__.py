@@ -0,0 +1,6 @@
+from .columns import ColumnBuffer, RecordBatchBuilder, SchemaConflictError
+from .writers import ColumnarWriter, CSVWriter, ArrowIPCWriter, ParquetWriter, get_writer, default_format
+from .exporter import ColumnarExporter
+
+__all__ = ['ColumnBuffer', 'RecordBatchBuilder', 'SchemaConflictError', 'ColumnarWriter', 'CSVWriter',
+           'ArrowIPCWriter', 'ParquetWriter', 'get_writer', 'default_format', 'ColumnarExporter']
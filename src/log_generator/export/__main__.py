@@ -0,0 +1,95 @@
+# src/export/__main__.py
+import argparse
+import json
+import os
+import random
+import sys
+
+from main import get_formatter, get_generator
+from export.columns import SchemaConflictError
+from export.exporter import ColumnarExporter, EXTENSIONS
+from export.writers import FORMATS, default_format
+from generators.schema_generator import SchemaGenerator
+from generators.stamping import SequenceStamper, is_valid_run_id, new_run_id
+from schema import SchemaError, load_schema
+from sinks.null_sink import NullSink
+
+LOG_TYPES = ['application', 'error', 'metrics', 'graphql']
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Bulk-export generated records to Parquet, Arrow IPC or CSV for analytics engines')
+    parser.add_argument('--type', choices=LOG_TYPES, nargs='+',
+                        help='Type(s) of records to export, one file each (default: metrics)')
+    parser.add_argument('--schema', nargs='+', default=[],
+                        help='Schema file(s) describing custom record types to export')
+    parser.add_argument('--rows', type=int, required=True, help='Rows to export per type')
+    parser.add_argument('--format', choices=FORMATS,
+                        help='Output format (default: parquet with pyarrow installed, otherwise csv)')
+    parser.add_argument('--output-dir', default='.', help='Directory for the exported files (default: .)')
+    parser.add_argument('--row-group-size', type=int, default=65536,
+                        help='Rows per row group / record batch; bounds memory use (default: 65536)')
+    parser.add_argument('--probe-rows', type=int, default=65536,
+                        help='Rows sampled (and exported first) to determine the columns of each file; '
+                             'raise it for fields that only show up rarely (default: 65536)')
+    parser.add_argument('--compression', default='zstd',
+                        help='Parquet compression codec (default: zstd)')
+    parser.add_argument('--seed', type=int, help='Random seed, for reproducible datasets')
+    parser.add_argument('--entropy', type=float, default=0.0,
+                        help='Share (0-1) of unique values in generated records (default: 0.0)')
+    parser.add_argument('--stamp', action='store_true',
+                        help='Add the seq_stamp column used by the verify tool')
+    parser.add_argument('--run-id', help='Run id for --stamp (default: random)')
+    args = parser.parse_args()
+
+    if args.rows < 1:
+        parser.error("--rows must be at least 1")
+    if args.probe_rows < 1:
+        parser.error("--probe-rows must be at least 1")
+    if args.run_id is not None and not is_valid_run_id(args.run_id):
+        parser.error("--run-id must only contain ASCII letters and digits")
+    format_name = args.format or default_format()
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    try:
+        schemas = [load_schema(path) for path in args.schema]
+    except (OSError, SchemaError) as e:
+        parser.error(str(e))
+    types = args.type or ([] if schemas else ['metrics'])
+    run_id = args.run_id or new_run_id()
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    formatter = get_formatter('json')
+    for source in types + schemas:
+        name = source if isinstance(source, str) else source.name
+        stamper = SequenceStamper(run_id, name) if args.stamp else None
+        options = {'sink': NullSink(), 'stamper': stamper, 'entropy': args.entropy}
+        if isinstance(source, str):
+            generator = get_generator(source, formatter, None, **options)
+        else:
+            generator = SchemaGenerator(source, formatter, None, **options)
+
+        path = os.path.join(args.output_dir, name + EXTENSIONS[format_name])
+        try:
+            exporter = ColumnarExporter(generator, path, format_name,
+                                        row_group_size=args.row_group_size,
+                                        compression=args.compression,
+                                        probe_rows=args.probe_rows)
+        except (ValueError, RuntimeError) as e:
+            parser.error(str(e))
+        print(f"Exporting {args.rows} {name} rows to {path}", file=sys.stderr)
+        try:
+            summary = exporter.run(args.rows)
+        except KeyboardInterrupt:
+            print(f"\nExport stopped by user, {path} was not written", file=sys.stderr)
+            return
+        except SchemaConflictError as e:
+            parser.error(f"{path} was not written: {e}; use a larger --probe-rows so the sample "
+                         f"contains every field")
+        print(json.dumps(summary))
+
+
+if __name__ == "__main__":
+    main()
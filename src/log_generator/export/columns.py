@@ -0,0 +1,276 @@
+# src/export/columns.py
+from array import array
+import json
+
+# Column kinds, from most to least specific. A column widens when it sees a
+# value that does not fit its kind: int -> float -> string, bool -> string.
+INT = 'int'
+FLOAT = 'float'
+BOOL = 'bool'
+STRING = 'string'
+
+
+def _kind_of(value):
+    cls = value.__class__
+    if cls is bool:
+        return BOOL
+    if cls is int:
+        return INT
+    if cls is float:
+        return FLOAT
+    return STRING
+
+
+_PYTYPES = {INT: int, FLOAT: float, BOOL: bool, STRING: str}
+
+# Largest magnitude up to which every int has an exact float
+_EXACT_FLOAT_INT = 2 ** 53
+
+
+class SchemaConflictError(ValueError):
+    """Raised when a batch cannot be written to a file's schema without losing values"""
+    pass
+
+
+def _to_string(value):
+    if value is None or value.__class__ is str:
+        return value
+    if value.__class__ in (list, dict):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+class ColumnBuffer:
+    """
+    Typed buffer holding one column of a record batch. Numbers are stored in
+    array.array buffers (8 bytes per value, no Python object per value) with
+    Arrow's memory layout, so a finished column can be handed to pyarrow
+    without converting it value by value. Nulls are remembered by position
+    and only turned into a validity bitmap when one is asked for.
+
+    `lossy` counts values that lost precision when stored (ints beyond
+    2**53 in a float column); nothing else is ever converted lossily.
+    """
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.values = self._new_values(kind)
+        self.nulls = []
+        self.pytype = _PYTYPES[kind]
+        self.lossy = 0
+
+    @staticmethod
+    def _new_values(kind):
+        if kind == INT:
+            return array('q')
+        if kind == FLOAT:
+            return array('d')
+        return []
+
+    @property
+    def null_count(self):
+        return len(self.nulls)
+
+    def append(self, value):
+        """
+        Append a value, widening the column if the value does not fit.
+
+        Args:
+            value: Scalar value, or None for a null
+        """
+        if value.__class__ is self.pytype:
+            try:
+                self.values.append(value)
+                return
+            except OverflowError:
+                # Integer outside the 64-bit range
+                self.widen(STRING)
+        self._append_other(value)
+
+    def _append_other(self, value):
+        kind = self.kind
+        if value is None:
+            self.nulls.append(len(self.values))
+            self.values.append(0 if kind in (INT, FLOAT) else None)
+            return
+        if kind == STRING:
+            self.values.append(_to_string(value))
+            return
+        value_kind = _kind_of(value)
+        if kind == FLOAT and value_kind == INT:
+            if not -_EXACT_FLOAT_INT <= value <= _EXACT_FLOAT_INT:
+                if abs(value) >= 2 ** 1024:
+                    # Too large for a float at all
+                    self.widen(STRING)
+                    self.append(value)
+                    return
+                self.lossy += 1
+            self.values.append(value)
+            return
+        self.widen(FLOAT if {kind, value_kind} == {INT, FLOAT} else STRING)
+        self.append(value)
+
+    def pad(self, length):
+        """Append nulls until the column has `length` values"""
+        values = self.values
+        while len(values) < length:
+            self.nulls.append(len(values))
+            values.append(0 if self.kind in (INT, FLOAT) else None)
+
+    def validity(self):
+        """
+        Arrow validity bitmap (bit set for non-null values, least
+        significant bit first).
+
+        Returns:
+            bytearray: The bitmap
+        """
+        length = len(self.values)
+        bitmap = bytearray(b'\xff' * ((length + 7) >> 3))
+        for index in self.nulls:
+            bitmap[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+        return bitmap
+
+    def widen(self, kind):
+        """Convert the values already buffered to a wider kind"""
+        if kind == self.kind:
+            return
+        old = self.to_pylist()
+        self.kind = kind
+        self.pytype = _PYTYPES[kind]
+        if kind == FLOAT:
+            self.lossy += sum(1 for v in old if v is not None and not -_EXACT_FLOAT_INT <= v <= _EXACT_FLOAT_INT)
+            self.values = array('d', [0.0 if v is None else float(v) for v in old])
+        else:
+            self.values = [_to_string(v) for v in old]
+
+    def cast(self, kind):
+        """
+        Convert the column to the kind of a file schema that is already
+        written. Widening (to string, int to float) always works; narrowing
+        (float to int) only when every value converts exactly, e.g. 2.0 to 2.
+        Nothing is truncated or nulled.
+
+        Raises:
+            SchemaConflictError: If a value cannot be represented in `kind`
+        """
+        if kind == self.kind:
+            return
+        if kind == STRING or (kind == FLOAT and self.kind == INT):
+            self.widen(kind)
+            return
+
+        old = self.to_pylist()
+        for value in old:
+            if value is None:
+                continue
+            if kind == INT and self.kind == FLOAT and value.is_integer() and -2 ** 63 <= value < 2 ** 63:
+                continue
+            raise SchemaConflictError(f"{self.kind} value {value!r} does not fit the file's {kind} column")
+        self.kind = kind
+        self.pytype = _PYTYPES[kind]
+        self.values = self._new_values(kind)
+        self.nulls = []
+        for value in old:
+            if value is None:
+                self.pad(len(self.values) + 1)
+            else:
+                self.values.append(int(value))
+
+    def slice(self, start, stop):
+        """
+        Copy of rows [start, stop) as a new column. Values that lost
+        precision are counted in the slice starting at row 0, so the slices
+        of a column add up to its count.
+
+        Returns:
+            ColumnBuffer: The slice
+        """
+        column = ColumnBuffer(self.kind)
+        column.values = self.values[start:stop]
+        column.nulls = [index - start for index in self.nulls if start <= index < stop]
+        column.lossy = self.lossy if start == 0 else 0
+        return column
+
+    def to_pylist(self):
+        """Values as a list with None for nulls"""
+        values = list(self.values)
+        for index in self.nulls:
+            values[index] = None
+        return values
+
+
+class RecordBatchBuilder:
+    """
+    Accumulates records into column buffers. Nested dicts are flattened
+    into dotted column names ('request.method'); fields missing from a
+    record become nulls. Columns are kept in the order first seen.
+
+    Usage:
+        builder = RecordBatchBuilder()
+        for _ in range(65536):
+            builder.append(generator.build_log())
+        columns, rows = builder.finish()
+    """
+
+    def __init__(self):
+        self.columns = {}
+        self.rows = 0
+
+    def append(self, record):
+        """
+        Add a record to the batch.
+
+        Args:
+            record: dict as returned by a generator's build_log()
+        """
+        self._append(record, '', self.rows)
+        self.rows += 1
+
+    def _append(self, record, prefix, row):
+        columns = self.columns
+        for key, value in record.items():
+            name = prefix + key
+            if value.__class__ is dict and value:
+                self._append(value, name + '.', row)
+                continue
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = ColumnBuffer(STRING if value is None else _kind_of(value))
+            if len(column.values) < row:
+                column.pad(row)
+            column.append(value)
+
+    def finish(self):
+        """
+        Complete the batch and start a new one.
+
+        Returns:
+            tuple: (dict of column name to ColumnBuffer, number of rows)
+        """
+        columns, rows = self.columns, self.rows
+        for column in columns.values():
+            column.pad(rows)
+        self.columns = {}
+        self.rows = 0
+        return columns, rows
+
+
+def split_batch(columns, rows, size):
+    """
+    Split a finished batch into batches of at most `size` rows.
+
+    Args:
+        columns: dict of column name to ColumnBuffer, each `rows` long
+        rows: Number of rows in the batch
+        size: Rows per batch
+
+    Yields:
+        tuple: (dict of column name to ColumnBuffer, number of rows)
+    """
+    if rows <= size:
+        yield columns, rows
+        return
+    for start in range(0, rows, size):
+        stop = min(start + size, rows)
+        yield {name: column.slice(start, stop) for name, column in columns.items()}, stop - start
@@ -0,0 +1,121 @@
+# src/export/exporter.py
+import os
+import time
+from generators.stamping import STAMP_FIELD
+from .columns import RecordBatchBuilder, split_batch
+from .writers import get_writer
+
+# File extension per export format
+EXTENSIONS = {'parquet': '.parquet', 'arrow': '.arrow', 'csv': '.csv'}
+
+
+class ColumnarExporter:
+    """
+    Bulk-exports a generator's records to a columnar file. Records come
+    straight from build_log(), so the dataset has the same distributions as
+    the log output, but nothing is formatted or written to the generator's
+    sink. Records are accumulated into typed column buffers and flushed one
+    row group at a time, so memory use is bounded by the row group (or
+    probe) size no matter how many rows are exported.
+
+    The file's schema is the union of the columns of a probe sample, the
+    first `probe_rows` records, which are then exported as the first row
+    groups. A field that is rare enough to first appear after the probe
+    still raises SchemaConflictError. The file is written under a temporary
+    name and only replaces `path` once the export succeeded.
+
+    Usage:
+        exporter = ColumnarExporter(MetricsGenerator(JSONFormatter(), sink=sink),
+                                    'metrics.parquet', 'parquet')
+        exporter.run(rows=10_000_000)
+    """
+
+    def __init__(self, generator, path, format_name, row_group_size=65536, compression='zstd',
+                 probe_rows=65536):
+        """
+        Initialize the exporter.
+
+        Args:
+            generator: BaseGenerator to draw records from
+            path: Output file path
+            format_name: 'parquet', 'arrow' or 'csv'
+            row_group_size: Rows buffered per row group / record batch
+            compression: Parquet compression codec
+            probe_rows: Records sampled to determine the file's columns
+        """
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be at least 1")
+        if probe_rows < 1:
+            raise ValueError("probe_rows must be at least 1")
+        self.generator = generator
+        self.path = path
+        self.row_group_size = row_group_size
+        self.probe_rows = probe_rows
+        directory, name = os.path.split(path)
+        self.temp_path = os.path.join(directory, f'.{name}.{os.getpid()}.tmp')
+        self.writer = get_writer(format_name, self.temp_path, compression=compression)
+
+    def run(self, rows, progress=None):
+        """
+        Export a number of rows.
+
+        Args:
+            rows: Total rows to export
+            progress: Optional callable receiving the exporter after each row group
+
+        Returns:
+            dict: Summary with rows, row groups, seconds, bytes and the count of
+                  values stored with lost precision
+
+        Raises:
+            SchemaConflictError: If a record does not fit the schema taken from
+                the probe sample; `path` is then left as it was
+        """
+        generator = self.generator
+        build_log = generator.build_log
+        stamper = generator.stamper
+        builder = RecordBatchBuilder()
+        append = builder.append
+        start = time.monotonic()
+
+        remaining = rows
+        probing = True
+        try:
+            try:
+                while remaining > 0:
+                    batch = min(remaining, max(self.row_group_size, self.probe_rows) if probing
+                                else self.row_group_size)
+                    for _ in range(batch):
+                        record = build_log()
+                        if stamper is not None:
+                            record[STAMP_FIELD] = stamper.stamp()
+                        append(record)
+                    columns, count = builder.finish()
+                    if probing:
+                        self.writer.set_schema((name, column.kind) for name, column in columns.items())
+                        probing = False
+                    for group, group_rows in split_batch(columns, count, self.row_group_size):
+                        self.writer.write_batch(group, group_rows)
+                        if progress is not None:
+                            progress(self)
+                    remaining -= batch
+            finally:
+                self.writer.close()
+            os.replace(self.temp_path, self.path)
+        except BaseException:
+            # Leave no partial file behind, and any earlier export in place
+            if os.path.exists(self.temp_path):
+                os.unlink(self.temp_path)
+            raise
+
+        elapsed = time.monotonic() - start
+        return {
+            'path': self.path,
+            'rows': self.writer.rows,
+            'row_groups': self.writer.batches,
+            'columns': len(self.writer.schema or ()),
+            'seconds': round(elapsed, 3),
+            'rows_per_sec': round(self.writer.rows / elapsed) if elapsed > 0 else None,
+            'bytes': os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+            'lossy_values': self.writer.lossy_values
+        }
@@ -0,0 +1,243 @@
+# src/export/writers.py
+from abc import ABC, abstractmethod
+import csv
+from .columns import INT, FLOAT, BOOL, STRING, SchemaConflictError
+
+FORMATS = ('parquet', 'arrow', 'csv')
+
+
+def _require_pyarrow(format_name):
+    try:
+        import pyarrow
+    except ImportError:
+        raise RuntimeError(f"pyarrow is required for {format_name} export (pip install pyarrow); "
+                           f"use the csv format without it") from None
+    return pyarrow
+
+
+class ColumnarWriter(ABC):
+    """
+    Base class for columnar file writers. The file's schema is set with
+    set_schema() (e.g. from a sample of records) or else fixed by the first
+    batch: batches are converted to it where that is lossless and columns
+    they lack are written as nulls. A batch with a value the schema cannot
+    hold, or with a column the schema does not have, raises
+    SchemaConflictError rather than losing data.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.schema = None
+        self.opened = False
+        self.rows = 0
+        self.batches = 0
+        self.lossy_values = 0
+
+    def set_schema(self, schema):
+        """
+        Fix the file's schema before the first batch is written.
+
+        Args:
+            schema: List of (column name, kind) pairs
+        """
+        if self.opened:
+            raise ValueError("The schema is already written")
+        self.schema = list(schema)
+
+    def write_batch(self, columns, rows):
+        """
+        Write one batch (one row group / record batch in the file).
+
+        Args:
+            columns: dict of column name to ColumnBuffer, each `rows` long
+            rows: Number of rows in the batch
+
+        Raises:
+            SchemaConflictError: If the batch does not fit the file's schema
+        """
+        if not rows:
+            return
+        schema = self.schema
+        if schema is None:
+            schema = [(name, column.kind) for name, column in columns.items()]
+        else:
+            known = {name for name, _ in schema}
+            late = sorted(name for name, column in columns.items()
+                          if name not in known and column.null_count < rows)
+            if late:
+                raise SchemaConflictError(
+                    f"Column(s) {', '.join(late)} are not in the file's schema")
+
+        aligned = []
+        for name, kind in schema:
+            column = columns.get(name)
+            if column is None:
+                aligned.append(None)
+                continue
+            try:
+                column.cast(kind)
+            except SchemaConflictError as e:
+                raise SchemaConflictError(f"Column '{name}': {e}") from None
+            self.lossy_values += column.lossy
+            aligned.append(column)
+
+        if not self.opened:
+            self.schema = schema
+            self.open()
+            self.opened = True
+
+        self.write_columns(aligned, rows)
+        self.rows += rows
+        self.batches += 1
+
+    @abstractmethod
+    def open(self):
+        """Open the output once the schema is known"""
+        pass
+
+    @abstractmethod
+    def write_columns(self, columns, rows):
+        """
+        Write columns aligned with self.schema.
+
+        Args:
+            columns: List of ColumnBuffer, or None for an all-null column
+            rows: Number of rows
+        """
+        pass
+
+    def close(self):
+        """Finish the file"""
+        pass
+
+
+class CSVWriter(ColumnarWriter):
+    """CSV with a header row; nulls are written as empty fields"""
+
+    def open(self):
+        self.file = open(self.path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([name for name, _ in self.schema])
+
+    def write_columns(self, columns, rows):
+        empty = [''] * rows
+        values = []
+        for column in columns:
+            if column is None:
+                values.append(empty)
+            elif column.null_count:
+                values.append(['' if v is None else v for v in column.to_pylist()])
+            else:
+                values.append(column.values)
+        self.writer.writerows(zip(*values))
+
+    def close(self):
+        if self.opened:
+            self.file.close()
+
+
+class _ArrowWriter(ColumnarWriter):
+    """Shared conversion of column buffers to pyarrow arrays"""
+
+    format_name = None
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.pa = _require_pyarrow(self.format_name)
+        pa = self.pa
+        self.types = {INT: pa.int64(), FLOAT: pa.float64(), BOOL: pa.bool_(), STRING: pa.string()}
+
+    def arrow_schema(self):
+        return self.pa.schema([(name, self.types[kind]) for name, kind in self.schema])
+
+    def record_batch(self, columns, rows):
+        pa = self.pa
+        arrays = []
+        for (name, kind), column in zip(self.schema, columns):
+            arrow_type = self.types[kind]
+            if column is None:
+                arrays.append(pa.nulls(rows, type=arrow_type))
+            elif kind in (INT, FLOAT):
+                # Numeric buffers already have Arrow's memory layout
+                validity = pa.py_buffer(column.validity()) if column.null_count else None
+                arrays.append(pa.Array.from_buffers(arrow_type, rows,
+                                                    [validity, pa.py_buffer(column.values)],
+                                                    null_count=column.null_count))
+            else:
+                arrays.append(pa.array(column.values, type=arrow_type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.arrow_schema())
+
+
+class ArrowIPCWriter(_ArrowWriter):
+    """Arrow IPC file format (Feather v2), one record batch per batch written"""
+
+    format_name = 'arrow'
+
+    def open(self):
+        self.sink = self.pa.OSFile(self.path, 'wb')
+        self.writer = self.pa.ipc.new_file(self.sink, self.arrow_schema())
+
+    def write_columns(self, columns, rows):
+        self.writer.write_batch(self.record_batch(columns, rows))
+
+    def close(self):
+        if self.opened:
+            self.writer.close()
+            self.sink.close()
+
+
+class ParquetWriter(_ArrowWriter):
+    """Parquet, one row group per batch written"""
+
+    format_name = 'parquet'
+
+    def __init__(self, path, compression='zstd'):
+        super().__init__(path)
+        self.compression = compression
+
+    def open(self):
+        import pyarrow.parquet
+        self.writer = pyarrow.parquet.ParquetWriter(self.path, self.arrow_schema(),
+                                                    compression=self.compression)
+
+    def write_columns(self, columns, rows):
+        table = self.pa.Table.from_batches([self.record_batch(columns, rows)])
+        self.writer.write_table(table, row_group_size=rows)
+
+    def close(self):
+        if self.opened:
+            self.writer.close()
+
+
+def get_writer(format_name, path, compression='zstd'):
+    """
+    Create a columnar writer.
+
+    Args:
+        format_name: 'parquet', 'arrow' or 'csv'
+        path: Output file path
+        compression: Parquet compression codec
+
+    Returns:
+        ColumnarWriter: The writer
+
+    Raises:
+        ValueError: If the format is unknown
+        RuntimeError: If the format needs pyarrow and it is not installed
+    """
+    if format_name == 'parquet':
+        return ParquetWriter(path, compression=compression)
+    if format_name == 'arrow':
+        return ArrowIPCWriter(path)
+    if format_name == 'csv':
+        return CSVWriter(path)
+    raise ValueError(f"Unknown export format: {format_name}")
+
+
+def default_format():
+    """Parquet when pyarrow is installed, CSV otherwise"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return 'csv'
+    return 'parquet'
@@ -1,6 +1,23 @@
 from .base_formatter import BaseFormatter
-from .json_formatter import JSONFormatter
-from .text_formatter import TextFormatter
-from .multi_line import MultilineFormatter
 
-__all__ = ['BaseFormatter', 'JSONFormatter', 'TextFormatter', 'MultilineFormatter']
\ No newline at end of file
+# Formatters are imported on first access so that importing one of them
+# (or the base class) does not pay for all the others
+_LAZY = {
+    'JSONFormatter': '.json_formatter',
+    'TextFormatter': '.text_formatter',
+    'MultilineFormatter': '.multi_line',
+    'CRIFormatter': '.container_runtime',
+    'DockerJSONFormatter': '.container_runtime',
+    'PatternFormatter': '.pattern_formatter'
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['BaseFormatter', 'JSONFormatter', 'TextFormatter', 'MultilineFormatter',
+           'CRIFormatter', 'DockerJSONFormatter', 'PatternFormatter']
@@ -77,6 +77,18 @@ class BaseFormatter(ABC, logging.Formatter):
         """
         return True  # Most log formats will include timestamp
 
+    def shows_field(self, key):
+        """
+        Check if formatted records show a top-level field of the record.
+
+        Args:
+            key: Field name, e.g. 'seq_stamp'
+
+        Returns:
+            bool: True if the field appears in the output, False otherwise
+        """
+        return True  # Most log formats render every field
+
     def validate_record(self, record):
         """
         Validate a record before formatting.
@@ -0,0 +1,165 @@
+# src/formatters/container_runtime.py
+from abc import abstractmethod
+import json
+import logging
+import time
+from .base_formatter import BaseFormatter
+from .json_formatter import JSONFormatter
+
+# Container runtimes split lines longer than this into partial records
+DEFAULT_MAX_LINE_SIZE = 16 * 1024
+
+
+class ContainerRuntimeFormatter(BaseFormatter):
+    """
+    Base class for formatters that wrap log output the way a container
+    runtime writes it to disk. The record is first rendered by an inner
+    formatter (JSON by default), then every output line is framed as a
+    runtime record. Lines longer than max_line_size bytes are split into
+    partial records, just like the kubelet/docker log drivers do.
+
+    Records arriving as logging.LogRecord instances (from the logging
+    handlers) carry a message that has already been framed by the
+    generator, so it is passed through unchanged.
+    """
+
+    def __init__(self, inner=None, stream='stdout', max_line_size=DEFAULT_MAX_LINE_SIZE):
+        """
+        Initialize the formatter.
+
+        Args:
+            inner: Formatter that renders the record payload (default: JSONFormatter)
+            stream: Stream name written into each record ('stdout' or 'stderr')
+            max_line_size: Maximum payload bytes per record before splitting
+        """
+        super().__init__()
+        if stream not in ('stdout', 'stderr'):
+            raise ValueError(f"Unsupported stream: {stream}")
+        if max_line_size < 4:
+            raise ValueError("max_line_size must be at least 4 bytes")
+        self.inner = inner or JSONFormatter()
+        self.stream = stream
+        self.max_line_size = max_line_size
+        # A str of this many characters can never exceed max_line_size bytes
+        self._safe_chars = max_line_size // 4
+        self._ts_second = None
+        self._ts_prefix = ''
+
+    def shows_field(self, key):
+        return self.inner.shows_field(key)
+
+    def format(self, record):
+        """
+        Format the record as container runtime log lines.
+
+        Args:
+            record: LogRecord instance or dict
+
+        Returns:
+            str: One or more runtime records separated by newlines
+        """
+        self.validate_record(record)
+
+        if isinstance(record, logging.LogRecord):
+            return record.getMessage()
+
+        timestamp = self._timestamp()
+        frames = []
+        for line in self.inner.format(record).split('\n'):
+            chunks = self._split_line(line)
+            for chunk in chunks[:-1]:
+                frames.append(self._frame(chunk, timestamp, partial=True))
+            frames.append(self._frame(chunks[-1], timestamp, partial=False))
+        return '\n'.join(frames)
+
+    @abstractmethod
+    def _frame(self, chunk, timestamp, partial):
+        """Wrap a single chunk as a runtime record"""
+        pass
+
+    def _timestamp(self):
+        """
+        Current time in RFC 3339 format with nanosecond precision.
+        The date/time prefix is cached per second.
+        """
+        now_ns = time.time_ns()
+        second, nanos = divmod(now_ns, 1_000_000_000)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        return f'{self._ts_prefix}.{nanos:09d}Z'
+
+    def _split_line(self, line):
+        """
+        Split a line into chunks of at most max_line_size UTF-8 bytes
+        without cutting through a multi-byte character.
+
+        Returns:
+            list: Chunks in order; the last one is the final (non-partial) chunk
+        """
+        # Fast path: the line is guaranteed to fit
+        if len(line) <= self._safe_chars:
+            return [line]
+
+        encoded = line.encode('utf-8')
+        if len(encoded) <= self.max_line_size:
+            return [line]
+
+        chunks = []
+        start = 0
+        total = len(encoded)
+        while total - start > self.max_line_size:
+            end = start + self.max_line_size
+            # Back off onto a character boundary (skip continuation bytes)
+            while encoded[end] & 0xC0 == 0x80:
+                end -= 1
+            chunks.append(encoded[start:end].decode('utf-8'))
+            start = end
+        chunks.append(encoded[start:].decode('utf-8'))
+        return chunks
+
+
+class CRIFormatter(ContainerRuntimeFormatter):
+    """
+    Formatter that outputs CRI (containerd/CRI-O) log lines:
+
+        2024-01-01T00:00:00.123456789Z stdout F {"message": "..."}
+
+    Long lines are split into 'P' (partial) records followed by a final 'F' record.
+
+    Usage:
+        formatter = CRIFormatter(inner=TextFormatter())
+    """
+
+    def __init__(self, inner=None, stream='stdout', max_line_size=DEFAULT_MAX_LINE_SIZE):
+        super().__init__(inner, stream, max_line_size)
+        self._full_tag = f' {stream} F '
+        self._partial_tag = f' {stream} P '
+
+    def _frame(self, chunk, timestamp, partial):
+        return timestamp + (self._partial_tag if partial else self._full_tag) + chunk
+
+
+class DockerJSONFormatter(ContainerRuntimeFormatter):
+    """
+    Formatter that outputs docker json-file log lines:
+
+        {"log":"{\\"message\\": \\"...\\"}\\n","stream":"stdout","time":"2024-01-01T00:00:00.123456789Z"}
+
+    Complete lines end their 'log' value with a newline; partial chunks of
+    a long line do not, which is how docker marks them.
+
+    Usage:
+        formatter = DockerJSONFormatter()
+    """
+
+    def __init__(self, inner=None, stream='stdout', max_line_size=DEFAULT_MAX_LINE_SIZE):
+        super().__init__(inner, stream, max_line_size)
+        # Pre-encoded pieces of the envelope around the escaped chunk
+        self._prefix = '{"log":'
+        self._suffix = f',"stream":{json.dumps(stream)},"time":"'
+        self._encode = json.encoder.encode_basestring
+
+    def _frame(self, chunk, timestamp, partial):
+        log_value = self._encode(chunk if partial else chunk + '\n')
+        return self._prefix + log_value + self._suffix + timestamp + '"}'
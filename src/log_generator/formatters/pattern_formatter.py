@@ -0,0 +1,294 @@
+# src/formatters/pattern_formatter.py
+from datetime import datetime
+import json
+import logging
+from string import Formatter
+from .base_formatter import BaseFormatter
+
+# Built-in layouts. 'logfmt' is generated from the record itself; the others
+# are patterns using {dotted.path} placeholders with optional |filters.
+LAYOUTS = {
+    'combined': ('{request.remote_addr} - - [{timestamp|clf}] '
+                 '"{request.method} {request.path} HTTP/1.1" '
+                 '{response.status_code} {response.size_bytes} "-" "{request.user_agent}"'),
+    'nginx': ('{request.remote_addr} - - [{timestamp|clf}] '
+              '"{request.method} {request.path} HTTP/1.1" '
+              '{response.status_code} {response.size_bytes} "-" "{request.user_agent}" '
+              '{response.response_time_ms}'),
+}
+
+MISSING = '-'
+
+# Compiled renderers kept per formatter; records with further shapes are
+# rendered by the generic (uncompiled) path
+MAX_RENDERERS = 32
+
+
+def _quote(value):
+    """Render a value for logfmt, quoting it only when needed"""
+    text = value if value.__class__ is str else str(value)
+    if not text or ' ' in text or '"' in text or '=' in text or '\n' in text:
+        return json.dumps(text, ensure_ascii=False)
+    return text
+
+
+_clf_cache = {}
+
+
+def _clf_time(value):
+    """Convert an ISO 8601 timestamp to Common Log Format time (cached per second)"""
+    second = str(value)[:19]
+    converted = _clf_cache.get(second)
+    if converted is None:
+        try:
+            converted = datetime.fromisoformat(second).strftime('%d/%b/%Y:%H:%M:%S +0000')
+        except ValueError:
+            return str(value)
+        if len(_clf_cache) > 1024:
+            _clf_cache.clear()
+        _clf_cache[second] = converted
+    return converted
+
+
+def _json_value(value):
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _str_value(value):
+    return MISSING if value is None else str(value)
+
+
+def _flatten_logfmt(prefix, value):
+    """Fallback for nesting deeper than the compiled shape"""
+    if value.__class__ is not dict:
+        return f'{prefix}={_quote(value)}'
+    if not value:
+        return f'{prefix}={{}}'
+    return ' '.join(_flatten_logfmt(f'{prefix}.{k}', v) for k, v in value.items())
+
+
+_ABSENT = object()
+
+
+def _lookup(record, keys):
+    """Look up a nested path, telling missing fields apart from None values"""
+    value = record
+    for key in keys:
+        if value.__class__ is not dict or key not in value:
+            return _ABSENT
+        value = value[key]
+    return value
+
+
+def _dig(record, keys, render):
+    """Render a nested path that is deeper than the compiled shape ('-' when missing)"""
+    value = _lookup(record, keys)
+    return MISSING if value is _ABSENT else render(value)
+
+
+FILTERS = {
+    'clf': _clf_time,
+    'json': _json_value,
+    'q': _quote,
+    'str': _str_value,
+}
+
+
+class PatternFormatter(BaseFormatter):
+    """
+    Formatter that renders records with a configurable text layout.
+
+    The layout is compiled into a specialized Python function for every
+    record shape (the set of keys two levels deep) the first time that shape
+    is seen. Rendering a record is then one cache lookup and one call to a
+    function with no per-field branching. Each generator produces only a
+    handful of shapes, so the cache stays small.
+
+    Layouts:
+        logfmt      key=value pairs for every field, nested keys dotted
+        combined    Apache combined access log
+        nginx       nginx combined access log plus request time
+        <pattern>   Custom pattern, e.g. '{timestamp} {level} {error.type|q}'
+
+    Placeholders use dotted paths into the record and may end with a filter:
+    |clf (Common Log Format time), |json, |q (logfmt quoting) or |str, and a
+    format spec ('{level:<8}'). Missing fields render as '-'.
+
+    Usage:
+        formatter = PatternFormatter('logfmt')
+        formatter = PatternFormatter('{timestamp} [{level}] {service}: {error.message}')
+    """
+
+    def __init__(self, layout='logfmt'):
+        """
+        Initialize the formatter.
+
+        Args:
+            layout: Name of a built-in layout or a custom pattern
+        """
+        super().__init__()
+        self.layout = layout
+        self.pattern = None
+        if layout != 'logfmt':
+            self.pattern = self._parse_pattern(LAYOUTS.get(layout, layout))
+        self._renderers = {}
+
+    def format(self, record):
+        """
+        Format the record with the configured layout.
+
+        Args:
+            record: LogRecord instance or dict
+
+        Returns:
+            str: Formatted log entry
+        """
+        self.validate_record(record)
+
+        # Records from the logging handlers carry a line the generator
+        # already rendered, so it is passed through unchanged
+        if isinstance(record, logging.LogRecord):
+            return record.getMessage()
+
+        shape = tuple([
+            (key, tuple(value)) if value.__class__ is dict else key
+            for key, value in record.items()
+        ])
+        renderer = self._renderers.get(shape)
+        if renderer is None:
+            if len(self._renderers) >= MAX_RENDERERS:
+                # Shapes keep changing (e.g. records grown to a size target):
+                # stop compiling and render generically
+                return self._render_generic(record)
+            renderer = self._renderers[shape] = self._compile(shape, record)
+        return renderer(record)
+
+    def shows_field(self, key):
+        """Logfmt shows every field; a pattern only the fields it has placeholders for"""
+        if self.pattern is None:
+            return True
+        return any(item[0] == 'field' and item[1] == (key,) for item in self.pattern)
+
+    def _render_generic(self, record):
+        """Render a record without a compiled function (same output, slower)"""
+        if self.pattern is None:
+            return ' '.join([_flatten_logfmt(key, value) for key, value in record.items()])
+        parts = []
+        for item in self.pattern:
+            if item[0] == 'literal':
+                parts.append(item[1])
+                continue
+            _, keys, filter_name, spec = item
+            value = _lookup(record, keys)
+            text = MISSING if value is _ABSENT else FILTERS[filter_name](value)
+            parts.append(format(text, spec) if spec else text)
+        return ''.join(parts)
+
+    def _parse_pattern(self, pattern):
+        """
+        Split a pattern into literal text and placeholders.
+
+        Returns:
+            list: Items that are either ('literal', text) or ('field', keys, filter, spec)
+        """
+        items = []
+        for literal, field, spec, conversion in Formatter().parse(pattern):
+            if literal:
+                items.append(('literal', literal))
+            if field is None:
+                continue
+            if not field:
+                raise ValueError(f"Empty placeholder in pattern: {pattern}")
+            path, _, filter_name = field.partition('|')
+            if filter_name and filter_name not in FILTERS:
+                raise ValueError(f"Unknown filter '{filter_name}' in pattern: {pattern}")
+            items.append(('field', tuple(path.split('.')), filter_name or 'str', spec))
+        return items
+
+    def _compile(self, shape, sample):
+        """
+        Generate the render function for one record shape.
+
+        Args:
+            shape: Tuple of top-level keys, with (key, nested_keys) for dict values
+            sample: First record seen with this shape, used to tell nested
+                    scalars from deeper dicts
+
+        Returns:
+            callable: Function taking the record and returning the rendered line
+        """
+        namespace = {'_dig': _dig, '_flatten': _flatten_logfmt, **FILTERS}
+        constants = []
+
+        def constant(value):
+            constants.append(value)
+            name = f'_c{len(constants) - 1}'
+            namespace[name] = value
+            return name
+
+        if self.pattern is None:
+            parts = self._logfmt_parts(shape, sample, constant)
+        else:
+            parts = self._pattern_parts(shape, constant)
+
+        if not parts:
+            parts = ["''"]
+        source = 'def render(r):\n    return "".join((' + ', '.join(parts) + ',))\n'
+        exec(compile(source, f'<pattern {self.layout!r}>', 'exec'), namespace)
+        return namespace['render']
+
+    def _logfmt_parts(self, shape, sample, constant):
+        """Build expressions rendering every field of the shape as key=value"""
+        parts = []
+        sep = ''
+        for entry in shape:
+            if not isinstance(entry, tuple):
+                parts.append(constant(f'{sep}{entry}='))
+                parts.append(f'q(r[{entry!r}])')
+                sep = ' '
+                continue
+
+            key, nested = entry
+            if not nested:
+                parts.append(constant(f'{sep}{key}={{}}'))
+                sep = ' '
+            for sub in nested:
+                expression = f'r[{key!r}][{sub!r}]'
+                if sample[key][sub].__class__ is dict:
+                    parts.append(constant(sep))
+                    parts.append(f'_flatten({f"{key}.{sub}"!r}, {expression})')
+                else:
+                    parts.append(constant(f'{sep}{key}.{sub}='))
+                    parts.append(f'q({expression})')
+                sep = ' '
+        return parts
+
+    def _pattern_parts(self, shape, constant):
+        """Build expressions for the configured pattern against the shape"""
+        known = {}
+        for entry in shape:
+            if isinstance(entry, tuple):
+                known[entry[0]] = set(entry[1])
+            else:
+                known[entry] = None
+
+        parts = []
+        for item in self.pattern:
+            if item[0] == 'literal':
+                parts.append(constant(item[1]))
+                continue
+            _, keys, filter_name, spec = item
+            if keys[0] not in known:
+                expression = constant(MISSING)
+            elif len(keys) == 1:
+                expression = f'{filter_name}(r[{keys[0]!r}])'
+            elif known[keys[0]] is None or keys[1] not in known[keys[0]]:
+                expression = constant(MISSING)
+            elif len(keys) == 2:
+                expression = f'{filter_name}(r[{keys[0]!r}][{keys[1]!r}])'
+            else:
+                expression = f'_dig(r, {keys!r}, {filter_name})'
+            if spec:
+                expression = f'format({expression}, {spec!r})'
+            parts.append(expression)
+        return parts
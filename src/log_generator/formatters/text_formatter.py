@@ -73,8 +73,9 @@ class TextFormatter(BaseFormatter):
         # Handle HTTP request logs
         if 'request' in record:
             req = record['request']
+            query_string = f"?{req['query_string']}" if req.get('query_string') else ''
             output_parts.append(
-                f"Request: {req.get('method', 'UNKNOWN')} {req.get('path', '')}"
+                f"Request: {req.get('method', 'UNKNOWN')} {req.get('path', '')}{query_string}"
             )
             if 'response' in record:
                 resp = record['response']
@@ -133,11 +134,21 @@ class TextFormatter(BaseFormatter):
                 output_parts.append(f"Status: {record['status']}")
             if 'error' in record:
                 output_parts.append(f"Error: {record['error'].get('message', 'Unknown error')}")
+            if record.get('variables'):
+                output_parts.append(f"Variables: {json.dumps(record['variables'])}")
 
             # Add query as a separate line
             if 'query' in record:
                 output_parts.append(f"\nQuery:\n{record['query']}")
 
+        # Free-text padding added to reach a record size
+        if 'padding' in record:
+            output_parts.append(f"Padding: {record['padding']}")
+
+        # Add sequence stamp if present
+        if 'seq_stamp' in record:
+            output_parts.append(record['seq_stamp'])
+
         # Join all parts with appropriate spacing
         base_output = " | ".join(part for part in output_parts if not '\n' in part)
 
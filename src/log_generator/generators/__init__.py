@@ -1,7 +1,19 @@
 from .base_generator import BaseGenerator
-from .error import ErrorGenerator
-from .graphql import GraphQLGenerator
-from .metrics import MetricsGenerator
 
+# Generators are imported on first access so that importing one of them
+# (or the base class) does not pay for all the others
+_LAZY = {
+    'ErrorGenerator': '.error',
+    'GraphQLGenerator': '.graphql',
+    'MetricsGenerator': '.metrics'
+}
 
-__all__ = ['BaseGenerator', 'GraphQLGenerator', 'MetricsGenerator', 'ErrorGenerator']
\ No newline at end of file
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['BaseGenerator', 'GraphQLGenerator', 'MetricsGenerator', 'ErrorGenerator']
@@ -1,14 +1,14 @@
 # src/generators/application.py
 from datetime import datetime
 import random
-import uuid
 from .base_generator import BaseGenerator
+from .ids import random_uuid
 
 class ApplicationGenerator(BaseGenerator):
     def get_log_type(self) -> str:
         return "application"
 
-    def generate_log(self):
+    def build_log(self):
         # Common application endpoints
         endpoints = [
             '/api/users',
@@ -27,6 +27,10 @@ class ApplicationGenerator(BaseGenerator):
         status_codes = [200] * 85 + [201] * 5 + [400] * 3 + [401] * 2 + \
                       [403] * 2 + [404] * 2 + [500]
 
+        # During an incident a large share of requests fail server-side
+        if self.incident_active:
+            status_codes = [200] * 45 + [500] * 30 + [502] * 10 + [503] * 15
+
         user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
@@ -38,7 +42,7 @@ class ApplicationGenerator(BaseGenerator):
             'timestamp': datetime.utcnow().isoformat(),
             'service': 'web-api',
             'level': 'INFO',
-            'trace_id': str(uuid.uuid4()),
+            'trace_id': random_uuid(),
             'request': {
                 'method': random.choice(methods),
                 'path': random.choice(endpoints),
@@ -58,7 +62,9 @@ class ApplicationGenerator(BaseGenerator):
                 401: 'Unauthorized - Missing or invalid authentication',
                 403: 'Forbidden - Insufficient permissions',
                 404: 'Not Found - Resource does not exist',
-                500: 'Internal Server Error - An unexpected error occurred'
+                500: 'Internal Server Error - An unexpected error occurred',
+                502: 'Bad Gateway - Invalid response from upstream',
+                503: 'Service Unavailable - Upstream is overloaded'
             }
             log_entry['level'] = 'ERROR'
             log_entry['error'] = {
@@ -69,6 +75,15 @@ class ApplicationGenerator(BaseGenerator):
                 )
             }
 
+        # Unique values for the share of records selected by entropy
+        if self.unique():
+            log_entry['request']['path'] += '/' + self.vocabulary.hex_id()
+        if self.unique():
+            vocabulary = self.vocabulary
+            log_entry['request']['user_agent'] += f' {vocabulary.word()}/{vocabulary.hex_id()}'
+        if 'error' in log_entry and self.unique():
+            log_entry['error']['message'] += f' ({self.vocabulary.sentence(5)})'
+
         # Add response size for GET requests
         if log_entry['request']['method'] == 'GET':
             log_entry['response']['size_bytes'] = random.randint(100, 10000)
@@ -77,4 +92,8 @@ class ApplicationGenerator(BaseGenerator):
         if log_entry['request']['method'] in ['POST', 'PUT']:
             log_entry['request']['body_size_bytes'] = random.randint(50, 1000)
 
-        self.logger.info(self.formatter.format(log_entry))
+        return log_entry
+
+    def grow_log(self, log_entry, size):
+        """Grow the record with a long request query string"""
+        log_entry['request']['query_string'] = self.padding_text(size, 'query')
@@ -2,13 +2,46 @@
 from abc import ABC, abstractmethod
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import random
 import sys
-from pathlib import Path
+from sinks.logger_sink import LoggerSink
+from .sizing import get_padding_buffer
+from .stamping import STAMP_FIELD
+from .entropy import get_vocabulary
+
+
+def determine_log_dir(log_dir=None):
+    """
+    Determine the appropriate log directory based on environment.
+
+    Priority:
+    1. Explicitly provided log_dir
+    2. Environment variable LOG_DIR
+    3. Default locations based on environment
+    """
+    if log_dir:
+        return log_dir
+
+    # Check for environment variable
+    env_log_dir = os.getenv('LOG_DIR')
+    if env_log_dir:
+        return env_log_dir
+
+    # Check if we're in a container
+    if os.path.exists('/.dockerenv'):
+        container_dir = '/var/log/newrelic'
+        # Verify we have write permissions
+        if os.access(os.path.dirname(container_dir), os.W_OK):
+            return container_dir
+
+    # Default to local development directory
+    local_dir = os.path.join(os.getcwd(), 'logs')
+    return local_dir
 
 
 class BaseGenerator(ABC):
-    def __init__(self, formatter, log_dir=None):
+    def __init__(self, formatter, log_dir=None, sink=None, size_distribution=None, stamper=None,
+                 entropy=0.0):
         """
         Initialize the generator with a formatter and log directory.
 
@@ -17,50 +50,58 @@ class BaseGenerator(ABC):
             log_dir: Directory for log files. If None, will use:
                     - In container: /var/log/newrelic
                     - Local dev: ./logs in current directory
+            sink: Optional sink to write formatted entries to. If None, entries
+                  go to a rotating {log_type}.log file and the console.
+            size_distribution: Optional SizeDistribution; records smaller than the
+                  sampled size are grown with realistic content to match it
+            stamper: Optional SequenceStamper; every record then carries a
+                  sequence stamp for loss and latency measurement
+            entropy: Share (0-1) of IDs, free text, paths and variables that get
+                  unique values instead of the fixed sample values
         """
         self.formatter = formatter
+        self.size_distribution = size_distribution
+        self.stamper = stamper
+        if not 0 <= entropy <= 1:
+            raise ValueError("entropy must be between 0 and 1")
+        self.entropy = entropy
+        # Set by the scheduler while a traffic profile simulates an incident
+        self.incident_active = False
+        # Running totals for size targeting: characters grow_log() was asked
+        # for and actually added to the formatted line, and characters
+        # rendered and bytes the sink wrote for them
+        self._grow_requested = self._grow_gained = 0
+        self._rendered = self._written = 0
         self.log_dir = self._determine_log_dir(log_dir)
-        self.logger = self._setup_logger()
+        if sink is None:
+            self.logger = self._setup_logger()
+            sink = LoggerSink(self.logger, self.get_log_path())
+        self.sink = sink
 
-    def _determine_log_dir(self, log_dir):
-        """
-        Determine the appropriate log directory based on environment.
+    @property
+    def vocabulary(self):
+        """Shared vocabulary for unique values, loaded on first use"""
+        return get_vocabulary()
 
-        Priority:
-        1. Explicitly provided log_dir
-        2. Environment variable LOG_DIR
-        3. Default locations based on environment
-        """
-        if log_dir:
-            return log_dir
-
-        # Check for environment variable
-        env_log_dir = os.getenv('LOG_DIR')
-        if env_log_dir:
-            return env_log_dir
-
-        # Check if we're in a container
-        if os.path.exists('/.dockerenv'):
-            container_dir = '/var/log/newrelic'
-            # Verify we have write permissions
-            if os.access(os.path.dirname(container_dir), os.W_OK):
-                return container_dir
-
-        # Default to local development directory
-        local_dir = os.path.join(os.getcwd(), 'logs')
-        return local_dir
+    def _determine_log_dir(self, log_dir):
+        """Determine the appropriate log directory based on environment"""
+        return determine_log_dir(log_dir)
 
     def _setup_logger(self):
         """
         Set up the logger with appropriate handlers and permissions.
         """
+        # Imported here: logging.handlers also loads sockets, pickle and
+        # queues, which runs with a custom sink never need
+        from logging.handlers import RotatingFileHandler
+
         logger = logging.getLogger(f'LogGenerator.{self.__class__.__name__}')
         logger.setLevel(logging.INFO)
         logger.handlers = []  # Clear existing handlers
 
         try:
             # Ensure log directory exists with appropriate permissions
-            Path(self.log_dir).mkdir(parents=True, exist_ok=True)
+            os.makedirs(self.log_dir, exist_ok=True)
 
             # File handler with rotation
             log_file = os.path.join(self.log_dir, f'{self.get_log_type()}.log')
@@ -87,11 +128,120 @@ class BaseGenerator(ABC):
 
         return logger
 
-    @abstractmethod
+    def render_log(self, log_entry):
+        """
+        Format a log entry. When a stamper is configured the entry is
+        stamped right before formatting, and when a size distribution is
+        configured it is grown to the sampled size. The sampled size is the
+        size written by the sink; how much of a growth request shows up in
+        the format and how much framing the sink adds are learned from the
+        records written so far.
+
+        Args:
+            log_entry: dict with the log data
+
+        Returns:
+            str: The formatted entry
+        """
+        if self.stamper is not None:
+            log_entry[STAMP_FIELD] = self.stamper.stamp()
+        line = self.formatter.format(log_entry)
+        if self.size_distribution is not None:
+            target = self.size_distribution.sample()
+            if self._written:
+                target = target * self._rendered // self._written
+            deficit = target - len(line)
+            if deficit > 0:
+                request = deficit
+                if self._grow_gained > 0:
+                    scale = self._grow_requested / self._grow_gained
+                    request = max(1, int(deficit * min(max(scale, 0.1), 10.0)))
+                self.grow_log(log_entry, request)
+                grown = self.formatter.format(log_entry)
+                self._grow_requested += request
+                self._grow_gained += len(grown) - len(line)
+                line = grown
+        return line
+
+    def emit(self, log_entry):
+        """
+        Format a log entry and write it to the sink.
+
+        Args:
+            log_entry: dict with the log data
+
+        Returns:
+            int: Bytes the sink wrote for the entry
+        """
+        line = self.render_log(log_entry)
+        written = self.sink.write(line)
+        if self.size_distribution is not None:
+            self._rendered += len(line)
+            self._written += written
+        return written
+
+    def unique(self):
+        """
+        Decide whether the next value should be unique, according to entropy.
+
+        Returns:
+            bool: True for a unique value, False for a fixed sample value
+        """
+        return self.entropy > 0 and random.random() < self.entropy
+
     def generate_log(self):
-        """Generate a single log entry"""
+        """
+        Generate a single log entry and write it out.
+
+        Returns:
+            int: Bytes the sink wrote for the entry
+        """
+        return self.emit(self.build_log())
+
+    @abstractmethod
+    def build_log(self):
+        """Build a single log entry as a dict"""
         pass
 
+    def sample_log(self):
+        """
+        Build a log entry for measuring the output (size checks, entropy
+        calibration) without advancing state that later records depend on.
+
+        Returns:
+            dict: The log entry
+        """
+        return self.build_log()
+
+    def grow_log(self, log_entry, size):
+        """
+        Grow a log entry by roughly `size` characters of realistic content.
+        Generators override this to grow the fields that are naturally large
+        for their log type; the default adds a free-text 'padding' field.
+        Padding comes from preallocated buffers, or from the vocabulary for
+        the share of records selected by entropy.
+
+        Args:
+            log_entry: dict with the log data, modified in place
+            size: Number of characters to add
+        """
+        log_entry['padding'] = self.padding_text(size)
+
+    def padding_text(self, size, kind='text'):
+        """
+        Get about `size` characters of padding content.
+
+        Args:
+            size: Number of characters wanted
+            kind: Padding buffer kind ('text', 'frames' or 'query')
+
+        Returns:
+            str: Padding content; unique vocabulary text for the entropy share
+        """
+        if kind != 'frames' and self.unique():
+            kind = 'unique_' + kind
+        return get_padding_buffer(kind).take(size)
+
     @abstractmethod
     def get_log_type(self) -> str:
         """Return the type of log this generator produces"""
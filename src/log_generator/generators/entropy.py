@@ -0,0 +1,159 @@
+# src/generators/entropy.py
+import random
+import zlib
+from .stamping import SequenceStamper
+from .table_cache import cached_table
+
+_CONSONANTS = 'bcdfghjklmnprstvwz'
+_VOWELS = 'aeiou'
+
+# Longest prebuilt phrase in words; longer sentences join several phrases
+MAX_PHRASE = 3
+
+
+class Vocabulary:
+    """
+    Precomputed pool of random words and hex ids used for unique content.
+    Drawing a token is a list index by random bits, so raising entropy does
+    not slow generation down. Combining two tokens gives 2**(2*bits)
+    distinct values, which is effectively unique for a test run. Sentences
+    and paths are joined from prebuilt phrases or path prefixes, so they
+    take one draw per MAX_PHRASE words rather than one per word.
+    """
+
+    def __init__(self, bits=14, seed=1):
+        """
+        Build the vocabulary.
+
+        Args:
+            bits: log2 of the number of words and hex ids
+            seed: Seed for the vocabulary contents so runs are reproducible
+        """
+        rng = random.Random(seed)
+        syllables = [c + v for c in _CONSONANTS for v in _VOWELS]
+        size = 1 << bits
+        self.bits = bits
+        self.words = [
+            ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+            for _ in range(size)
+        ]
+        self.hex_ids = [f'{rng.getrandbits(32):08x}' for _ in range(size)]
+        # phrases[n]: pool of n-word phrases (phrases[1] is the word list)
+        words = self.words
+        self.phrases = [[], words] + [
+            [' '.join([words[rng.getrandbits(bits)] for _ in range(n)]) for _ in range(size)]
+            for n in range(2, MAX_PHRASE + 1)
+        ]
+        # '/word/word' prefixes for path()
+        self.path_prefixes = [phrase.replace(' ', '/') for phrase in self.phrases[2]]
+
+    def word(self):
+        """Random word from the vocabulary"""
+        return self.words[random.getrandbits(self.bits)]
+
+    def hex_id(self):
+        """Effectively unique 16 character hex id"""
+        hex_ids = self.hex_ids
+        bits = self.bits
+        return hex_ids[random.getrandbits(bits)] + hex_ids[random.getrandbits(bits)]
+
+    def path(self, depth=2):
+        """Random URL path like /word/word/hexid"""
+        if depth == 2:
+            return '/' + self.path_prefixes[random.getrandbits(self.bits)] + '/' + self.hex_id()
+        return '/' + self.sentence(depth).replace(' ', '/') + '/' + self.hex_id()
+
+    def sentence(self, length=8):
+        """Free text of `length` random words"""
+        phrases = self.phrases
+        bits = self.bits
+        if length < 2:
+            return self.word() if length == 1 else ''
+        parts = []
+        while length > 2 * MAX_PHRASE:
+            parts.append(phrases[MAX_PHRASE][random.getrandbits(bits)])
+            length -= MAX_PHRASE
+        half = length >> 1
+        parts.append(phrases[half][random.getrandbits(bits)])
+        parts.append(phrases[length - half][random.getrandbits(bits)])
+        return ' '.join(parts)
+
+
+_vocabulary = None
+
+
+def get_vocabulary():
+    """
+    Get the shared vocabulary, building it on first use.
+
+    Returns:
+        Vocabulary: The shared vocabulary
+    """
+    global _vocabulary
+    if _vocabulary is None:
+        _vocabulary = cached_table('vocabulary', (14, 1), Vocabulary, module=__name__)
+    return _vocabulary
+
+
+def measure_compression_ratio(generator, samples=1000, level=6):
+    """
+    Measure how well a generator's formatted output compresses with gzip's
+    default deflate level.
+
+    Args:
+        generator: BaseGenerator instance (nothing is written to its sink)
+        samples: Number of records to render
+        level: zlib compression level
+
+    Returns:
+        float: Uncompressed size divided by compressed size
+    """
+    # Stamp samples with a scratch stamper so the real sequence is not consumed
+    stamper = generator.stamper
+    if stamper is not None:
+        generator.stamper = SequenceStamper(stamper.run_id, stamper.stream_id)
+    try:
+        data = '\n'.join(generator.render_log(generator.sample_log()) for _ in range(samples))
+    finally:
+        generator.stamper = stamper
+    raw = data.encode('utf-8')
+    return len(raw) / len(zlib.compress(raw, level))
+
+
+def calibrate_entropy(generator, target_ratio, samples=1000, iterations=8):
+    """
+    Find the entropy setting at which a generator's output compresses at
+    (about) the target ratio, and apply it to the generator. Targets outside
+    the reachable range are clamped to entropy 0 or 1.
+
+    Args:
+        generator: BaseGenerator instance
+        target_ratio: Desired uncompressed/compressed size ratio
+        samples: Records rendered per measurement
+        iterations: Bisection steps
+
+    Returns:
+        tuple: (entropy, measured ratio)
+    """
+    def measure(entropy):
+        generator.entropy = entropy
+        return entropy, measure_compression_ratio(generator, samples)
+
+    low, high = measure(0.0), measure(1.0)
+    if target_ratio >= low[1]:
+        best = low
+    elif target_ratio <= high[1]:
+        best = high
+    else:
+        # Higher entropy always gives a lower ratio, so bisect on it
+        best = min(low, high, key=lambda result: abs(result[1] - target_ratio))
+        for _ in range(iterations):
+            middle = measure((low[0] + high[0]) / 2)
+            if abs(middle[1] - target_ratio) < abs(best[1] - target_ratio):
+                best = middle
+            if middle[1] > target_ratio:
+                low = middle
+            else:
+                high = middle
+    generator.entropy = best[0]
+    return best
@@ -1,95 +1,130 @@
 # src/generators/error.py
 from datetime import datetime
 import random
-import uuid
-import traceback
 from .base_generator import BaseGenerator
+from .ids import random_uuid
+from .stack_traces import StackTracePool, LANGUAGES
+from .table_cache import cached_table
+
+# Common error scenarios. Details that vary per record are filled in by
+# _dynamic_details; the rest is shared between records.
+ERROR_TYPES = (
+    {
+        'name': 'DatabaseConnectionError',
+        'message': 'Failed to connect to database',
+        'module': 'database.connection',
+        'severity': 'CRITICAL',
+        'details': {
+            'host': 'db-master-01',
+            'port': 5432,
+            'timeout': 30
+        }
+    },
+    {
+        'name': 'ValidationError',
+        'message': 'Invalid input parameters',
+        'module': 'api.validators',
+        'severity': 'WARNING',
+        'details': None
+    },
+    {
+        'name': 'AuthenticationError',
+        'message': 'Failed to authenticate user',
+        'module': 'auth.service',
+        'severity': 'ERROR',
+        'details': {
+            'mechanism': 'JWT',
+            'reason': 'Token expired'
+        }
+    },
+    {
+        'name': 'RateLimitExceeded',
+        'message': 'API rate limit exceeded',
+        'module': 'api.middleware',
+        'severity': 'WARNING',
+        'details': {
+            'limit': 100,
+            'period': '1m'
+        }
+    },
+    {
+        'name': 'InternalServerError',
+        'message': 'Unexpected server error',
+        'module': 'api.handlers',
+        'severity': 'CRITICAL',
+        'details': None
+    }
+)
+
+
+def _dynamic_details(name):
+    if name == 'ValidationError':
+        return {
+            'field': random.choice(['email', 'phone', 'address', 'user_id']),
+            'reason': 'Invalid format'
+        }
+    return {
+        'server': f'app-{random.randint(1,5)}',
+        'process_id': random.randint(1000, 9999)
+    }
+
 
 class ErrorGenerator(BaseGenerator):
+    def __init__(self, *args, trace_languages=LANGUAGES, trace_depth=(5, 25),
+                 caused_by_probability=0.3, trace_pool_size=2000, **kwargs):
+        """
+        Initialize the generator and pre-render its stack trace pool.
+
+        Args:
+            trace_languages: Languages stack traces are rendered in
+            trace_depth: (min, max) frames per exception in a trace
+            caused_by_probability: Chance of each chained cause in a trace
+            trace_pool_size: Total number of pre-rendered traces
+            *args, **kwargs: Passed to BaseGenerator
+        """
+        super().__init__(*args, **kwargs)
+        exceptions = [(error['name'], error['message'], error['module']) for error in ERROR_TYPES]
+        options = {
+            'languages': tuple(trace_languages),
+            'traces_per_exception': max(1, trace_pool_size // len(ERROR_TYPES)),
+            'min_depth': trace_depth[0],
+            'max_depth': trace_depth[1],
+            'caused_by_probability': caused_by_probability
+        }
+        self.trace_pool = cached_table(
+            'stack_traces', (exceptions, sorted(options.items())),
+            lambda: StackTracePool(exceptions, **options), module=StackTracePool.__module__)
+
     def get_log_type(self) -> str:
         return "error"
 
-    def generate_log(self):
-        # Define common error scenarios
-        error_types = [
-            {
-                'name': 'DatabaseConnectionError',
-                'message': 'Failed to connect to database',
-                'module': 'database.connection',
-                'severity': 'CRITICAL',
-                'details': {
-                    'host': 'db-master-01',
-                    'port': 5432,
-                    'timeout': 30
-                }
-            },
-            {
-                'name': 'ValidationError',
-                'message': 'Invalid input parameters',
-                'module': 'api.validators',
-                'severity': 'WARNING',
-                'details': {
-                    'field': random.choice(['email', 'phone', 'address', 'user_id']),
-                    'reason': 'Invalid format'
-                }
-            },
-            {
-                'name': 'AuthenticationError',
-                'message': 'Failed to authenticate user',
-                'module': 'auth.service',
-                'severity': 'ERROR',
-                'details': {
-                    'mechanism': 'JWT',
-                    'reason': 'Token expired'
-                }
-            },
-            {
-                'name': 'RateLimitExceeded',
-                'message': 'API rate limit exceeded',
-                'module': 'api.middleware',
-                'severity': 'WARNING',
-                'details': {
-                    'limit': 100,
-                    'period': '1m'
-                }
-            },
-            {
-                'name': 'InternalServerError',
-                'message': 'Unexpected server error',
-                'module': 'api.handlers',
-                'severity': 'CRITICAL',
-                'details': {
-                    'server': f'app-{random.randint(1,5)}',
-                    'process_id': random.randint(1000, 9999)
-                }
-            }
-        ]
-
+    def build_log(self):
         # Select random error
-        error = random.choice(error_types)
+        error = random.choice(ERROR_TYPES)
+        message = error['message']
+        details = error['details'] or _dynamic_details(error['name'])
 
-        # Generate stack trace
-        stack_frames = [
-            f'  File "/{error["module"]}.py", line {random.randint(1,500)}, in handle_request',
-            f'    return process_request(input)',
-            f'  File "/{error["module"]}.py", line {random.randint(1,500)}, in process_request',
-            f'    validate_input(input)',
-            f'  File "/{error["module"]}.py", line {random.randint(1,500)}, in validate_input',
-            f'    raise {error["name"]}({error["message"]})'
-        ]
+        # Unique message and request id for the share of records selected by entropy
+        if self.unique():
+            message = f'{message}: {self.vocabulary.sentence(6)}'
+            details = dict(details, request_id=self.vocabulary.hex_id())
+
+        # Pick a pre-rendered stack trace
+        language, stack_trace = self.trace_pool.sample(error['name'])
 
         log_entry = {
             'timestamp': datetime.utcnow().isoformat(),
             'service': 'web-api',
             'level': error['severity'],
-            'error_id': str(uuid.uuid4()),
+            'error_id': random_uuid(),
             'error': {
                 'type': error['name'],
-                'message': error['message'],
+                'message': message,
                 'module': error['module'],
-                'details': error['details']
+                'language': language,
+                'details': details
             },
-            'stack_trace': '\n'.join(stack_frames),
+            'stack_trace': stack_trace,
             'context': {
                 'environment': random.choice(['production', 'staging']),
                 'version': f'1.{random.randint(0,9)}.{random.randint(0,9)}',
@@ -97,4 +132,9 @@ class ErrorGenerator(BaseGenerator):
             }
         }
 
-        self.logger.info(self.formatter.format(log_entry))
+        return log_entry
+
+    def grow_log(self, log_entry, size):
+        """Grow the record with a deeper stack trace in the same language"""
+        log_entry['stack_trace'] = self.trace_pool.deepen(
+            log_entry['error']['language'], log_entry['stack_trace'], size)
@@ -8,7 +8,7 @@ class GraphQLGenerator(BaseGenerator):
     def get_log_type(self) -> str:
         return "graphql"
 
-    def generate_log(self):
+    def build_log(self):
         # Sample GraphQL queries with different complexity
         queries = [
             {
@@ -73,10 +73,29 @@ class GraphQLGenerator(BaseGenerator):
         if 'variables' in query_template:
             log_entry['variables'] = query_template['variables']
 
+        # Unique query variables for the share of records selected by entropy
+        if self.unique():
+            vocabulary = self.vocabulary
+            log_entry['variables'] = {
+                'id': vocabulary.hex_id(),
+                'input': {
+                    'title': vocabulary.sentence(4),
+                    'content': vocabulary.sentence(12)
+                }
+            }
+
         if status != 'SUCCESS':
             log_entry['error'] = {
-                'message': f'Error during {query_template["operation"]}',
+                'message': f'Error during {query_template["operation"]}' +
+                           (f': {self.vocabulary.sentence(6)}' if self.unique() else ''),
                 'code': random.choice(['VALIDATION', 'AUTHORIZATION', 'INTERNAL'])
             }
 
-        self.logger.info(self.formatter.format(log_entry))
\ No newline at end of file
+        return log_entry
+
+    def grow_log(self, log_entry, size):
+        """Grow the record with larger query variables"""
+        # Copy so the shared query template is not modified
+        variables = dict(log_entry.get('variables', {}))
+        variables['content'] = self.padding_text(size)
+        log_entry['variables'] = variables
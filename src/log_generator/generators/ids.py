@@ -0,0 +1,19 @@
+# src/generators/ids.py
+import random
+
+# RFC 4122 version 4 and variant bits, as uuid.UUID(int=..., version=4) sets them
+_UUID_MASK = ~((0xc000 << 48) | (0xf000 << 64)) & ((1 << 128) - 1)
+_UUID_BITS = (0x8000 << 48) | (4 << 76)
+
+
+def random_uuid(getrandbits=random.getrandbits):
+    """
+    Random version 4 UUID string in the canonical 8-4-4-4-12 layout.
+    Drawn from the random module, so it follows --seed and avoids the
+    os.urandom call (and the uuid module import) of uuid.uuid4().
+
+    Returns:
+        str: The UUID
+    """
+    h = '%032x' % (getrandbits(128) & _UUID_MASK | _UUID_BITS)
+    return f'{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}'
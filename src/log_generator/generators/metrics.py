@@ -4,6 +4,18 @@ import random
 import math
 from .base_generator import BaseGenerator
 
+# Additional per-device metrics used to grow records, built once
+_EXTRA_METRICS = (
+    [(f'cpu_core_{i}_usage', '%') for i in range(64)] +
+    [(f'disk_{dev}_{op}', 'ops') for dev in ('sda', 'sdb', 'nvme0n1', 'nvme1n1')
+     for op in ('reads', 'writes', 'queue_depth')] +
+    [(f'net_{iface}_{direction}', 'Mbps') for iface in ('eth0', 'eth1', 'lo', 'cni0')
+     for direction in ('rx', 'tx', 'drops')] +
+    [(f'process_{i}_rss', 'MB') for i in range(64)]
+)
+# Approximate formatted size of one extra metric entry
+_EXTRA_METRIC_SIZE = 55
+
 
 class MetricsGenerator(BaseGenerator):
     def __init__(self, *args, **kwargs):
@@ -37,13 +49,15 @@ class MetricsGenerator(BaseGenerator):
         # Ensure we don't go below 0
         return max(0, round(value, 2))
 
-    def generate_log(self):
+    def build_log(self):
         # Define hosts and services
         hosts = [f'host-{i}' for i in range(1, 4)]
         services = ['web-api', 'auth-service', 'database', 'cache']
 
         # Select random host and service
         host = random.choice(hosts)
+        if self.unique():
+            host = f'host-{self.vocabulary.hex_id()[:8]}'
         service = random.choice(services)
 
         # Generate metrics
@@ -97,4 +111,14 @@ class MetricsGenerator(BaseGenerator):
             'total_network_throughput': metrics['network_in'] + metrics['network_out']
         }
 
-        self.logger.info(self.formatter.format(log_entry))
+        return log_entry
+
+    def grow_log(self, log_entry, size):
+        """Grow the record with additional per-device metrics"""
+        metrics = log_entry['metrics']
+        extra_count = len(_EXTRA_METRICS)
+        for i in range(max(1, size // _EXTRA_METRIC_SIZE)):
+            name, unit = _EXTRA_METRICS[i % extra_count]
+            if i >= extra_count:
+                name = f'{name}_{i // extra_count}'
+            metrics[name] = {'value': round(random.uniform(0, 100), 2), 'unit': unit}
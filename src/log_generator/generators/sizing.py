@@ -0,0 +1,225 @@
+# src/generators/sizing.py
+from abc import ABC, abstractmethod
+import math
+import random
+from .entropy import get_vocabulary
+from .table_cache import cached_table
+
+# Realistic building blocks for padding content
+_WORDS = (
+    'request', 'response', 'user', 'session', 'order', 'payment', 'cache', 'timeout',
+    'retry', 'upstream', 'connection', 'pool', 'queue', 'worker', 'batch', 'shard',
+    'replica', 'token', 'invoice', 'cart', 'product', 'inventory', 'region', 'tenant',
+    'latency', 'backend', 'gateway', 'checkout', 'account', 'profile', 'search', 'index'
+)
+_MODULES = ('api.handlers', 'api.middleware', 'database.connection', 'auth.service',
+            'services.orders', 'services.payments', 'workers.queue', 'cache.redis')
+_FUNCTIONS = ('handle_request', 'dispatch', 'execute', 'run_query', 'fetch', 'commit',
+              'serialize', 'authorize', 'process_batch', 'call_upstream')
+
+
+class SizeDistribution(ABC):
+    """Base class for record size distributions (sizes in bytes)"""
+
+    @abstractmethod
+    def sample(self):
+        """
+        Draw a target record size.
+
+        Returns:
+            int: Target size of the formatted record in bytes
+        """
+        pass
+
+
+class FixedSize(SizeDistribution):
+    def __init__(self, size):
+        self.size = int(size)
+
+    def sample(self):
+        return self.size
+
+
+class UniformSize(SizeDistribution):
+    def __init__(self, low, high):
+        if low > high:
+            raise ValueError("low must not be greater than high")
+        self.low = int(low)
+        self.high = int(high)
+
+    def sample(self):
+        return random.randint(self.low, self.high)
+
+
+class LogNormalSize(SizeDistribution):
+    """
+    Log-normal sizes: most records near the median with a heavy tail of
+    large ones, capped at max_size.
+    """
+
+    def __init__(self, median, sigma=1.0, max_size=1024 * 1024):
+        self.mu = math.log(median)
+        self.sigma = float(sigma)
+        self.max_size = int(max_size)
+
+    def sample(self):
+        return min(int(random.lognormvariate(self.mu, self.sigma)), self.max_size)
+
+
+def parse_size_distribution(spec):
+    """
+    Parse a size distribution from a command line spec.
+
+    Supported specs:
+        fixed:SIZE
+        uniform:LOW:HIGH
+        lognormal:MEDIAN[:SIGMA[:MAX]]
+
+    Args:
+        spec: Distribution spec string
+
+    Returns:
+        SizeDistribution: The parsed distribution
+
+    Raises:
+        ValueError: If the spec is invalid
+    """
+    kind, _, params = spec.partition(':')
+    values = [float(v) for v in params.split(':')] if params else []
+    distributions = {
+        'fixed': (FixedSize, 1, 1),
+        'uniform': (UniformSize, 2, 2),
+        'lognormal': (LogNormalSize, 1, 3)
+    }
+    if kind not in distributions:
+        raise ValueError(f"Unknown size distribution: {kind}")
+    cls, min_args, max_args = distributions[kind]
+    if not min_args <= len(values) <= max_args:
+        raise ValueError(f"Invalid parameters for {kind} size distribution: {spec}")
+    return cls(*values)
+
+
+def growth_visible(generator, size=2000):
+    """
+    Check that a generator's formatter shows the content its grow_log()
+    adds, so a size distribution can be met in that format.
+
+    Args:
+        generator: BaseGenerator instance (nothing is written to its sink)
+        size: Characters to grow a sample record by
+
+    Returns:
+        bool: True if at least a quarter of the growth shows up in the formatted
+              record
+    """
+    log_entry = generator.sample_log()
+    before = len(generator.formatter.format(log_entry))
+    generator.grow_log(log_entry, size)
+    return len(generator.formatter.format(log_entry)) - before >= size // 4
+
+
+class PaddingBuffer:
+    """
+    Preallocated block of realistic text that padding is sliced from,
+    so growing records costs a slice instead of building new content.
+    """
+
+    def __init__(self, lines, separator='\n', size=256 * 1024, seed=0):
+        """
+        Build the buffer.
+
+        Args:
+            lines: Sequence of candidate lines, or a callable taking a Random and returning a line
+            separator: String placed between lines
+            size: Approximate buffer size in characters
+            seed: Seed for the buffer contents so runs are reproducible
+        """
+        rng = random.Random(seed)
+        parts = []
+        total = 0
+        while total < size:
+            line = lines(rng) if callable(lines) else rng.choice(lines)
+            parts.append(line)
+            total += len(line) + len(separator)
+        self.separator = separator
+        self.text = separator.join(parts)
+        self.size = len(self.text)
+
+    def take(self, length):
+        """
+        Take a slice of the buffer.
+
+        Args:
+            length: Number of characters wanted
+
+        Returns:
+            str: Slice of about `length` characters, starting at a line boundary
+        """
+        if length <= 0:
+            return ''
+        if length >= self.size:
+            repeats, rest = divmod(length, self.size + len(self.separator))
+            return ((self.text + self.separator) * repeats + self.text[:rest]).strip(self.separator)
+
+        offset = random.randrange(self.size - length + 1)
+        boundary = self.text.find(self.separator, offset, self.size - length)
+        start = boundary + len(self.separator) if boundary >= 0 else offset
+        return self.text[start:start + length].strip(self.separator)
+
+
+def _text_line(rng):
+    return ' '.join(rng.choice(_WORDS) for _ in range(rng.randint(6, 14)))
+
+
+def _frame_line(rng):
+    module = rng.choice(_MODULES)
+    return (f'  File "/{module.replace(".", "/")}.py", line {rng.randint(1, 900)}, '
+            f'in {rng.choice(_FUNCTIONS)}\n    {rng.choice(_FUNCTIONS)}({rng.choice(_WORDS)})')
+
+
+def _query_line(rng):
+    return f'{rng.choice(_WORDS)}_{rng.choice(_WORDS)}={rng.choice(_WORDS)}{rng.randint(0, 9999)}'
+
+
+def _unique_text_line(rng):
+    words = get_vocabulary().words
+    return ' '.join(rng.choice(words) for _ in range(rng.randint(6, 14)))
+
+
+def _unique_query_line(rng):
+    vocabulary = get_vocabulary()
+    return f'{rng.choice(vocabulary.words)}={rng.choice(vocabulary.hex_ids)}{rng.choice(vocabulary.hex_ids)}'
+
+
+_buffers = {}
+
+
+def get_padding_buffer(kind):
+    """
+    Get a shared padding buffer, building it on first use.
+
+    Args:
+        kind: 'text', 'frames' or 'query', or 'unique_text' / 'unique_query'
+              for high-entropy content drawn from the vocabulary
+
+    Returns:
+        PaddingBuffer: The shared buffer
+    """
+    buffer = _buffers.get(kind)
+    if buffer is None:
+        builders = {
+            'text': (_text_line, ' '),
+            'frames': (_frame_line, '\n'),
+            'query': (_query_line, '&'),
+            'unique_text': (_unique_text_line, ' '),
+            'unique_query': (_unique_query_line, '&')
+        }
+        line_builder, separator = builders[kind]
+        # Unique buffers are larger so slices rarely repeat within a compression window
+        size = 1024 * 1024 if kind.startswith('unique_') else 256 * 1024
+        # Unique buffers are drawn from the vocabulary, so its source is part of their key
+        modules = (__name__, get_vocabulary.__module__) if kind.startswith('unique_') else __name__
+        buffer = _buffers[kind] = cached_table(
+            f'padding_{kind}', (separator, size), lambda: PaddingBuffer(line_builder, separator, size=size),
+            module=modules)
+    return buffer
@@ -0,0 +1,261 @@
+# src/generators/stack_traces.py
+import random
+
+LANGUAGES = ('java', 'python', 'go', 'node')
+
+# Frames kept per language for deepening traces
+_FRAME_LIST_SIZE = 4096
+
+# Separates the traces of one exception and language in their packed form
+_TRACE_SEPARATOR = '\0'
+
+_PACKAGES = ('orders', 'payments', 'users', 'inventory', 'auth', 'catalog', 'billing', 'search')
+_LAYERS = ('controller', 'service', 'repository', 'client', 'handler', 'middleware', 'worker')
+_VERBS = ('process', 'handle', 'load', 'save', 'validate', 'fetch', 'execute', 'dispatch',
+          'resolve', 'apply', 'commit', 'refresh')
+_NOUNS = ('Order', 'Payment', 'User', 'Session', 'Request', 'Batch', 'Token', 'Cart', 'Invoice')
+
+_CAUSES = {
+    'java': (('java.sql.SQLTransientConnectionException', 'Connection is not available, request timed out after 30000ms'),
+             ('java.net.SocketTimeoutException', 'Read timed out'),
+             ('java.lang.IllegalStateException', 'Pool is closed'),
+             ('java.io.IOException', 'Broken pipe')),
+    'python': (('ConnectionRefusedError', '[Errno 111] Connection refused'),
+               ('TimeoutError', 'timed out'),
+               ('KeyError', "'user_id'"),
+               ('OSError', '[Errno 32] Broken pipe')),
+    'go': (('context deadline exceeded', ''),
+           ('dial tcp 10.0.3.17:5432: connect: connection refused', ''),
+           ('runtime error: invalid memory address or nil pointer dereference', '')),
+    'node': (('Error', 'connect ECONNREFUSED 10.0.3.17:5432'),
+             ('TypeError', "Cannot read properties of undefined (reading 'id')"),
+             ('Error', 'socket hang up')),
+}
+
+
+def _camel(name):
+    return name[:1].upper() + name[1:]
+
+
+class _FrameFactory:
+    """Builds realistic frames for each language from a seeded Random"""
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def _parts(self):
+        rng = self.rng
+        return rng.choice(_PACKAGES), rng.choice(_LAYERS), rng.choice(_VERBS), rng.choice(_NOUNS)
+
+    def java(self):
+        package, layer, verb, noun = self._parts()
+        cls = f'{noun}{_camel(layer)}'
+        return f'\tat com.example.{package}.{layer}.{cls}.{verb}{noun}({cls}.java:{self.rng.randint(20, 900)})'
+
+    def python(self):
+        package, layer, verb, noun = self._parts()
+        return (f'  File "/app/{package}/{layer}.py", line {self.rng.randint(5, 900)}, in {verb}_{noun.lower()}\n'
+                f'    return self.{layer}.{verb}({noun.lower()})')
+
+    def go(self):
+        package, layer, verb, noun = self._parts()
+        rng = self.rng
+        return (f'github.com/example/app/{package}.(*{_camel(layer)}).{_camel(verb)}{noun}'
+                f'(0xc000{rng.getrandbits(24):06x}, 0x{rng.getrandbits(12):x})\n'
+                f'\t/app/{package}/{layer}.go:{rng.randint(10, 700)} +0x{rng.getrandbits(10):x}')
+
+    def node(self):
+        package, layer, verb, noun = self._parts()
+        rng = self.rng
+        prefix = 'async ' if rng.random() < 0.3 else ''
+        return (f'    at {prefix}{_camel(layer)}.{verb}{noun} '
+                f'(/app/src/{package}/{layer}.js:{rng.randint(5, 400)}:{rng.randint(3, 60)})')
+
+
+class StackTracePool:
+    """
+    Pre-rendered stack traces for a fixed set of exceptions, sampled by
+    reference. Traces are rendered once at startup in Java, Python, Go and
+    Node styles with configurable depth and chained causes ("Caused by:",
+    "The above exception was the direct cause...", extra goroutines,
+    "[cause]:"), then stored as one packed string per exception and
+    language that is split into a list of traces on first use, so a pool
+    loaded from the table cache only builds the trace strings it samples.
+    Sampling returns an existing string without copying it.
+
+    Usage:
+        pool = StackTracePool([('DatabaseConnectionError', 'Failed to connect', 'database.connection')])
+        language, trace = pool.sample('DatabaseConnectionError')
+    """
+
+    def __init__(self, exceptions, languages=LANGUAGES, traces_per_exception=400,
+                 min_depth=5, max_depth=25, caused_by_probability=0.3, max_causes=2, seed=0):
+        """
+        Render the pool.
+
+        Args:
+            exceptions: Sequence of (name, message, module) tuples
+            languages: Languages to render traces in
+            traces_per_exception: Traces rendered per exception, spread over the languages
+            min_depth: Minimum frames per exception in a trace
+            max_depth: Maximum frames per exception in a trace
+            caused_by_probability: Chance of each additional chained cause
+            max_causes: Maximum chained causes per trace
+            seed: Seed for the pool contents so runs are reproducible
+        """
+        unknown = set(languages) - set(LANGUAGES)
+        if unknown or not languages:
+            raise ValueError(f"Unsupported languages: {', '.join(sorted(unknown)) or 'none given'}")
+        if not 1 <= min_depth <= max_depth:
+            raise ValueError("Depth must satisfy 1 <= min_depth <= max_depth")
+
+        self.languages = tuple(languages)
+        self.min_depth = min_depth
+        self.max_depth = max_depth
+        self.caused_by_probability = caused_by_probability
+        self.max_causes = max_causes
+        self.rng = random.Random(seed)
+        self.frames = _FrameFactory(self.rng)
+
+        per_language = max(1, traces_per_exception // len(self.languages))
+        self._packed = {}
+        for name, message, module in exceptions:
+            self._packed[name] = {
+                language: _TRACE_SEPARATOR.join(self._render(language, name, message, module)
+                                                for _ in range(per_language))
+                for language in self.languages
+            }
+        self.traces = {}
+        self._frame_lists = {}
+        self._frame_lengths = {}
+        # Only needed while rendering; without them the pool is plain data
+        # the table cache can store
+        del self.rng, self.frames
+
+    def sample(self, name, language=None):
+        """
+        Pick a pre-rendered trace.
+
+        Args:
+            name: Exception name the pool was built with
+            language: Language to pick from (default: random)
+
+        Returns:
+            tuple: (language, trace string)
+        """
+        packed = self._packed[name]
+        if language is None:
+            language = self.languages[random.randrange(len(self.languages))]
+        traces = self.traces.get((name, language))
+        if traces is None:
+            traces = self.traces[(name, language)] = packed[language].split(_TRACE_SEPARATOR)
+        return language, traces[random.randrange(len(traces))]
+
+    def extra_frames(self, language, size):
+        """
+        Take whole frames in a language's style from a preallocated list,
+        used to make traces deeper when records are grown to a target size.
+
+        Args:
+            language: One of the pool's languages
+            size: Approximate number of characters wanted
+
+        Returns:
+            str: Newline-separated frames totalling about `size` characters
+        """
+        frames = self._frame_lists.get(language)
+        if frames is None:
+            rng = random.Random(1)
+            factory = getattr(_FrameFactory(rng), language)
+            frames = self._frame_lists[language] = [factory() for _ in range(_FRAME_LIST_SIZE)]
+            self._frame_lengths[language] = sum(len(frame) + 1 for frame in frames) / len(frames)
+        count = max(1, round(size / self._frame_lengths[language]))
+        if count >= len(frames):
+            repeats, rest = divmod(count, len(frames))
+            return '\n'.join(frames * repeats + frames[:rest])
+        start = random.randrange(len(frames) - count + 1)
+        return '\n'.join(frames[start:start + count])
+
+    def deepen(self, language, trace, size):
+        """
+        Make a trace deeper by inserting about `size` characters of frames
+        at the top of its innermost stack, where a deeper call chain would be.
+
+        Args:
+            language: Language the trace was rendered in
+            trace: Trace string from sample()
+            size: Number of characters to add
+
+        Returns:
+            str: The deeper trace
+        """
+        if size <= 0:
+            return trace
+        frames = self.extra_frames(language, size)
+        if language == 'python':
+            # Innermost frames are at the bottom of the last traceback
+            head, _, last = trace.rpartition('\n')
+            return f'{head}\n{frames}\n{last}'
+        # Java, Go and Node list the innermost frame first, after the header
+        header_lines = 3 if language == 'go' else 1
+        parts = trace.split('\n', header_lines)
+        return '\n'.join(parts[:header_lines] + [frames] + parts[header_lines:])
+
+    def _depth(self):
+        return self.rng.randint(self.min_depth, self.max_depth)
+
+    def _causes(self, language):
+        count = 0
+        limit = min(self.max_causes, len(_CAUSES[language]))
+        while count < limit and self.rng.random() < self.caused_by_probability:
+            count += 1
+        return self.rng.sample(_CAUSES[language], count)
+
+    def _stack(self, language, depth):
+        frame = getattr(self.frames, language)
+        return [frame() for _ in range(depth)]
+
+    def _render(self, language, name, message, module):
+        return getattr(self, f'_render_{language}')(name, message, module, self._causes(language))
+
+    def _render_java(self, name, message, module, causes):
+        lines = [f'com.example.{module}.{name}: {message}']
+        lines += self._stack('java', self._depth())
+        for cause, cause_message in causes:
+            depth = self._depth()
+            lines.append(f'Caused by: {cause}: {cause_message}')
+            lines += self._stack('java', max(1, depth // 2))
+            lines.append(f'\t... {depth - depth // 2} more')
+        return '\n'.join(lines)
+
+    def _render_python(self, name, message, module, causes):
+        blocks = []
+        for cause, cause_message in reversed(causes):
+            blocks.append('\n'.join(['Traceback (most recent call last):'] +
+                                    self._stack('python', self._depth()) +
+                                    [f'{cause}: {cause_message}']))
+        blocks.append('\n'.join(['Traceback (most recent call last):'] +
+                                self._stack('python', self._depth()) +
+                                [f'{module}.{name}: {message}']))
+        return '\n\nThe above exception was the direct cause of the following exception:\n\n'.join(blocks)
+
+    def _render_go(self, name, message, module, causes):
+        cause_text = ''.join(f': {cause}' for cause, _ in causes)
+        lines = [f'panic: {name}: {message}{cause_text}', '', 'goroutine 1 [running]:']
+        lines += self._stack('go', self._depth())
+        # Chained causes show up as the other goroutines involved
+        for i, _ in enumerate(causes):
+            lines += ['', f'goroutine {self.rng.randint(2, 500)} [{self.rng.choice(("chan receive", "IO wait", "select"))}]:']
+            lines += self._stack('go', max(1, self._depth() // 2))
+        lines.append('exit status 2')
+        return '\n'.join(lines)
+
+    def _render_node(self, name, message, module, causes):
+        lines = [f'{name}: {message}']
+        lines += self._stack('node', self._depth())
+        indent = ''
+        for cause, cause_message in causes:
+            indent += '  '
+            lines.append(f'{indent}[cause]: {cause}: {cause_message}')
+            lines += [indent + frame for frame in self._stack('node', max(1, self._depth() // 2))]
+        return '\n'.join(lines)
@@ -0,0 +1,74 @@
+# src/generators/stamping.py
+import os
+import re
+import time
+
+STAMP_FIELD = 'seq_stamp'
+
+# LGS1.<run id>.<stream id>.<sequence>.<emit time in ns since epoch>
+# A single token so it survives any output format, including JSON nested
+# inside JSON and container runtime framing.
+STAMP_PATTERN = re.compile(r'LGS1\.([0-9A-Za-z]+)\.([0-9A-Za-z_-]+)\.(\d+)\.(\d+)')
+
+_INVALID_ID_CHARS = re.compile(r'[^0-9A-Za-z_-]')
+_RUN_ID = re.compile(r'[0-9A-Za-z]+')
+
+
+def new_run_id():
+    """
+    Create a random run id.
+
+    Returns:
+        str: 12 hex characters
+    """
+    return os.urandom(6).hex()
+
+
+def is_valid_run_id(run_id):
+    """
+    Check that a run id can be parsed back out of a stamp (ASCII letters
+    and digits only).
+
+    Returns:
+        bool: True if the run id is valid
+    """
+    return _RUN_ID.fullmatch(run_id) is not None
+
+
+class SequenceStamper:
+    """
+    Produces sequence stamps for one stream of records. Each stamp carries
+    the run id, the stream id, a sequence number starting at 1 and the
+    emit time, so a receiver can detect loss, duplicates and reordering
+    and measure end-to-end latency.
+
+    Usage:
+        stamper = SequenceStamper(run_id, 'application')
+        generator = ApplicationGenerator(formatter, stamper=stamper)
+    """
+
+    def __init__(self, run_id=None, stream_id='0'):
+        """
+        Initialize the stamper.
+
+        Args:
+            run_id: Id shared by all streams of one run (alphanumeric); random if None
+            stream_id: Id of this stream within the run; characters other than
+                       letters, digits, '_' and '-' are replaced with '_'
+        """
+        self.run_id = run_id or new_run_id()
+        if not is_valid_run_id(self.run_id):
+            raise ValueError(f"Run id must be ASCII letters and digits: {self.run_id}")
+        self.stream_id = _INVALID_ID_CHARS.sub('_', stream_id) or '0'
+        self.prefix = f'LGS1.{self.run_id}.{self.stream_id}.'
+        self.seq = 0
+
+    def stamp(self):
+        """
+        Create the stamp for the next record.
+
+        Returns:
+            str: The stamp token
+        """
+        self.seq += 1
+        return f'{self.prefix}{self.seq}.{time.time_ns()}'
@@ -0,0 +1,155 @@
+# src/generators/table_cache.py
+import os
+import sys
+
+# Bump when the layout of cached tables changes
+CACHE_VERSION = 3
+
+# Cache directories already reported as unsafe
+_refused = set()
+
+
+def cache_dir():
+    """
+    Directory precomputed tables are cached in.
+
+    Priority:
+    1. Environment variable LOG_GENERATOR_CACHE_DIR
+    2. $XDG_CACHE_HOME/log-generator
+    3. ~/.cache/log-generator
+
+    Returns:
+        str: The directory, or None when caching is disabled with
+             LOG_GENERATOR_CACHE=0
+    """
+    if os.getenv('LOG_GENERATOR_CACHE', '1') == '0':
+        return None
+    directory = os.getenv('LOG_GENERATOR_CACHE_DIR')
+    if directory:
+        return directory
+    base = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'log-generator')
+
+
+def _source_stamp(module_names):
+    """Modification time and size of modules' sources, so edits invalidate their tables"""
+    stamps = []
+    for module_name in module_names:
+        path = getattr(sys.modules.get(module_name), '__file__', None)
+        try:
+            stat = os.stat(path) if path else None
+        except OSError:
+            stat = None
+        stamps.append((stat.st_mtime_ns, stat.st_size) if stat else None)
+    return tuple(stamps)
+
+
+def _private_directory(directory):
+    """
+    Check that only the current user can write to the cache directory, so
+    nobody else can plant a table in it.
+    """
+    try:
+        stat = os.stat(directory)
+    except OSError:
+        return False
+    if hasattr(os, 'getuid') and stat.st_uid != os.getuid():
+        return False
+    return not stat.st_mode & 0o022
+
+
+def _to_data(table):
+    """Split a table object into its class name and marshal-able attributes"""
+    if hasattr(table, '__dict__'):
+        return table.__class__.__qualname__, vars(table)
+    return None, table
+
+
+def _from_data(data, module_names):
+    """Rebuild a table object; its class must live in one of the table's modules"""
+    class_name, state = data
+    if class_name is None:
+        return state
+    for module_name in module_names:
+        cls = getattr(sys.modules.get(module_name), class_name, None)
+        if isinstance(cls, type):
+            table = cls.__new__(cls)
+            table.__dict__.update(state)
+            return table
+    raise ValueError(f"unknown table class {class_name}")
+
+
+def cached_table(name, params, build, module=None):
+    """
+    Get a precomputed table from the disk cache, building and storing it
+    on a miss. Tables are deterministic for their parameters (they are
+    built from seeded random generators), so a cached copy is identical to
+    a freshly built one. Any problem reading or writing the cache falls
+    back to building the table.
+
+    Tables are stored with marshal, which only holds plain data (no code is
+    run when loading, unlike pickle): a table is plain data or an object
+    whose attributes are, rebuilt from a class in `module`. The cache is
+    only used while the directory is writable by the current user alone.
+
+    Args:
+        name: Table name, used in the file name
+        params: Hashable description of everything the table depends on
+        build: Callable returning the table
+        module: Name (or tuple of names) of the modules the table is built
+                by; changes to their source invalidate the cached copy
+
+    Returns:
+        The table
+    """
+    directory = cache_dir()
+    if directory is None:
+        return build()
+    # Imported here so runs that never touch a table do not pay for them
+    import marshal
+    import tempfile
+    import zlib
+
+    module_names = (module,) if isinstance(module, str) else tuple(module or ())
+    key = repr((CACHE_VERSION, name, params, _source_stamp(module_names), sys.version_info[:2]))
+    # The file name only narrows the search; the full key is stored in the
+    # file and compared, so a checksum collision is just a cache miss
+    digest = zlib.crc32(key.encode('utf-8'))
+    path = os.path.join(directory, f'{name}-{digest:08x}.marshal')
+
+    if _private_directory(directory):
+        try:
+            with open(path, 'rb') as f:
+                stored_key, data = marshal.load(f)
+            if stored_key == key:
+                return _from_data(data, module_names)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable cache file {path}: {e}")
+    elif os.path.exists(directory):
+        if directory not in _refused:
+            _refused.add(directory)
+            print(f"Warning: Not using cache directory {directory}: it must be owned by "
+                  f"the current user and not writable by others")
+        return build()
+
+    table = build()
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not _private_directory(directory):
+            return table
+        # Write to a temporary file first so concurrent jobs never read a partial table
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f'.{name}-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                marshal.dump((key, _to_data(table)), f)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except (OSError, ValueError):
+        # Read-only or full file system, or a table marshal cannot store:
+        # run without the cache
+        pass
+    return table
@@ -1,70 +1,328 @@
 # src/main.py
 import argparse
-import os
-import time
+import math
 
-from formatters.json_formatter import JSONFormatter
-from formatters.text_formatter import TextFormatter
-from formatters.multi_line import MultilineFormatter
-from generators.application import ApplicationGenerator
-from generators.error import ErrorGenerator
-from generators.metrics import MetricsGenerator
-from generators.graphql import GraphQLGenerator
+from generators.base_generator import determine_log_dir
+from generators.sizing import growth_visible, parse_size_distribution
+from generators.stamping import STAMP_FIELD, SequenceStamper, is_valid_run_id, new_run_id
+from registry import GENERATORS, FORMATTERS
+from scheduling.profiles import (ConstantRate, DiurnalProfile, StepRampProfile, CSVProfile,
+                                 IncidentWindow, BurstProfile)
+from scheduling.scheduler import Scheduler, Stream
 
 
 def get_formatter(format_type, **kwargs):
-    formatters = {
-        'json': JSONFormatter,
-        'text': TextFormatter,
-        'multiline': MultilineFormatter
-    }
-    return formatters[format_type](**kwargs)
+    """Create a formatter by name, importing it on first use"""
+    return FORMATTERS.get(format_type)(**kwargs)
 
 
-def get_generator(generator_type, formatter, log_dir):
-    generators = {
-        'application': ApplicationGenerator,
-        'error': ErrorGenerator,
-        'metrics': MetricsGenerator,
-        'graphql': GraphQLGenerator
-    }
-    return generators[generator_type](formatter, log_dir)
+def build_formatter(format_type, args):
+    """Create a plain (non-wrapping) formatter with its command line options"""
+    if format_type == 'pattern':
+        return get_formatter(format_type, layout=args.layout)
+    return get_formatter(format_type)
+
+
+def get_generator(generator_type, formatter, log_dir, sink=None, size_distribution=None, stamper=None,
+                  entropy=0.0, **kwargs):
+    """Create a generator by name, importing it on first use"""
+    return GENERATORS.get(generator_type)(formatter, log_dir, sink=sink,
+                                          size_distribution=size_distribution, stamper=stamper,
+                                          entropy=entropy, **kwargs)
+
+
+def check_common_args(parser, args):
+    """
+    Exit with a usage error for invalid options shared with the cluster
+    controller: log types that are not registered (installed plugins
+    included), --entropy outside 0-1 and run ids that cannot be parsed back
+    out of a stamp.
+    """
+    for log_type in args.type or ():
+        try:
+            GENERATORS.get(log_type)
+        except ValueError as e:
+            parser.error(str(e))
+    if not 0 <= args.entropy <= 1:
+        parser.error("--entropy must be between 0 and 1")
+    if args.run_id is not None and not is_valid_run_id(args.run_id):
+        parser.error("--run-id must only contain ASCII letters and digits")
+
+
+def check_stamp_visible(parser, formatter):
+    """Exit with a usage error if the formatter's output would not carry the sequence stamp"""
+    if not formatter.shows_field(STAMP_FIELD):
+        parser.error(f"--stamp needs a format that shows the {STAMP_FIELD} field; "
+                     f"add {{{STAMP_FIELD}}} to the --layout pattern")
+
+
+def get_sink(args, log_type):
+    """Build the sink requested on the command line (None for the default rotating file)"""
+    if args.files <= 1:
+        return None
+    from sinks.fan_out import FanOutSink
+    log_dir = determine_log_dir(args.log_dir)
+    return FanOutSink(
+        log_dir,
+        log_type,
+        file_count=args.files,
+        skew=args.file_skew,
+        max_open=args.max_open_files,
+        churn_interval=args.churn_interval,
+        churn_fraction=args.churn_fraction
+    )
+
+
+def get_profile(args, log_type, window):
+    """Build the rate profile for one generator type from the command line"""
+    if args.bytes_per_sec > 0:
+        rate = args.bytes_per_sec
+    elif args.rate is not None:
+        rate = args.rate
+    else:
+        rate = 1.0 / args.interval if args.interval > 0 else math.inf
+
+    if args.profile == 'diurnal':
+        return DiurnalProfile(args.min_rate, rate, period=args.diurnal_period, peak=args.diurnal_peak)
+    if args.profile == 'ramp':
+        return StepRampProfile(rate, args.ramp_step, args.ramp_step_duration,
+                               max_rate=args.max_rate or math.inf)
+    if args.profile == 'csv':
+        return CSVProfile(args.profile_csv, loop=args.profile_loop)
+    if args.profile == 'spike':
+        spike_types = args.spike_types or args.type
+        factor = args.spike_factor if log_type in spike_types else 1
+        return BurstProfile(ConstantRate(rate), window, factor=factor)
+    return ConstantRate(rate)
+
+
+def warm_cache(args, trace_depth):
+    """Build every precomputed table the selected options use, so later runs load them from disk"""
+    from generators.entropy import get_vocabulary
+    from generators.sizing import get_padding_buffer
+    from generators.table_cache import cache_dir
+
+    if cache_dir() is None:
+        print("Caching is disabled (LOG_GENERATOR_CACHE=0)")
+        return
+    get_vocabulary()
+    for kind in ('text', 'frames', 'query', 'unique_text', 'unique_query'):
+        get_padding_buffer(kind)
+    if 'error' in args.type:
+        from sinks.null_sink import NullSink
+        get_generator('error', get_formatter('json'), args.log_dir, sink=NullSink(),
+                      trace_languages=args.trace_languages, trace_depth=trace_depth,
+                      caused_by_probability=args.caused_by)
+    print(f"Cache warmed in {cache_dir()}")
 
 
 def main():
     parser = argparse.ArgumentParser(description='Generate test logs for New Relic Fluent Bit testing')
-    parser.add_argument('--format', choices=['json', 'text', 'multiline'],
-                        default='json', help='Log format (default: json)')
-    parser.add_argument('--type', choices=['application', 'error', 'metrics', 'graphql'],
-                        default='application', help='Type of logs to generate (default: application)')
+    parser.add_argument('--format', default='json',
+                        help='Log format: json, text, multiline, cri, docker, pattern or an installed '
+                             'plugin (default: json)')
+    parser.add_argument('--inner-format', default='json',
+                        help='Payload format wrapped by the cri/docker formats: json, text, multiline, '
+                             'pattern or an installed plugin (default: json)')
+    parser.add_argument('--layout', default='logfmt',
+                        help="Layout for the pattern format: logfmt, combined, nginx or a custom pattern "
+                             "such as '{timestamp} {level} {error.type|q}' (default: logfmt)")
+    parser.add_argument('--max-line-size', type=int, default=16 * 1024,
+                        help='Bytes per cri/docker record before splitting into partial records (default: 16384)')
+    parser.add_argument('--type', nargs='+',
+                        help='Type(s) of logs to generate: application, error, metrics, graphql or an '
+                             'installed plugin; several types share one schedule '
+                             '(default: application, or none when --schema is given)')
+    parser.add_argument('--list-plugins', action='store_true',
+                        help='List available log types and formats, including installed plugins, and exit')
+    parser.add_argument('--warm-cache', action='store_true',
+                        help='Build the precomputed tables for the selected options into the disk cache '
+                             '(LOG_GENERATOR_CACHE_DIR, default ~/.cache/log-generator) and exit')
+    parser.add_argument('--schema', nargs='+', default=[],
+                        help='Schema file(s) (JSON, or YAML with PyYAML installed) describing custom log '
+                             'types; each adds a stream named after the schema')
     parser.add_argument('--interval', type=float, default=1.0,
                         help='Interval between logs in seconds (default: 1.0)')
+    parser.add_argument('--rate', type=float,
+                        help='Base rate in logs per second for each type, overrides --interval')
+    parser.add_argument('--profile', choices=['constant', 'spike', 'diurnal', 'ramp', 'csv'],
+                        default='constant', help='Traffic shape applied to the base rate (default: constant)')
+    parser.add_argument('--spike-factor', type=float, default=50,
+                        help='Rate multiplier during a spike (default: 50)')
+    parser.add_argument('--spike-start', type=float, default=10,
+                        help='Seconds into the run when the first spike begins (default: 10)')
+    parser.add_argument('--spike-duration', type=float, default=30,
+                        help='Length of each spike in seconds (default: 30)')
+    parser.add_argument('--spike-period', type=float, default=0,
+                        help='Seconds between spike starts, 0 for a single spike (default: 0)')
+    parser.add_argument('--spike-types', nargs='+',
+                        help='Types whose rate is multiplied during a spike; the others only shift '
+                             'towards failures (default: all selected types)')
+    parser.add_argument('--min-rate', type=float, default=0,
+                        help='Night-time rate for the diurnal profile (default: 0)')
+    parser.add_argument('--diurnal-period', type=float, default=86400,
+                        help='Length of one diurnal cycle in seconds (default: 86400)')
+    parser.add_argument('--diurnal-peak', type=float,
+                        help='Seconds into each diurnal cycle at which the rate peaks '
+                             '(default: a quarter cycle, so the run starts at the mean rate)')
+    parser.add_argument('--ramp-step', type=float, default=100,
+                        help='Rate added at every ramp step (default: 100)')
+    parser.add_argument('--ramp-step-duration', type=float, default=30,
+                        help='Seconds between ramp steps (default: 30)')
+    parser.add_argument('--max-rate', type=float, default=0,
+                        help='Upper bound for the ramp profile, 0 for none (default: 0)')
+    parser.add_argument('--profile-csv',
+                        help='CSV file of seconds,rate points for the csv profile')
+    parser.add_argument('--profile-loop', action='store_true',
+                        help='Loop the csv profile instead of holding its last rate')
+    parser.add_argument('--duration', type=float, default=0,
+                        help='Seconds to run for (0 for no limit, default: 0)')
+    parser.add_argument('--bytes-per-sec', type=float, default=0,
+                        help='Target output rate in bytes per second, overrides --interval (default: 0, disabled)')
+    parser.add_argument('--size-dist',
+                        help='Record size distribution in bytes: fixed:SIZE, uniform:LOW:HIGH '
+                             'or lognormal:MEDIAN[:SIGMA[:MAX]] (default: natural record sizes)')
+    parser.add_argument('--entropy', type=float, default=0.0,
+                        help='Share (0-1) of IDs, free text, paths and variables given unique values (default: 0.0)')
+    parser.add_argument('--target-compression-ratio', type=float,
+                        help='Calibrate entropy per type at startup so gzip compresses output by about '
+                             'this ratio, overrides --entropy')
+    parser.add_argument('--trace-languages', choices=['java', 'python', 'go', 'node'], nargs='+',
+                        default=['java', 'python', 'go', 'node'],
+                        help='Languages error stack traces are rendered in (default: all)')
+    parser.add_argument('--trace-depth', default='5:25',
+                        help='Frames per exception in error stack traces as MIN:MAX (default: 5:25)')
+    parser.add_argument('--caused-by', type=float, default=0.3,
+                        help='Probability of each chained cause in error stack traces (default: 0.3)')
+    parser.add_argument('--stamp', action='store_true',
+                        help='Embed a run id, stream id, sequence number and emit time in every record '
+                             '(field seq_stamp) for loss and latency measurement with the verify tool')
+    parser.add_argument('--run-id',
+                        help='Run id for --stamp, ASCII letters and digits only (default: random)')
+    parser.add_argument('--stream-prefix', default='',
+                        help='Prefix for stream ids, e.g. the host name, so several processes can '
+                             'share a run (default: none)')
     parser.add_argument('--count', type=int, default=0,
-                        help='Number of logs to generate (0 for infinite, default: 0)')
+                        help='Number of logs to generate across all types (0 for infinite, default: 0)')
     parser.add_argument('--log-dir',
                         help='Directory to write log files (default: ./logs in dev, /var/log/newrelic in container)')
+    parser.add_argument('--files', type=int, default=1,
+                        help='Number of files to fan output out across (default: 1)')
+    parser.add_argument('--file-skew', type=float, default=0.0,
+                        help='Zipf exponent for per-file rates when fanning out, 0 for uniform (default: 0.0)')
+    parser.add_argument('--max-open-files', type=int, default=64,
+                        help='Maximum open file handles when fanning out (default: 64)')
+    parser.add_argument('--churn-interval', type=float, default=0.0,
+                        help='Seconds between file delete/recreate rounds when fanning out, 0 to disable (default: 0)')
+    parser.add_argument('--churn-fraction', type=float, default=0.05,
+                        help='Fraction of files replaced per churn round (default: 0.05)')
     args = parser.parse_args()
 
-    # Create formatter and generator
-    formatter = get_formatter(args.format)
-    generator = get_generator(args.type, formatter, args.log_dir)
+    if args.list_plugins:
+        print(f"Log types: {', '.join(GENERATORS.names())}")
+        print(f"Formats: {', '.join(FORMATTERS.names())}")
+        return
+
+    size_distribution = None
+    if args.size_dist:
+        try:
+            size_distribution = parse_size_distribution(args.size_dist)
+        except ValueError as e:
+            parser.error(str(e))
+
+    schemas = {}
+    if args.schema:
+        from schema import SchemaError, load_schema
+        for path in args.schema:
+            try:
+                schema = load_schema(path)
+            except (OSError, SchemaError) as e:
+                parser.error(str(e))
+            schemas[schema.name] = schema
+    check_common_args(parser, args)
+    args.type = (args.type or ([] if schemas else ['application'])) + list(schemas)
+    if len(set(args.type)) != len(args.type):
+        parser.error("Each log type and schema name may only be given once")
+    if args.spike_types and not set(args.spike_types) <= set(args.type):
+        parser.error("--spike-types must be among the generated log types")
 
-    print(f"Generating {args.type} logs in {args.format} format")
-    print(f"Log directory: {generator.get_log_path()}")
+    try:
+        trace_depth = tuple(int(v) for v in args.trace_depth.split(':'))
+    except ValueError:
+        trace_depth = ()
+    if len(trace_depth) != 2 or not 1 <= trace_depth[0] <= trace_depth[1]:
+        parser.error("--trace-depth must be MIN:MAX with 1 <= MIN <= MAX")
+    if not 0 <= args.caused_by <= 1:
+        parser.error("--caused-by must be between 0 and 1")
+    if args.diurnal_period <= 0:
+        parser.error("--diurnal-period must be positive")
+    if args.diurnal_peak is not None and not 0 <= args.diurnal_peak < args.diurnal_period:
+        parser.error("--diurnal-peak must be between 0 and --diurnal-period")
+    if args.profile == 'csv' and not args.profile_csv:
+        parser.error("--profile csv requires --profile-csv")
+
+    if args.warm_cache:
+        warm_cache(args, trace_depth)
+        return
 
-    count = 0
+    # Create formatter and generators
     try:
-        while True:
-            generator.generate_log()
-            count += 1
+        if args.format in ('cri', 'docker'):
+            formatter = get_formatter(args.format, inner=build_formatter(args.inner_format, args),
+                                      max_line_size=args.max_line_size)
+        else:
+            formatter = build_formatter(args.format, args)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.stamp:
+        check_stamp_visible(parser, formatter)
+
+    run_id = args.run_id or new_run_id()
+    if args.stamp:
+        print(f"Run id: {run_id}")
 
-            if args.count > 0 and count >= args.count:
-                break
+    window = IncidentWindow(args.spike_start, args.spike_duration, args.spike_period)
+    streams = []
+    for log_type in args.type:
+        stamper = None
+        if args.stamp:
+            stamper = SequenceStamper(run_id, f'{args.stream_prefix}{log_type}')
+        options = {}
+        if log_type == 'error':
+            options = {
+                'trace_languages': args.trace_languages,
+                'trace_depth': trace_depth,
+                'caused_by_probability': args.caused_by
+            }
+        if log_type in schemas:
+            from generators.schema_generator import SchemaGenerator
+            generator = SchemaGenerator(schemas[log_type], formatter, args.log_dir,
+                                        sink=get_sink(args, log_type),
+                                        size_distribution=size_distribution, stamper=stamper,
+                                        entropy=args.entropy)
+        else:
+            generator = get_generator(log_type, formatter, args.log_dir, sink=get_sink(args, log_type),
+                                      size_distribution=size_distribution, stamper=stamper,
+                                      entropy=args.entropy, **options)
+        if size_distribution is not None and not growth_visible(generator):
+            parser.error(f"--size-dist cannot be met for {log_type} logs in {args.format} format, "
+                         f"which does not show the content records are grown with")
+        if args.target_compression_ratio:
+            from generators.entropy import calibrate_entropy
+            entropy, ratio = calibrate_entropy(generator, args.target_compression_ratio)
+            print(f"Calibrated {log_type} entropy: {entropy:.3f} (compression ratio {ratio:.2f})")
+        streams.append(Stream(generator, get_profile(args, log_type, window)))
+        print(f"Generating {log_type} logs in {args.format} format")
+        print(f"Log directory: {generator.sink.describe()}")
 
-            time.sleep(args.interval)
+    scheduler = Scheduler(streams, unit='bytes' if args.bytes_per_sec > 0 else 'lines')
+    try:
+        scheduler.run(count=args.count, duration=args.duration)
     except KeyboardInterrupt:
         print("\nLog generation stopped by user")
-
+    finally:
+        for stream in streams:
+            stream.generator.sink.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .server import MockLogsAPI, IngestStats, TokenBucket
+
+__all__ = ['MockLogsAPI', 'IngestStats', 'TokenBucket']
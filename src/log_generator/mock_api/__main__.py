@@ -0,0 +1,76 @@
+# src/mock_api/__main__.py
+import argparse
+import asyncio
+import json
+
+from mock_api.server import MockLogsAPI, DEFAULT_MAX_PAYLOAD_BYTES
+from verify.verifier import Verifier
+
+
+async def run(args):
+    verifier = Verifier() if args.verify else None
+    api = MockLogsAPI(
+        host=args.host,
+        port=args.port,
+        path=args.path,
+        verifier=verifier,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        max_bytes_per_sec=args.max_bytes_per_sec,
+        max_requests_per_sec=args.max_requests_per_sec,
+        max_payload_bytes=args.max_payload_bytes,
+        require_api_key=args.require_api_key,
+        validate_json=args.validate_json
+    )
+    await api.start()
+    print(f"Mock Logs API listening on http://{api.host}:{api.port}{api.path}")
+    try:
+        while True:
+            await asyncio.sleep(args.report_interval)
+            print(api.stats.report(), flush=True)
+            if verifier is not None:
+                print(verifier.report(), flush=True)
+    finally:
+        await api.close()
+        if args.json:
+            print(json.dumps(api.stats.summary(), indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local mock of the New Relic Logs ingest API')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on (default: 8080)')
+    parser.add_argument('--path', default='/log/v1', help='Ingest endpoint path (default: /log/v1)')
+    parser.add_argument('--latency-ms', type=float, default=0,
+                        help='Base response latency in milliseconds (default: 0)')
+    parser.add_argument('--jitter-ms', type=float, default=0,
+                        help='Additional random latency in milliseconds (default: 0)')
+    parser.add_argument('--error-rate', type=float, default=0,
+                        help='Fraction of requests answered with 500/503 (default: 0)')
+    parser.add_argument('--max-bytes-per-sec', type=float, default=0,
+                        help='Compressed bytes/s accepted before answering 429 (default: 0, no limit)')
+    parser.add_argument('--max-requests-per-sec', type=float, default=0,
+                        help='Requests/s accepted before answering 429 (default: 0, no limit)')
+    parser.add_argument('--max-payload-bytes', type=int, default=DEFAULT_MAX_PAYLOAD_BYTES,
+                        help=f'Largest accepted compressed payload (default: {DEFAULT_MAX_PAYLOAD_BYTES})')
+    parser.add_argument('--require-api-key', action='store_true',
+                        help='Answer 403 to requests without an Api-Key or X-License-Key header')
+    parser.add_argument('--validate-json', action='store_true',
+                        help='Answer 400 to bodies that are not valid JSON')
+    parser.add_argument('--verify', action='store_true',
+                        help='Also measure loss and latency of sequence-stamped records')
+    parser.add_argument('--report-interval', type=float, default=5.0,
+                        help='Seconds between throughput reports (default: 5.0)')
+    parser.add_argument('--json', action='store_true',
+                        help='Print the final statistics as JSON')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        print("\nStopped")
+
+
+if __name__ == "__main__":
+    main()
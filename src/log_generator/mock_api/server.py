@@ -0,0 +1,186 @@
+# src/mock_api/server.py
+import asyncio
+import json
+import random
+import time
+from verify.http_server import HTTPError
+from verify.receiver import LogsAPIReceiver
+
+# The Logs API rejects compressed payloads larger than this
+DEFAULT_MAX_PAYLOAD_BYTES = 1_000_000
+
+
+class TokenBucket:
+    """Token bucket rate limiter; capacity is one second of tokens"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+
+    def try_consume(self, amount):
+        """
+        Take tokens if enough are available.
+
+        Args:
+            amount: Number of tokens wanted
+
+        Returns:
+            float: 0 if the tokens were taken, otherwise seconds until they would be
+        """
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        # Allow requests larger than the bucket once it is full
+        if self.tokens >= min(amount, self.rate):
+            self.tokens -= amount
+            return 0
+        return (min(amount, self.rate) - self.tokens) / self.rate
+
+
+class IngestStats:
+    """Counters for accepted and rejected ingest traffic"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.accepted_requests = 0
+        self.accepted_bytes = 0
+        self.uncompressed_bytes = 0
+        self.rejected = {}
+        self._last_time = self.started
+        self._last_bytes = 0
+
+    def reject(self, status):
+        self.rejected[status] = self.rejected.get(status, 0) + 1
+
+    def summary(self):
+        """
+        Get the counters plus throughput since the start and since the last call.
+
+        Returns:
+            dict: Statistics
+        """
+        now = time.monotonic()
+        interval = now - self._last_time
+        recent = self.accepted_bytes - self._last_bytes
+        self._last_time = now
+        self._last_bytes = self.accepted_bytes
+        elapsed = now - self.started
+        return {
+            'accepted_requests': self.accepted_requests,
+            'accepted_bytes': self.accepted_bytes,
+            'uncompressed_bytes': self.uncompressed_bytes,
+            'rejected': dict(sorted(self.rejected.items())),
+            'bytes_per_sec': round(recent / interval, 1) if interval > 0 else 0.0,
+            'avg_bytes_per_sec': round(self.accepted_bytes / elapsed, 1) if elapsed > 0 else 0.0
+        }
+
+    def report(self):
+        s = self.summary()
+        rejected = ' '.join(f'{status}={count}' for status, count in s['rejected'].items()) or 'none'
+        return (
+            f"accepted={s['accepted_requests']} req, {s['accepted_bytes']} B "
+            f"({s['uncompressed_bytes']} B uncompressed) "
+            f"rate={s['bytes_per_sec'] / 1e6:.3f} MB/s avg={s['avg_bytes_per_sec'] / 1e6:.3f} MB/s "
+            f"rejected: {rejected}"
+        )
+
+
+class MockLogsAPI(LogsAPIReceiver):
+    """
+    Local stand-in for the New Relic Logs ingest API with configurable
+    misbehaviour, for closed-loop shipper throughput and retry testing.
+
+    Behaviour, applied in this order to each POST:
+        - 403 when an API key is required and no Api-Key/X-License-Key header is sent
+        - 413 for compressed payloads over max_payload_bytes
+        - Response latency (base + uniform jitter)
+        - 429 with Retry-After when accepted bytes/s or requests/s exceed the limits
+        - Random 500/503 errors at error_rate
+        - 400 for bodies that are not valid JSON when validate_json is set
+        - 202 otherwise
+
+    Usage:
+        api = MockLogsAPI(port=8080, latency_ms=50, error_rate=0.01,
+                          max_bytes_per_sec=5_000_000)
+        await api.start()
+    """
+
+    def __init__(self, host='127.0.0.1', port=8080, path='/log/v1', verifier=None,
+                 latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, max_bytes_per_sec=0,
+                 max_requests_per_sec=0, max_payload_bytes=DEFAULT_MAX_PAYLOAD_BYTES,
+                 require_api_key=False, validate_json=False):
+        """
+        Initialize the mock API.
+
+        Args:
+            host: Address to bind
+            port: Port to bind (0 for any free port)
+            path: Ingest endpoint path
+            verifier: Optional Verifier fed with accepted payloads
+            latency_ms: Base response latency in milliseconds
+            jitter_ms: Extra uniformly distributed latency in milliseconds
+            error_rate: Fraction of requests answered with 500/503
+            max_bytes_per_sec: Accepted compressed bytes/s before throttling (0 for no limit)
+            max_requests_per_sec: Accepted requests/s before throttling (0 for no limit)
+            max_payload_bytes: Largest accepted compressed payload
+            require_api_key: Reject requests without an API key header
+            validate_json: Reject bodies that do not parse as JSON
+        """
+        super().__init__(verifier, host, port, path)
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.byte_limiter = TokenBucket(max_bytes_per_sec) if max_bytes_per_sec > 0 else None
+        self.request_limiter = TokenBucket(max_requests_per_sec) if max_requests_per_sec > 0 else None
+        self.max_payload_bytes = max_payload_bytes
+        self.require_api_key = require_api_key
+        self.validate_json = validate_json
+        self.stats = IngestStats()
+
+    async def ingest(self, request):
+        status, body, headers = await self._check(request)
+        if status is None:
+            status, body, headers = await super().ingest(request)
+        if status == 202:
+            self.stats.accepted_requests += 1
+            self.stats.accepted_bytes += len(request.body)
+        else:
+            self.stats.reject(status)
+        return status, body, headers
+
+    async def _check(self, request):
+        """Apply the configured failure behaviour; returns (None, ...) to accept"""
+        if self.require_api_key and not ('api-key' in request.headers or
+                                         'x-license-key' in request.headers):
+            return 403, _error('Missing API key'), None
+        if len(request.body) > self.max_payload_bytes:
+            return 413, _error('Payload too large'), None
+
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        for limiter, amount in ((self.request_limiter, 1), (self.byte_limiter, len(request.body))):
+            if limiter is not None:
+                retry_after = limiter.try_consume(amount)
+                if retry_after:
+                    return 429, _error('Too many requests'), {'Retry-After': max(1, round(retry_after))}
+
+        if self.error_rate and random.random() < self.error_rate:
+            return random.choice((500, 503)), _error('Injected failure'), None
+        return None, b'', None
+
+    def on_accept(self, request, text):
+        if self.validate_json:
+            try:
+                json.loads(text)
+            except ValueError as e:
+                raise HTTPError(400, f'Invalid JSON: {e}')
+        self.stats.uncompressed_bytes += len(text)
+
+
+def _error(message):
+    return json.dumps({'error': message}).encode()
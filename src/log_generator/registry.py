@@ -0,0 +1,122 @@
+# src/registry.py
+import importlib
+
+# Built-in plugins as 'module:attribute' strings, imported on first use
+BUILTIN_GENERATORS = {
+    'application': 'generators.application:ApplicationGenerator',
+    'error': 'generators.error:ErrorGenerator',
+    'metrics': 'generators.metrics:MetricsGenerator',
+    'graphql': 'generators.graphql:GraphQLGenerator'
+}
+BUILTIN_FORMATTERS = {
+    'json': 'formatters.json_formatter:JSONFormatter',
+    'text': 'formatters.text_formatter:TextFormatter',
+    'multiline': 'formatters.multi_line:MultilineFormatter',
+    'cri': 'formatters.container_runtime:CRIFormatter',
+    'docker': 'formatters.container_runtime:DockerJSONFormatter',
+    'pattern': 'formatters.pattern_formatter:PatternFormatter'
+}
+
+
+class Registry:
+    """
+    Name to class registry that imports plugins lazily. Built-in entries
+    are 'module:attribute' strings, so a run only imports the generators
+    and formatters it actually uses. Third-party packages can add entries
+    through an entry point group, e.g. in their pyproject.toml:
+
+        [project.entry-points."log_generator.generators"]
+        checkout = "my_package.checkout:CheckoutGenerator"
+
+    Entry points are only scanned when a name is not built in, or when the
+    full list of names is asked for, because scanning installed
+    distributions costs more than importing a single plugin.
+
+    Usage:
+        GENERATORS.get('metrics')(formatter, log_dir)
+    """
+
+    def __init__(self, kind, group, builtins):
+        """
+        Initialize the registry.
+
+        Args:
+            kind: What the registry holds, for error messages ('generator')
+            group: Entry point group scanned for third-party plugins
+            builtins: dict of name to 'module:attribute' string
+        """
+        self.kind = kind
+        self.group = group
+        self.entries = dict(builtins)
+        self.loaded = {}
+        self.discovered = False
+
+    def register(self, name, target):
+        """
+        Add or replace an entry.
+
+        Args:
+            name: Name used on the command line
+            target: Class, or 'module:attribute' string imported on first use
+        """
+        self.entries[name] = target
+        self.loaded.pop(name, None)
+
+    def names(self):
+        """
+        List every available name, including installed plugins.
+
+        Returns:
+            list: Sorted names
+        """
+        self._discover()
+        return sorted(self.entries)
+
+    def get(self, name):
+        """
+        Look up an entry, importing it on first use.
+
+        Args:
+            name: Registered name
+
+        Returns:
+            The registered class
+
+        Raises:
+            ValueError: If no entry has that name or it cannot be imported
+        """
+        loaded = self.loaded.get(name)
+        if loaded is not None:
+            return loaded
+        if name not in self.entries:
+            self._discover()
+        target = self.entries.get(name)
+        if target is None:
+            raise ValueError(f"Unknown {self.kind} '{name}' (available: {', '.join(self.names())})")
+        if isinstance(target, str):
+            target = self._import(name, target)
+        self.loaded[name] = target
+        return target
+
+    def _import(self, name, target):
+        module_name, _, attribute = target.partition(':')
+        try:
+            value = importlib.import_module(module_name)
+            for part in attribute.split('.') if attribute else ():
+                value = getattr(value, part)
+        except (ImportError, AttributeError) as e:
+            raise ValueError(f"Could not load {self.kind} '{name}' from {target}: {e}") from None
+        return value
+
+    def _discover(self):
+        """Add entries from installed entry points (built-ins take precedence)"""
+        if self.discovered:
+            return
+        self.discovered = True
+        from importlib.metadata import entry_points
+        for entry_point in entry_points(group=self.group):
+            self.entries.setdefault(entry_point.name, entry_point.value)
+
+
+GENERATORS = Registry('generator', 'log_generator.generators', BUILTIN_GENERATORS)
+FORMATTERS = Registry('formatter', 'log_generator.formatters', BUILTIN_FORMATTERS)
@@ -0,0 +1,6 @@
+from .profiles import (RateProfile, ConstantRate, DiurnalProfile, StepRampProfile,
+                       CSVProfile, IncidentWindow, BurstProfile)
+from .scheduler import Scheduler, Stream
+
+__all__ = ['RateProfile', 'ConstantRate', 'DiurnalProfile', 'StepRampProfile', 'CSVProfile',
+           'IncidentWindow', 'BurstProfile', 'Scheduler', 'Stream']
@@ -0,0 +1,175 @@
+# src/scheduling/profiles.py
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+import math
+
+
+class RateProfile(ABC):
+    """
+    Base class for traffic shapes. A profile maps the time elapsed since the
+    start of the run to a target rate (records or bytes per second).
+    """
+
+    @abstractmethod
+    def rate_at(self, elapsed):
+        """
+        Get the target rate at a point in the run.
+
+        Args:
+            elapsed: Seconds since the run started
+
+        Returns:
+            float: Target rate per second (math.inf for unthrottled)
+        """
+        pass
+
+    def incident_active(self, elapsed):
+        """
+        Check whether an incident is in progress at a point in the run.
+        Generators use this to shift their output towards failures.
+
+        Args:
+            elapsed: Seconds since the run started
+
+        Returns:
+            bool: True while an incident is active
+        """
+        return False
+
+
+class ConstantRate(RateProfile):
+    def __init__(self, rate):
+        self.rate = rate
+
+    def rate_at(self, elapsed):
+        return self.rate
+
+
+class DiurnalProfile(RateProfile):
+    """
+    Day/night curve: a sine wave between min_rate and max_rate. The peak is
+    reached at `peak` seconds into each period; by default a quarter period
+    in, so a run starts at the mean rate on the rising slope instead of at
+    the night-time minimum.
+    """
+
+    def __init__(self, min_rate, max_rate, period=86400, peak=None):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.period = period
+        self.peak = period / 4 if peak is None else peak
+
+    def rate_at(self, elapsed):
+        phase = 2 * math.pi * (elapsed - self.peak) / self.period
+        return self.min_rate + (self.max_rate - self.min_rate) * (1 + math.cos(phase)) / 2
+
+
+class StepRampProfile(RateProfile):
+    """
+    Step ramp for finding a shipper's saturation point: start at start_rate
+    and add step_rate every step_duration seconds, up to max_rate.
+    """
+
+    def __init__(self, start_rate, step_rate, step_duration, max_rate=math.inf):
+        if step_duration <= 0:
+            raise ValueError("step_duration must be positive")
+        self.start_rate = start_rate
+        self.step_rate = step_rate
+        self.step_duration = step_duration
+        self.max_rate = max_rate
+
+    def rate_at(self, elapsed):
+        steps = int(elapsed // self.step_duration)
+        return min(self.start_rate + steps * self.step_rate, self.max_rate)
+
+
+class CSVProfile(RateProfile):
+    """
+    Replay a recorded rate curve. The CSV has two columns, seconds and rate
+    (an optional header row is skipped). Rates are linearly interpolated
+    between points.
+
+    Usage:
+        profile = CSVProfile('rates.csv', loop=True)
+    """
+
+    def __init__(self, path, loop=False):
+        import csv
+        self.loop = loop
+        self.times = []
+        self.rates = []
+        with open(path, newline='') as f:
+            for row in csv.reader(f):
+                if not row or row[0].startswith('#'):
+                    continue
+                try:
+                    t, rate = float(row[0]), float(row[1])
+                except ValueError:
+                    if not self.times:
+                        continue  # Header row
+                    raise ValueError(f"Invalid row in rate profile {path}: {row}")
+                if self.times and t <= self.times[-1]:
+                    raise ValueError(f"Times in rate profile {path} must be increasing")
+                self.times.append(t)
+                self.rates.append(rate)
+        if not self.times:
+            raise ValueError(f"Rate profile {path} has no data points")
+
+    def rate_at(self, elapsed):
+        if self.loop and self.times[-1] > 0:
+            elapsed %= self.times[-1]
+        i = bisect_right(self.times, elapsed)
+        if i == 0:
+            return self.rates[0]
+        if i == len(self.times):
+            return self.rates[-1]
+        t0, t1 = self.times[i - 1], self.times[i]
+        r0, r1 = self.rates[i - 1], self.rates[i]
+        return r0 + (r1 - r0) * (elapsed - t0) / (t1 - t0)
+
+
+class IncidentWindow:
+    """
+    Shared incident timing. Profiles for different generator types that
+    reference the same window burst together.
+    """
+
+    def __init__(self, start, duration, period=0):
+        """
+        Args:
+            start: Seconds into the run when the first incident begins
+            duration: Length of each incident in seconds
+            period: Seconds between incident starts (0 for a single incident)
+        """
+        self.start = start
+        self.duration = duration
+        self.period = period
+
+    def is_active(self, elapsed):
+        offset = elapsed - self.start
+        if offset < 0:
+            return False
+        if self.period > 0:
+            offset %= self.period
+        return offset < self.duration
+
+
+class BurstProfile(RateProfile):
+    """
+    Multiply a base profile by `factor` while an incident window is active,
+    e.g. an ErrorGenerator spike x50 for 30 seconds.
+    """
+
+    def __init__(self, base, window, factor=50):
+        self.base = base
+        self.window = window
+        self.factor = factor
+
+    def rate_at(self, elapsed):
+        rate = self.base.rate_at(elapsed)
+        if self.window.is_active(elapsed):
+            return rate * self.factor
+        return rate
+
+    def incident_active(self, elapsed):
+        return self.window.is_active(elapsed)
@@ -0,0 +1,108 @@
+# src/scheduling/scheduler.py
+import math
+import time
+
+
+class Stream:
+    """A generator paired with the rate profile that drives it"""
+
+    def __init__(self, generator, profile):
+        self.generator = generator
+        self.profile = profile
+        self.credit = 0.0
+        self.count = 0
+        self.bytes = 0
+
+
+class Scheduler:
+    """
+    Drives one or more generators from rate profiles on a shared clock.
+
+    Every tick, each stream earns credit for the time that passed at its
+    profile's current rate and spends it on records. Rates are either in
+    records per second (unit='lines') or bytes per second (unit='bytes').
+    Because all streams share one clock, profiles built on the same
+    IncidentWindow burst at the same time.
+
+    Usage:
+        window = IncidentWindow(start=60, duration=30, period=300)
+        scheduler = Scheduler([
+            Stream(error_generator, BurstProfile(ConstantRate(5), window, factor=50)),
+            Stream(app_generator, BurstProfile(ConstantRate(100), window, factor=2)),
+        ])
+        scheduler.run(duration=600)
+    """
+
+    def __init__(self, streams, unit='lines', tick=0.01, max_burst=10000):
+        """
+        Initialize the scheduler.
+
+        Args:
+            streams: List of Stream instances
+            unit: 'lines' or 'bytes', the unit profile rates are expressed in
+            tick: Scheduling resolution in seconds
+            max_burst: Maximum records per stream per tick, so a stalled
+                       process does not try to catch up all at once
+        """
+        if unit not in ('lines', 'bytes'):
+            raise ValueError(f"Unsupported unit: {unit}")
+        self.streams = streams
+        self.unit = unit
+        self.tick = tick
+        self.max_burst = max_burst
+        self.stopped = False
+
+    def stop(self):
+        """Ask a running scheduler to return at its next tick (safe to call from another thread)"""
+        self.stopped = True
+
+    def run(self, count=0, duration=0):
+        """
+        Generate logs until a limit is reached (or forever).
+
+        Args:
+            count: Total records to generate across all streams (0 for no limit)
+            duration: Seconds to run for (0 for no limit)
+
+        Returns:
+            int: Total number of records generated
+        """
+        start = time.monotonic()
+        last = start
+        total = 0
+
+        # Start with enough credit for one record so output begins immediately
+        for stream in self.streams:
+            stream.credit = 1.0
+
+        while True:
+            now = time.monotonic()
+            elapsed = now - start
+            if self.stopped or (duration > 0 and elapsed >= duration):
+                return total
+            dt = now - last
+            last = now
+
+            for stream in self.streams:
+                generator = stream.generator
+                rate = stream.profile.rate_at(elapsed)
+                generator.incident_active = stream.profile.incident_active(elapsed)
+                unthrottled = math.isinf(rate)
+                if not unthrottled:
+                    # Carry at most one second of backlog after a stall
+                    stream.credit = min(stream.credit + rate * dt, rate + 1)
+
+                emitted = 0
+                while emitted < self.max_burst and (unthrottled or stream.credit >= 1):
+                    size = generator.generate_log()
+                    emitted += 1
+                    stream.count += 1
+                    stream.bytes += size
+                    stream.credit -= size if self.unit == 'bytes' else 1
+                    total += 1
+                    if count > 0 and total >= count:
+                        return total
+
+            delay = last + self.tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
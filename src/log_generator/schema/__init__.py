@@ -0,0 +1,4 @@
+from .compiler import SchemaError, CompiledSchema, compile_schema
+from .loader import load_schema
+
+__all__ = ['SchemaError', 'CompiledSchema', 'compile_schema', 'load_schema']
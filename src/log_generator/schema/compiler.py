@@ -0,0 +1,539 @@
+# src/schema/compiler.py
+import ast
+import copy
+from datetime import datetime
+import math
+import random
+import re
+from string import Formatter
+import time
+from generators.ids import random_uuid
+
+FIELD_TYPES = ('const', 'choice', 'int', 'float', 'uuid', 'hex', 'timestamp', 'ip',
+               'sequence', 'template', 'map', 'expr', 'object')
+DISTRIBUTIONS = ('uniform', 'normal', 'lognormal', 'exponential')
+GROW_KINDS = ('text', 'frames', 'query')
+VOCABULARY_TOKENS = ('word', 'hex_id', 'sentence', 'path')
+
+# Functions allowed in 'when' conditions and 'expr' fields
+EXPRESSION_FUNCTIONS = {
+    'abs': abs, 'min': min, 'max': max, 'round': round, 'int': int, 'float': float,
+    'str': str, 'len': len, 'sin': math.sin, 'cos': math.cos, 'exp': math.exp,
+    'log': math.log, 'sqrt': math.sqrt
+}
+_EXPRESSION_NODES = (
+    ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.Compare, ast.Eq, ast.NotEq,
+    ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn, ast.Is, ast.IsNot,
+    ast.UnaryOp, ast.Not, ast.USub, ast.UAdd, ast.BinOp, ast.Add, ast.Sub, ast.Mult,
+    ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.IfExp, ast.Constant, ast.Tuple,
+    ast.List, ast.Set, ast.Load, ast.Call, ast.Name, ast.Attribute
+)
+# Weighted choices with small integer weights are expanded into a flat
+# population so sampling is a single random.choice
+_MAX_EXPANDED_POPULATION = 1000
+_FORMAT_SPEC = re.compile(r'[\w<>^=+\- #.,%]*')
+
+
+class SchemaError(ValueError):
+    """Raised when a schema is invalid"""
+    pass
+
+
+class _Absent:
+    """Marker for conditional fields whose condition did not hold"""
+
+    def __repr__(self):
+        return '<absent>'
+
+
+ABSENT = _Absent()
+
+
+class CompiledSchema:
+    """
+    A schema compiled into a build function.
+
+    Attributes:
+        name: Log type name (used for the log file name)
+        build: Function taking the generator and returning a record dict
+        grow_path: Tuple of keys of the field that grown records are padded in
+        grow_kind: Padding kind for grown records ('text', 'frames' or 'query')
+        counter_starts: Initial values of the schema's sequence counters
+        source: Generated Python source of the build function
+    """
+
+    def __init__(self, name, build, grow_path, grow_kind, counter_starts, source):
+        self.name = name
+        self.build = build
+        self.grow_path = grow_path
+        self.grow_kind = grow_kind
+        self.counter_starts = counter_starts
+        self.source = source
+
+
+class _Node:
+    """A value or condition computed by the build function"""
+
+    def __init__(self, var, label):
+        self.var = var
+        self.label = label
+        self.deps = []
+        self.lines = []
+
+
+class _ExpressionCompiler(ast.NodeTransformer):
+    """Validates an expression and rewrites field paths to local variables"""
+
+    def __init__(self, resolve, label):
+        self.resolve = resolve
+        self.label = label
+        self.deps = []
+
+    def generic_visit(self, node):
+        if not isinstance(node, _EXPRESSION_NODES):
+            raise SchemaError(f"{self.label}: unsupported syntax '{type(node).__name__}' in expression")
+        return super().generic_visit(node)
+
+    def visit_Call(self, node):
+        if not isinstance(node.func, ast.Name) or node.func.id not in EXPRESSION_FUNCTIONS:
+            raise SchemaError(f"{self.label}: only {', '.join(EXPRESSION_FUNCTIONS)} can be called")
+        if node.keywords:
+            raise SchemaError(f"{self.label}: keyword arguments are not supported")
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+    def visit_Name(self, node):
+        return self._reference(node, node.id)
+
+    def visit_Attribute(self, node):
+        parts = []
+        current = node
+        while isinstance(current, ast.Attribute):
+            parts.append(current.attr)
+            current = current.value
+        if not isinstance(current, ast.Name):
+            raise SchemaError(f"{self.label}: unsupported attribute access in expression")
+        parts.append(current.id)
+        return self._reference(node, '.'.join(reversed(parts)))
+
+    def _reference(self, node, dotted):
+        if dotted == 'incident':
+            source = 'self.incident_active'
+        else:
+            target = self.resolve(dotted, self.label)
+            self.deps.append(target)
+            source = target.var
+        return ast.copy_location(ast.parse(source, mode='eval').body, node)
+
+
+class SchemaCompiler:
+    """
+    Compiles a schema dict into Python source for a build function.
+
+    Every field becomes a local variable computed in dependency order, so a
+    record is built with straight-line code: no per-field dispatch, no
+    interpretation of the schema at run time and constants shared between
+    records. The record dict is assembled at the end in declaration order,
+    with conditional fields added after the unconditional fields of their
+    object.
+    """
+
+    def __init__(self, spec):
+        if not isinstance(spec, dict):
+            raise SchemaError("Schema must be a mapping")
+        self.spec = spec
+        self.name = spec.get('name')
+        if not isinstance(self.name, str) or not re.fullmatch(r'[A-Za-z0-9_\-]+', self.name):
+            raise SchemaError("Schema needs a 'name' made of letters, digits, '_' and '-'")
+        fields = spec.get('fields')
+        if not isinstance(fields, dict) or not fields:
+            raise SchemaError("Schema needs a non-empty 'fields' mapping")
+
+        self.namespace = {
+            'ABSENT': ABSENT, '_choice': random.choice, '_choices': random.choices,
+            '_randint': random.randint, '_uniform': random.uniform, '_gauss': random.gauss,
+            '_lognormvariate': random.lognormvariate, '_expovariate': random.expovariate,
+            '_getrandbits': random.getrandbits, '_uuid': random_uuid, '_utcnow': datetime.utcnow,
+            '_time': time.time, '_time_ns': time.time_ns, '_deepcopy': copy.deepcopy,
+            **EXPRESSION_FUNCTIONS
+        }
+        self.constants = {}
+        self.fields = {}
+        self.children = {(): []}
+        self.conditions = {}
+        self.nodes = []
+        self.counter_starts = []
+
+        self._collect(fields, (), ())
+
+    def compile(self):
+        """
+        Generate and compile the build function.
+
+        Returns:
+            CompiledSchema: The compiled schema
+        """
+        for path, (spec, node, conditions) in self.fields.items():
+            self._compile_field(path, spec, node, conditions)
+
+        lines = ['def build(self):']
+        for node in self._ordered():
+            lines.extend('    ' + line for line in node.lines)
+        lines.extend('    ' + line for line in self._object_lines('record', ()))
+        lines.append('    return record')
+        source = '\n'.join(lines) + '\n'
+
+        exec(compile(source, f'<schema {self.name!r}>', 'exec'), self.namespace)
+        grow_path, grow_kind = self._grow()
+        return CompiledSchema(self.name, self.namespace['build'], grow_path, grow_kind,
+                              tuple(self.counter_starts), source)
+
+    # Collection
+
+    def _collect(self, fields, parent, conditions):
+        for key, spec in fields.items():
+            if not isinstance(key, str) or not key.isidentifier():
+                raise SchemaError(f"{'.'.join(parent + (str(key),))}: field names must be identifiers")
+            path = parent + (key,)
+            label = '.'.join(path)
+            if not isinstance(spec, dict):
+                spec = {'type': 'const', 'value': spec}
+            field_type = spec.get('type')
+            if field_type not in FIELD_TYPES:
+                raise SchemaError(f"{label}: type must be one of {', '.join(FIELD_TYPES)}")
+
+            field_conditions = conditions
+            if 'when' in spec:
+                condition = _Node(f'c{len(self.conditions)}', f'{label}.when')
+                self.conditions[path] = (spec['when'], condition)
+                self.nodes.append(condition)
+                field_conditions = conditions + (condition,)
+
+            node = _Node(f'v{len(self.fields)}', label)
+            self.nodes.append(node)
+            self.fields[path] = (spec, node, field_conditions)
+            self.children[parent].append(path)
+
+            if field_type == 'object':
+                nested = spec.get('fields')
+                if not isinstance(nested, dict):
+                    raise SchemaError(f"{label}: object fields need a 'fields' mapping")
+                self.children[path] = []
+                self._collect(nested, path, field_conditions)
+
+    def _resolve(self, dotted, label):
+        """Look up a referenced field by dotted path"""
+        entry = self.fields.get(tuple(dotted.split('.')))
+        if entry is None:
+            raise SchemaError(f"{label}: unknown field '{dotted}'")
+        return entry[1]
+
+    # Code generation
+
+    def _constant(self, value):
+        key = repr(value)
+        name = self.constants.get(key)
+        if name is None:
+            name = self.constants[key] = f'_k{len(self.constants)}'
+            self.namespace[name] = value
+        return name
+
+    def _literal(self, value):
+        """Source for a constant: inlined when its repr is Python source, shared otherwise"""
+        if isinstance(value, (str, int, bool, type(None))) or (isinstance(value, float) and math.isfinite(value)):
+            return repr(value)
+        # repr() of inf and nan is not valid source
+        return self._constant(value)
+
+    def _expression(self, text, node, label):
+        if not isinstance(text, str):
+            raise SchemaError(f"{label}: expression must be a string")
+        try:
+            tree = ast.parse(text, mode='eval')
+        except SyntaxError as e:
+            raise SchemaError(f"{label}: invalid expression: {e.msg}") from None
+        compiler = _ExpressionCompiler(self._resolve, label)
+        tree = compiler.visit(tree)
+        node.deps.extend(compiler.deps)
+        return f'({ast.unparse(tree)})'
+
+    def _template(self, template, node, label):
+        """Compile a '{field.path}' / '{$word}' template into an f-string"""
+        if not isinstance(template, str):
+            raise SchemaError(f"{label}: template must be a string")
+        parts = []
+        try:
+            parsed = list(Formatter().parse(template))
+        except ValueError as e:
+            raise SchemaError(f"{label}: invalid template: {e}") from None
+        for literal, field, spec, conversion in parsed:
+            if literal:
+                parts.append('{' + self._constant(literal) + '}')
+            if field is None:
+                continue
+            if conversion or not _FORMAT_SPEC.fullmatch(spec or ''):
+                raise SchemaError(f"{label}: unsupported format in template placeholder '{field}'")
+            if field.startswith('$'):
+                token = field[1:]
+                if token not in VOCABULARY_TOKENS:
+                    raise SchemaError(f"{label}: unknown vocabulary token '{field}'")
+                expression = f'self.vocabulary.{token}()'
+            else:
+                target = self._resolve(field, label)
+                node.deps.append(target)
+                expression = target.var
+            parts.append('{' + expression + (f':{spec}' if spec else '') + '}')
+        return "f'" + ''.join(parts) + "'"
+
+    def _number(self, spec, label, integer):
+        distribution = spec.get('distribution', 'uniform')
+        if distribution not in DISTRIBUTIONS:
+            raise SchemaError(f"{label}: distribution must be one of {', '.join(DISTRIBUTIONS)}")
+        low = spec.get('min')
+        high = spec.get('max')
+
+        def param(name):
+            value = spec.get(name)
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or not math.isfinite(value):
+                raise SchemaError(f"{label}: {distribution} distribution needs a finite numeric '{name}'")
+            return value
+
+        if distribution == 'uniform':
+            low, high = param('min'), param('max')
+            if low > high:
+                raise SchemaError(f"{label}: min must not be greater than max")
+            if integer:
+                return f'_randint({int(low)!r}, {int(high)!r})'
+            expression = f'_uniform({low!r}, {high!r})'
+        else:
+            if distribution == 'normal':
+                expression = f"_gauss({param('mean')!r}, {param('stddev')!r})"
+            elif distribution == 'lognormal':
+                if param('median') <= 0:
+                    raise SchemaError(f"{label}: median must be positive")
+                expression = f"_lognormvariate({math.log(param('median'))!r}, {param('sigma')!r})"
+            else:
+                if param('mean') <= 0:
+                    raise SchemaError(f"{label}: mean must be positive")
+                expression = f"_expovariate({1 / param('mean')!r})"
+            if low is not None:
+                expression = f"max({expression}, {param('min')!r})"
+            if high is not None:
+                expression = f"min({expression}, {param('max')!r})"
+            if integer:
+                return f'int({expression})'
+
+        if 'round' in spec:
+            digits = spec['round']
+            if not isinstance(digits, int) or isinstance(digits, bool):
+                raise SchemaError(f"{label}: round must be an integer number of digits")
+            expression = f"round({expression}, {digits!r})"
+        return expression
+
+    def _choice(self, values, weights, label):
+        if not isinstance(values, list) or not values:
+            raise SchemaError(f"{label}: choice needs a non-empty 'values' list")
+        if weights is None:
+            return f'_choice({self._constant(tuple(values))})'
+        if (not isinstance(weights, list) or len(weights) != len(values) or
+                any(not isinstance(w, (int, float)) or w < 0 for w in weights) or not sum(weights)):
+            raise SchemaError(f"{label}: 'weights' must be non-negative numbers, one per value")
+        if all(isinstance(w, int) for w in weights) and sum(weights) <= _MAX_EXPANDED_POPULATION:
+            population = tuple(v for v, w in zip(values, weights) for _ in range(w))
+            return f'_choice({self._constant(population)})'
+        cumulative = []
+        total = 0
+        for w in weights:
+            total += w
+            cumulative.append(total)
+        return f'_choices({self._constant(tuple(values))}, cum_weights={self._constant(tuple(cumulative))})[0]'
+
+    def _value(self, spec, node, label):
+        """Expression computing a leaf field"""
+        field_type = spec['type']
+        if field_type == 'const':
+            if 'value' not in spec:
+                raise SchemaError(f"{label}: const needs a 'value'")
+            value = spec['value']
+            if isinstance(value, (dict, list)):
+                # Mutable values are copied so records never share them
+                return f'_deepcopy({self._constant(value)})'
+            return self._literal(value)
+        if field_type == 'choice':
+            expression = self._choice(spec.get('values'), spec.get('weights'), label)
+            if 'incident_values' in spec or 'incident_weights' in spec:
+                incident = self._choice(spec.get('incident_values', spec.get('values')),
+                                        spec.get('incident_weights'), label)
+                expression = f'({incident} if self.incident_active else {expression})'
+            return expression
+        if field_type in ('int', 'float'):
+            return self._number(spec, label, field_type == 'int')
+        if field_type == 'uuid':
+            return '_uuid()'
+        if field_type == 'hex':
+            length = spec.get('length', 16)
+            if not isinstance(length, int) or length < 1:
+                raise SchemaError(f"{label}: hex length must be a positive integer")
+            return f"'%0{length}x' % _getrandbits({4 * length})"
+        if field_type == 'timestamp':
+            formats = {
+                'iso': '_utcnow().isoformat()',
+                'epoch': '_time()',
+                'epoch_ms': '_time_ns() // 1000000'
+            }
+            timestamp_format = spec.get('format', 'iso')
+            if timestamp_format not in formats:
+                raise SchemaError(f"{label}: timestamp format must be one of {', '.join(formats)}")
+            return formats[timestamp_format]
+        if field_type == 'ip':
+            prefix = str(spec.get('prefix', ''))
+            octets = [o for o in prefix.split('.') if o]
+            if len(octets) > 3 or not all(o.isdigit() and int(o) < 256 for o in octets):
+                raise SchemaError(f"{label}: ip prefix must be up to three octets like '10.0'")
+            prefix = '{' + self._constant('.'.join(octets) + '.') + '}' if octets else ''
+            return "f'" + prefix + '.'.join(['{_randint(1, 255)}'] * (4 - len(octets))) + "'"
+        if field_type == 'sequence':
+            start = spec.get('start', 0)
+            step = spec.get('step', 1)
+            for name, value in (('start', start), ('step', step)):
+                if not isinstance(value, (int, float)) or isinstance(value, bool) or not math.isfinite(value):
+                    raise SchemaError(f"{label}: sequence {name} must be a number")
+            # The counter holds the next value: read it, then advance it
+            index = len(self.counter_starts)
+            self.counter_starts.append(start)
+            node.lines.append(f'n{index} = self.counters[{index}]')
+            node.lines.append(f'self.counters[{index}] = n{index} + {step!r}')
+            return f'n{index}'
+        if field_type == 'template':
+            return self._template(spec.get('template'), node, label)
+        if field_type == 'map':
+            source = spec.get('source')
+            values = spec.get('values')
+            if not isinstance(source, str) or not isinstance(values, dict):
+                raise SchemaError(f"{label}: map needs a 'source' field path and a 'values' mapping")
+            target = self._resolve(source, label)
+            node.deps.append(target)
+            table = {}
+            for key, value in values.items():
+                table[key] = value
+                # Keys in JSON/YAML mappings are strings; let numeric sources match them
+                if isinstance(key, str) and re.fullmatch(r'-?\d+', key):
+                    table[int(key)] = value
+            default = spec.get('default')
+            expression = f"{self._constant(table)}.get({target.var}, {self._literal(default)})"
+            if any(isinstance(value, (dict, list)) for value in (default, *values.values())):
+                # Mutable values are copied so records never share them
+                return f'_deepcopy({expression})'
+            return expression
+        if field_type == 'expr':
+            return self._expression(spec.get('expr'), node, label)
+        raise SchemaError(f"{label}: unsupported type '{field_type}'")
+
+    def _unique_suffix(self, spec, label):
+        """Statement appending the 'unique' template for the share of records selected by entropy"""
+        suffix = spec.get('unique')
+        if suffix is None:
+            return None
+        probe = _Node('', label)
+        expression = self._template(suffix, probe, f'{label}.unique')
+        if probe.deps:
+            raise SchemaError(f"{label}: unique suffix may only use vocabulary tokens like '{{$hex_id}}'")
+        return expression
+
+    def _compile_field(self, path, spec, node, conditions):
+        label = '.'.join(path)
+        if path in self.conditions:
+            text, condition = self.conditions[path]
+            expression = self._expression(text, condition, f'{label}.when')
+            if len(conditions) > 1:
+                # Only evaluated when the enclosing object is present
+                parent = conditions[-2]
+                condition.deps.append(parent)
+                expression = f'{parent.var} and {expression}'
+            condition.lines.append(f'{condition.var} = {expression}')
+
+        node.deps.extend(conditions)
+        if spec['type'] == 'object':
+            node.deps.extend(self.fields[child][1] for child in self.children[path])
+            body = self._object_lines(node.var, path)
+        else:
+            body = []
+            value = self._value(spec, node, label)
+            body.extend(node.lines)
+            node.lines = []
+            body.append(f'{node.var} = {value}')
+            suffix = self._unique_suffix(spec, label)
+            if suffix is not None:
+                body.append(f"if self.unique(): {node.var} = f'{{{node.var}}}{suffix[2:]}")
+
+        if conditions:
+            # The innermost condition already includes the enclosing ones
+            node.lines = [f'if {conditions[-1].var}:'] + ['    ' + line for line in body] + \
+                         ['else:', f'    {node.var} = ABSENT']
+        else:
+            node.lines = body
+
+    def _object_lines(self, var, path):
+        """Statements assembling an object from its children's variables"""
+        items = []
+        optional = []
+        for child in self.children[path]:
+            child_node = self.fields[child][1]
+            if child in self.conditions:
+                optional.append((child[-1], child_node.var))
+            else:
+                items.append(f'{child[-1]!r}: {child_node.var}')
+        lines = [f"{var} = {{{', '.join(items)}}}"]
+        for key, child_var in optional:
+            lines.append(f'if {child_var} is not ABSENT: {var}[{key!r}] = {child_var}')
+        return lines
+
+    def _ordered(self):
+        """Nodes in dependency order, keeping declaration order where possible"""
+        ordered = []
+        state = {}
+
+        def visit(node, chain):
+            if state.get(id(node)) == 'done':
+                return
+            if state.get(id(node)) == 'visiting':
+                cycle = ' -> '.join(n.label for n in chain[chain.index(node):] + [node])
+                raise SchemaError(f"Circular field reference: {cycle}")
+            state[id(node)] = 'visiting'
+            for dep in node.deps:
+                visit(dep, chain + [node])
+            state[id(node)] = 'done'
+            ordered.append(node)
+
+        for node in self.nodes:
+            visit(node, [])
+        return ordered
+
+    def _grow(self):
+        grow = self.spec.get('grow', {})
+        if not isinstance(grow, dict):
+            raise SchemaError("'grow' must be a mapping with 'field' and 'kind'")
+        kind = grow.get('kind', 'text')
+        if kind not in GROW_KINDS:
+            raise SchemaError(f"grow kind must be one of {', '.join(GROW_KINDS)}")
+        path = tuple(str(grow.get('field', 'padding')).split('.'))
+        parent = path[:-1]
+        if parent and (parent not in self.fields or self.fields[parent][0]['type'] != 'object'):
+            raise SchemaError(f"grow field '{'.'.join(path)}' must be inside an object field")
+        return path, kind
+
+
+def compile_schema(spec):
+    """
+    Compile a schema dict.
+
+    Args:
+        spec: Schema as loaded from JSON or YAML
+
+    Returns:
+        CompiledSchema: The compiled schema
+
+    Raises:
+        SchemaError: If the schema is invalid
+    """
+    return SchemaCompiler(spec).compile()
@@ -0,0 +1,43 @@
+# src/schema/loader.py
+import json
+import os
+from .compiler import SchemaError, compile_schema
+
+
+def load_schema(path):
+    """
+    Load and compile a schema file. JSON is always supported; YAML files
+    (.yaml/.yml) need PyYAML to be installed.
+
+    Args:
+        path: Path to the schema file
+
+    Returns:
+        CompiledSchema: The compiled schema
+
+    Raises:
+        SchemaError: If the file cannot be parsed or the schema is invalid
+        OSError: If the file cannot be read
+    """
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+
+    if os.path.splitext(path)[1].lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise SchemaError(f"{path}: PyYAML is required for YAML schemas (pip install pyyaml)") from None
+        try:
+            spec = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise SchemaError(f"{path}: invalid YAML: {e}") from None
+    else:
+        try:
+            spec = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise SchemaError(f"{path}: invalid JSON: {e}") from None
+
+    try:
+        return compile_schema(spec)
+    except SchemaError as e:
+        raise SchemaError(f"{path}: {e}") from None
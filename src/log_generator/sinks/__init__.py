@@ -0,0 +1,19 @@
+from .base_sink import BaseSink
+
+# Sinks are imported on first access so that importing one of them
+# (or the base class) does not pay for all the others
+_LAZY = {
+    'LoggerSink': '.logger_sink',
+    'FanOutSink': '.fan_out',
+    'NullSink': '.null_sink'
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['BaseSink', 'LoggerSink', 'FanOutSink', 'NullSink']
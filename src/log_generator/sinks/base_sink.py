@@ -0,0 +1,48 @@
+# src/sinks/base_sink.py
+from abc import ABC, abstractmethod
+
+
+def encoded_size(text, encoding='utf-8'):
+    """
+    Size of text once encoded, without encoding ASCII text.
+
+    Returns:
+        int: Number of bytes
+    """
+    if text.isascii():
+        return len(text)
+    return len(text.encode(encoding, errors='replace'))
+
+
+class BaseSink(ABC):
+    """
+    Base class for all log sinks. A sink receives fully formatted log lines
+    from a generator and is responsible for getting them to their destination.
+    """
+
+    @abstractmethod
+    def write(self, line):
+        """
+        Write a single formatted log entry.
+
+        Args:
+            line: The formatted log entry (without trailing newline)
+
+        Returns:
+            int: Number of bytes written, including any framing the sink
+                 adds (newlines, logging handler formatting)
+        """
+        pass
+
+    def close(self):
+        """Release any resources held by the sink"""
+        pass
+
+    def describe(self):
+        """
+        Describe where this sink writes to.
+
+        Returns:
+            str: Human-readable destination description
+        """
+        return self.__class__.__name__
@@ -0,0 +1,150 @@
+# src/sinks/fan_out.py
+from bisect import bisect_right
+from collections import OrderedDict
+import os
+import random
+import time
+from pathlib import Path
+from .base_sink import BaseSink, encoded_size
+
+
+class FanOutSink(BaseSink):
+    """
+    Sink that spreads log lines across many files, simulating a node with
+    hundreds or thousands of container logs being tailed at the same time.
+
+    Features:
+        - Per-file rate skew (Zipf-like weighting, 0 = uniform)
+        - File churn: files are periodically deleted and replaced by new ones,
+          like containers being rescheduled
+        - LRU pool of open file handles so the process stays under its fd limit
+
+    Usage:
+        sink = FanOutSink('/var/log/newrelic', 'application', file_count=1000,
+                          skew=1.1, max_open=128)
+        generator = ApplicationGenerator(formatter, sink=sink)
+    """
+
+    def __init__(self, log_dir, prefix, file_count=100, skew=0.0, max_open=64,
+                 churn_interval=0.0, churn_fraction=0.05, flush_interval=1.0):
+        """
+        Initialize the fan-out sink.
+
+        Args:
+            log_dir: Directory the files are created in
+            prefix: File name prefix, usually the generator's log type
+            file_count: Number of files to spread output across
+            skew: Zipf exponent for per-file rates (0 for uniform)
+            max_open: Maximum number of file handles kept open at once
+            churn_interval: Seconds between churn rounds (0 disables churn)
+            churn_fraction: Fraction of files replaced in each churn round
+            flush_interval: Seconds between flushes of the open handles
+        """
+        if file_count < 1:
+            raise ValueError("file_count must be at least 1")
+        if max_open < 1:
+            raise ValueError("max_open must be at least 1")
+        if not 0 <= churn_fraction <= 1:
+            raise ValueError("churn_fraction must be between 0 and 1")
+
+        self.log_dir = log_dir
+        self.prefix = prefix
+        self.file_count = file_count
+        self.max_open = max_open
+        self.churn_interval = churn_interval
+        self.churn_fraction = churn_fraction
+        self.flush_interval = flush_interval
+
+        # Generation per slot; bumped when a file is churned so the
+        # replacement gets a new name (and inode), like a restarted container
+        self.generations = [0] * file_count
+        self.open_files = OrderedDict()
+
+        # Cumulative weights for O(log n) weighted slot selection
+        self.cum_weights = []
+        total = 0.0
+        for i in range(file_count):
+            total += 1.0 / (i + 1) ** skew
+            self.cum_weights.append(total)
+        self.total_weight = total
+
+        now = time.monotonic()
+        self.next_churn = now + churn_interval if churn_interval > 0 else None
+        self.next_flush = now + flush_interval
+
+        Path(self.log_dir).mkdir(parents=True, exist_ok=True)
+
+    def get_file_path(self, slot):
+        """
+        Get the current path of a file slot.
+
+        Args:
+            slot: Index of the file slot
+
+        Returns:
+            str: Full path to the slot's current log file
+        """
+        return os.path.join(
+            self.log_dir,
+            f'{self.prefix}-{slot:05d}-{self.generations[slot]}.log'
+        )
+
+    def _pick_slot(self):
+        """Select a file slot according to the configured skew"""
+        slot = bisect_right(self.cum_weights, random.random() * self.total_weight)
+        return min(slot, self.file_count - 1)
+
+    def _get_handle(self, slot):
+        """Return an open handle for a slot, evicting the least recently used one if needed"""
+        handle = self.open_files.get(slot)
+        if handle is not None:
+            self.open_files.move_to_end(slot)
+            return handle
+
+        if len(self.open_files) >= self.max_open:
+            _, evicted = self.open_files.popitem(last=False)
+            evicted.close()
+
+        handle = open(self.get_file_path(slot), 'a', encoding='utf-8')
+        self.open_files[slot] = handle
+        return handle
+
+    def _churn(self):
+        """Delete a fraction of the files and move their slots to new file names"""
+        churn_count = int(self.file_count * self.churn_fraction)
+        for slot in random.sample(range(self.file_count), churn_count):
+            handle = self.open_files.pop(slot, None)
+            if handle is not None:
+                handle.close()
+            try:
+                os.remove(self.get_file_path(slot))
+            except FileNotFoundError:
+                pass
+            self.generations[slot] += 1
+
+    def flush(self):
+        """Flush all open file handles"""
+        for handle in self.open_files.values():
+            handle.flush()
+
+    def write(self, line):
+        now = time.monotonic()
+        if self.next_churn is not None and now >= self.next_churn:
+            self._churn()
+            self.next_churn = now + self.churn_interval
+        if now >= self.next_flush:
+            self.flush()
+            self.next_flush = now + self.flush_interval
+
+        data = line + '\n'
+        self._get_handle(self._pick_slot()).write(data)
+        return encoded_size(data)
+
+    def close(self):
+        for handle in self.open_files.values():
+            handle.close()
+        self.open_files.clear()
+
+    def describe(self):
+        return os.path.join(self.log_dir, f'{self.prefix}-*.log') + \
+            f' ({self.file_count} files, max {self.max_open} open)'
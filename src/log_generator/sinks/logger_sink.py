@@ -0,0 +1,70 @@
+# src/sinks/logger_sink.py
+import logging
+from .base_sink import BaseSink, encoded_size
+
+
+class _MeasuringFormatter(logging.Formatter):
+    """
+    Wraps a handler's formatter and remembers the size of the last line it
+    produced, so the sink can report the bytes the handler really wrote
+    without formatting the record a second time.
+    """
+
+    def __init__(self, formatter, encoding, terminator):
+        super().__init__()
+        self.formatter = formatter
+        self.encoding = encoding or 'utf-8'
+        self.terminator_size = encoded_size(terminator, self.encoding)
+        self.last_size = 0
+
+    def format(self, record):
+        text = self.formatter.format(record)
+        self.last_size = encoded_size(text, self.encoding) + self.terminator_size
+        return text
+
+
+class LoggerSink(BaseSink):
+    """
+    Sink that forwards formatted lines to a standard library logger.
+    This is the default sink and keeps the rotating file + console output
+    set up by BaseGenerator.
+
+    Handlers format the line again as a LogRecord, which can add framing
+    (e.g. the JSON formatter's envelope), so the bytes reported are the ones
+    the file handler (or, without one, the first handler) wrote.
+    """
+
+    def __init__(self, logger, log_path=None):
+        """
+        Initialize the sink.
+
+        Args:
+            logger: logging.Logger instance to write to
+            log_path: Path of the log file the logger writes to, for display
+        """
+        self.logger = logger
+        self.log_path = log_path
+        self.measure = None
+        handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)] or \
+            [h for h in logger.handlers if isinstance(h, logging.StreamHandler)]
+        if handlers:
+            handler = handlers[0]
+            self.measure = _MeasuringFormatter(handler.formatter or logging.Formatter(),
+                                               getattr(handler, 'encoding', None), handler.terminator)
+            handler.setFormatter(self.measure)
+
+    def write(self, line):
+        measure = self.measure
+        if measure is None:
+            self.logger.info(line)
+            return encoded_size(line) + 1
+        measure.last_size = 0
+        self.logger.info(line)
+        return measure.last_size
+
+    def close(self):
+        for handler in self.logger.handlers:
+            handler.flush()
+
+    def describe(self):
+        return self.log_path or self.logger.name
@@ -0,0 +1,16 @@
+# src/sinks/null_sink.py
+from .base_sink import BaseSink, encoded_size
+
+
+class NullSink(BaseSink):
+    """
+    Sink that discards every line. Used where generators are only needed
+    for their records or precomputed tables, not for log output. Reports
+    the bytes a line would have taken, so byte rate limits still apply.
+    """
+
+    def write(self, line):
+        return encoded_size(line) + 1
+
+    def describe(self):
+        return 'discarded'
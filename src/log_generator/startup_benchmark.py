@@ -0,0 +1,106 @@
+# src/startup_benchmark.py
+"""
+Measure cold start to first log line.
+
+Each run starts a fresh interpreter running main.py with --stamp and times
+how long it takes until the first stamped record appears on stdout. Runs
+are repeated with an empty table cache (cold) and with a warmed one, next
+to a bare interpreter start for reference.
+
+Usage:
+    python startup_benchmark.py --type error --runs 20 --budget-ms 80
+"""
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from generators.stamping import STAMP_PATTERN
+
+MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+
+
+def time_to_first_line(command, env):
+    """
+    Start a process and wait for its first stamped record.
+
+    Returns:
+        float: Milliseconds from process start to the first record
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                               env=env, text=True)
+    try:
+        for line in process.stdout:
+            if STAMP_PATTERN.search(line):
+                return (time.perf_counter() - start) * 1000
+        raise RuntimeError(f"No log line from: {' '.join(command)} (exit code {process.wait()})")
+    finally:
+        process.stdout.close()
+        process.wait()
+
+
+def time_bare_interpreter(env):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', 'pass'], env=env, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def summarize(name, samples):
+    samples = sorted(samples)
+    p90 = samples[min(len(samples) - 1, int(len(samples) * 0.9))]
+    print(f"{name:<10} min {samples[0]:7.1f} ms   median {statistics.median(samples):7.1f} ms   "
+          f"p90 {p90:7.1f} ms")
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure cold start to first log line')
+    parser.add_argument('--type', nargs='+', default=['application'],
+                        help='Log type(s) to start (default: application)')
+    parser.add_argument('--format', default='json', help='Log format (default: json)')
+    parser.add_argument('--runs', type=int, default=10, help='Runs per scenario (default: 10)')
+    parser.add_argument('--budget-ms', type=float,
+                        help='Fail (exit code 1) when the warm median exceeds this many milliseconds')
+    parser.add_argument('--extra', nargs=argparse.REMAINDER, default=[],
+                        help='Further main.py options, e.g. --extra --size-dist fixed:2048')
+    args = parser.parse_args()
+
+    # Compile up front like an installed package, so runs do not time
+    # compiling sources (e.g. with PYTHONDONTWRITEBYTECODE set)
+    compileall.compile_dir(os.path.dirname(MAIN), quiet=1)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        log_dir = os.path.join(work_dir, 'logs')
+        command = [sys.executable, MAIN, '--type', *args.type, '--format', args.format,
+                   '--count', '1', '--interval', '0', '--stamp', '--log-dir', log_dir, *args.extra]
+        env = dict(os.environ)
+
+        bare = [time_bare_interpreter(env) for _ in range(args.runs)]
+
+        cold = []
+        for i in range(args.runs):
+            cold_env = dict(env, LOG_GENERATOR_CACHE_DIR=os.path.join(work_dir, f'cold-{i}'))
+            cold.append(time_to_first_line(command, cold_env))
+
+        warm_env = dict(env, LOG_GENERATOR_CACHE_DIR=os.path.join(work_dir, 'warm'))
+        subprocess.run(command[:2] + ['--warm-cache'] + command[2:], env=warm_env,
+                       stdout=subprocess.DEVNULL, check=True)
+        warm = [time_to_first_line(command, warm_env) for _ in range(args.runs)]
+
+    print(f"Start to first line: {' '.join(args.type)} in {args.format} format, {args.runs} runs")
+    summarize('python', bare)
+    summarize('cold', cold)
+    warm_median = summarize('warm', warm)
+
+    if args.budget_ms is not None and warm_median > args.budget_ms:
+        print(f"Warm median {warm_median:.1f} ms exceeds the budget of {args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+# src/tests/conftest.py
+import os
+import sys
+
+# Modules import each other from the package directory (e.g. 'from generators import ...')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
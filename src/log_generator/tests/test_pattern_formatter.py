@@ -0,0 +1,70 @@
+# src/tests/test_pattern_formatter.py
+import logging
+
+import pytest
+
+from formatters.pattern_formatter import MAX_RENDERERS, PatternFormatter
+
+RECORDS = [
+    {'timestamp': '2024-05-01T12:30:00.123456', 'level': 'INFO', 'service': 'web',
+     'request': {'method': 'GET', 'path': '/api/orders', 'headers': {'host': 'a.example'}}},
+    {'timestamp': '2024-05-01T12:30:01', 'level': 'ERROR', 'request': {'headers': {}}},
+    {'level': 'WARN', 'request': {'headers': {'host': None}}},
+    {'level': 'DEBUG', 'request': {'headers': 'none'}},
+    {'level': 'INFO', 'request': 'plain', 'error': {'type': 'Timeout', 'detail': {'ms': 30}}},
+]
+
+LAYOUTS = [
+    'logfmt',
+    'combined',
+    'nginx',
+    '{timestamp} {level:<5} {service}',
+    '{request.headers.host|q} {request.headers.host|json} {request.headers.host|str}',
+    '{request.method} {request.path|json} {error.detail.ms} {error.detail.missing|q}',
+]
+
+
+@pytest.mark.parametrize('layout', LAYOUTS)
+def test_compiled_and_generic_rendering_match(layout):
+    formatter = PatternFormatter(layout)
+    for record in RECORDS:
+        assert formatter.format(record) == formatter._render_generic(record)
+
+
+def test_missing_fields_render_as_dash():
+    formatter = PatternFormatter('{level} {service} {request.path} {request.headers.host|q}')
+    assert formatter.format({'level': 'INFO', 'request': {'headers': {}}}) == 'INFO - - -'
+
+
+def test_logfmt_quotes_and_flattens():
+    formatter = PatternFormatter('logfmt')
+    line = formatter.format({'level': 'INFO', 'message': 'two words', 'request': {'a': {'b': 1}}})
+    assert line == 'level=INFO message="two words" request.a.b=1'
+
+
+def test_renderer_cache_is_bounded():
+    formatter = PatternFormatter('logfmt')
+    for index in range(MAX_RENDERERS * 2):
+        record = {'level': 'INFO', f'field{index}': index}
+        assert formatter.format(record) == f'level=INFO field{index}={index}'
+    assert len(formatter._renderers) == MAX_RENDERERS
+
+
+def test_log_records_pass_through():
+    formatter = PatternFormatter('combined')
+    record = logging.LogRecord('test', logging.INFO, __file__, 1, 'rendered line', None, None)
+    assert formatter.format(record) == 'rendered line'
+
+
+@pytest.mark.parametrize('layout, shown', [
+    ('logfmt', True), ('combined', False), ('{timestamp} {seq_stamp}', True), ('{seq_stamp.x}', False)
+])
+def test_shows_field(layout, shown):
+    assert PatternFormatter(layout).shows_field('seq_stamp') is shown
+
+
+def test_invalid_patterns_are_rejected():
+    with pytest.raises(ValueError):
+        PatternFormatter('{level|upper}')
+    with pytest.raises(ValueError):
+        PatternFormatter('{} {level}')
@@ -0,0 +1,167 @@
+# src/tests/test_schema_compiler.py
+import math
+
+import pytest
+
+from generators.entropy import measure_compression_ratio
+from generators.schema_generator import SchemaGenerator
+from generators.sizing import growth_visible
+from formatters.json_formatter import JSONFormatter
+from schema import SchemaError, compile_schema
+from sinks.null_sink import NullSink
+
+
+def make_generator(fields, tmp_path, **spec):
+    schema = compile_schema({'name': 'test', 'fields': fields, **spec})
+    return SchemaGenerator(schema, JSONFormatter(), str(tmp_path), sink=NullSink())
+
+
+def build(generator, count=1):
+    return [generator.build_log() for _ in range(count)]
+
+
+def test_sequence_starts_at_start(tmp_path):
+    generator = make_generator({'seq': {'type': 'sequence', 'start': 5, 'step': 2}}, tmp_path)
+    assert [r['seq'] for r in build(generator, 3)] == [5, 7, 9]
+
+
+def test_sequence_defaults_count_from_zero(tmp_path):
+    generator = make_generator({'seq': {'type': 'sequence'}}, tmp_path)
+    assert [r['seq'] for r in build(generator, 3)] == [0, 1, 2]
+
+
+def test_sample_records_do_not_advance_sequences(tmp_path):
+    generator = make_generator({'seq': {'type': 'sequence', 'start': 5}}, tmp_path)
+    assert growth_visible(generator)
+    measure_compression_ratio(generator, samples=10)
+    assert build(generator)[0]['seq'] == 5
+
+
+def test_sequence_value_is_shared_with_references(tmp_path):
+    generator = make_generator({
+        'seq': {'type': 'sequence', 'start': 1},
+        'label': {'type': 'template', 'template': 'item-{seq}'}
+    }, tmp_path)
+    assert build(generator, 2) == [{'seq': 1, 'label': 'item-1'}, {'seq': 2, 'label': 'item-2'}]
+
+
+@pytest.mark.parametrize('value', [math.inf, -math.inf])
+def test_const_non_finite_float(tmp_path, value):
+    generator = make_generator({'value': {'type': 'const', 'value': value}}, tmp_path)
+    assert build(generator)[0]['value'] == value
+
+
+def test_const_nan(tmp_path):
+    generator = make_generator({'value': {'type': 'const', 'value': math.nan}}, tmp_path)
+    assert math.isnan(build(generator)[0]['value'])
+
+
+def test_const_mutable_values_are_not_shared(tmp_path):
+    generator = make_generator({'tags': {'type': 'const', 'value': ['a']}}, tmp_path)
+    first, second = build(generator, 2)
+    first['tags'].append('b')
+    assert second['tags'] == ['a']
+
+
+def test_plain_values_are_constants(tmp_path):
+    generator = make_generator({'service': 'checkout', 'port': 8080}, tmp_path)
+    assert build(generator) == [{'service': 'checkout', 'port': 8080}]
+
+
+def test_map_values_and_default(tmp_path):
+    generator = make_generator({
+        'code': {'type': 'choice', 'values': [200, 404]},
+        'status': {'type': 'map', 'source': 'code', 'values': {'200': 'ok'}, 'default': 'unknown'}
+    }, tmp_path)
+    for record in build(generator, 20):
+        assert record['status'] == ('ok' if record['code'] == 200 else 'unknown')
+
+
+@pytest.mark.parametrize('default', [math.inf, {'reason': 'unmapped'}, ['unmapped'], None])
+def test_map_defaults(tmp_path, default):
+    generator = make_generator({
+        'code': 404,
+        'status': {'type': 'map', 'source': 'code', 'values': {'200': 'ok'}, 'default': default}
+    }, tmp_path)
+    first, second = build(generator, 2)
+    assert first['status'] == default
+    if isinstance(default, (dict, list)):
+        assert first['status'] is not second['status']
+
+
+def test_map_mutable_values_are_not_shared(tmp_path):
+    generator = make_generator({
+        'code': 200,
+        'status': {'type': 'map', 'source': 'code', 'values': {'200': {'text': 'ok'}}}
+    }, tmp_path)
+    first, second = build(generator, 2)
+    first['status']['text'] = 'changed'
+    assert second['status'] == {'text': 'ok'}
+
+
+@pytest.mark.parametrize('field', [
+    {'type': 'int', 'min': 1, 'max': math.inf},
+    {'type': 'float', 'min': -math.inf, 'max': 1},
+    {'type': 'float', 'distribution': 'normal', 'mean': math.nan, 'stddev': 1},
+    {'type': 'float', 'distribution': 'normal', 'mean': 0, 'stddev': 1, 'max': math.inf},
+    {'type': 'float', 'distribution': 'exponential', 'mean': 1, 'min': 'zero'},
+    {'type': 'float', 'min': 0, 'max': 1, 'round': 1.5},
+    {'type': 'float', 'min': 0, 'max': 1, 'round': True},
+    {'type': 'int', 'min': 5, 'max': 1},
+    {'type': 'sequence', 'start': 'one'},
+    {'type': 'sequence', 'step': math.nan},
+    {'type': 'sequence', 'start': True},
+    {'type': 'hex', 'length': 0},
+    {'type': 'choice', 'values': []},
+    {'type': 'choice', 'values': ['a', 'b'], 'weights': [1]},
+    {'type': 'map', 'source': 'missing', 'values': {}},
+    {'type': 'expr', 'expr': '__import__("os")'},
+    {'type': 'template', 'template': '{$unknown}'},
+    {'type': 'timestamp', 'format': 'rfc2822'},
+    {'type': 'ip', 'prefix': '10.300'},
+    {'type': 'const'},
+    {'type': 'unknown'},
+])
+def test_invalid_fields_are_rejected(tmp_path, field):
+    with pytest.raises(SchemaError):
+        compile_schema({'name': 'test', 'fields': {'value': field}})
+
+
+def test_circular_references_are_rejected():
+    with pytest.raises(SchemaError, match='Circular'):
+        compile_schema({'name': 'test', 'fields': {
+            'a': {'type': 'template', 'template': '{b}'},
+            'b': {'type': 'template', 'template': '{a}'}
+        }})
+
+
+@pytest.mark.parametrize('spec', [
+    [],
+    {'fields': {'a': 1}},
+    {'name': 'bad name', 'fields': {'a': 1}},
+    {'name': 'test', 'fields': {}},
+    {'name': 'test', 'fields': {'not-an-identifier': 1}},
+])
+def test_invalid_schemas_are_rejected(spec):
+    with pytest.raises(SchemaError):
+        compile_schema(spec)
+
+
+def test_bounded_distribution_stays_in_range(tmp_path):
+    generator = make_generator({
+        'latency': {'type': 'float', 'distribution': 'normal', 'mean': 100, 'stddev': 50,
+                    'min': 0, 'max': 150, 'round': 2}
+    }, tmp_path)
+    assert all(0 <= r['latency'] <= 150 for r in build(generator, 200))
+
+
+def test_conditional_fields(tmp_path):
+    generator = make_generator({
+        'level': {'type': 'choice', 'values': ['INFO', 'ERROR']},
+        'error': {'type': 'object', 'when': "level == 'ERROR'", 'fields': {'code': 500}}
+    }, tmp_path)
+    for record in build(generator, 20):
+        if record['level'] == 'ERROR':
+            assert record['error'] == {'code': 500}
+        else:
+            assert 'error' not in record
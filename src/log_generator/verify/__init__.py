@@ -0,0 +1,5 @@
+from .verifier import Verifier, StreamTracker, LatencyHistogram
+from .receiver import LogsAPIReceiver
+from .file_reader import FileFollower
+
+__all__ = ['Verifier', 'StreamTracker', 'LatencyHistogram', 'LogsAPIReceiver', 'FileFollower']
@@ -0,0 +1,78 @@
+# src/verify/__main__.py
+import argparse
+import asyncio
+import json
+import time
+
+from verify.verifier import Verifier
+from verify.receiver import LogsAPIReceiver
+from verify.file_reader import FileFollower
+
+
+async def run_http(args, verifier):
+    receiver = LogsAPIReceiver(verifier, args.host, args.port, args.path)
+    await receiver.start()
+    print(f"Listening on http://{receiver.host}:{receiver.port}{receiver.path}")
+    try:
+        while True:
+            await asyncio.sleep(args.report_interval)
+            print(verifier.report(), flush=True)
+    finally:
+        await receiver.close()
+
+
+def run_files(args, verifier):
+    follower = FileFollower(args.paths, verifier, from_start=not args.new_only)
+    print(f"Following {', '.join(args.paths)}")
+    next_report = time.monotonic() + args.report_interval
+    try:
+        while True:
+            if not follower.poll():
+                time.sleep(args.poll_interval)
+            if time.monotonic() >= next_report:
+                print(verifier.report(), flush=True)
+                next_report += args.report_interval
+    finally:
+        follower.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Receive sequence-stamped logs and measure loss, duplicates, reordering and latency')
+    parser.add_argument('--report-interval', type=float, default=5.0,
+                        help='Seconds between status reports (default: 5.0)')
+    parser.add_argument('--window', type=int, default=65536,
+                        help='Sequence numbers remembered per stream for duplicate detection (default: 65536)')
+    parser.add_argument('--json', action='store_true',
+                        help='Print the final summary as JSON')
+    modes = parser.add_subparsers(dest='mode', required=True)
+
+    http_mode = modes.add_parser('http', help='Accept New Relic Logs API requests')
+    http_mode.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1)')
+    http_mode.add_argument('--port', type=int, default=8080, help='Port to listen on (default: 8080)')
+    http_mode.add_argument('--path', default='/log/v1', help='Ingest endpoint path (default: /log/v1)')
+
+    files_mode = modes.add_parser('files', help='Follow log files written by the generator')
+    files_mode.add_argument('paths', nargs='+', help='Files or glob patterns to follow')
+    files_mode.add_argument('--poll-interval', type=float, default=0.2,
+                            help='Seconds between polls when idle (default: 0.2)')
+    files_mode.add_argument('--new-only', action='store_true',
+                            help='Skip data already in the files at startup')
+    args = parser.parse_args()
+
+    verifier = Verifier(window=args.window)
+    try:
+        if args.mode == 'http':
+            asyncio.run(run_http(args, verifier))
+        else:
+            run_files(args, verifier)
+    except KeyboardInterrupt:
+        print("\nStopped")
+    if args.json:
+        print(json.dumps(verifier.summary(), indent=2))
+    else:
+        print(verifier.report())
+
+
+if __name__ == "__main__":
+    main()
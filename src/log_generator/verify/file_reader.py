@@ -0,0 +1,145 @@
+# src/verify/file_reader.py
+import glob
+import os
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class _FileState:
+    """Follow state of one file, keyed by its (device, inode) identity"""
+
+    def __init__(self, path, handle, offset):
+        self.path = path
+        self.handle = handle
+        self.offset = offset
+        self.remainder = ''
+
+
+class FileFollower:
+    """
+    Follows log files matching glob patterns (like tail -F) and feeds
+    complete lines to a Verifier. Handles rotation, truncation and files
+    appearing or disappearing, e.g. with the fan-out sink's churn.
+
+    Files are tracked by (st_dev, st_ino) rather than by path and kept
+    open, so a file renamed by rotation is read to its end under its old
+    identity (whether or not its new name still matches) instead of being
+    lost or read a second time under its new name.
+
+    Usage:
+        follower = FileFollower(['logs/*.log'], verifier)
+        try:
+            while True:
+                follower.poll()
+                time.sleep(0.2)
+        finally:
+            follower.close()
+    """
+
+    def __init__(self, patterns, verifier, from_start=True):
+        """
+        Initialize the follower.
+
+        Args:
+            patterns: List of glob patterns of files to follow
+            verifier: Verifier receiving the lines
+            from_start: Read files found at startup from the beginning
+                        (False to only read data written from now on)
+        """
+        self.patterns = patterns
+        self.verifier = verifier
+        self.files = {}
+        self.bytes_read = 0
+        if not from_start:
+            for identity, path in self._matching_files().items():
+                self._open(identity, path, at_end=True)
+
+    def _matching_files(self):
+        """Map of (st_dev, st_ino) to path for every file matching the patterns"""
+        files = {}
+        for pattern in self.patterns:
+            for path in glob.glob(pattern):
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files[(stat.st_dev, stat.st_ino)] = path
+        return files
+
+    def _open(self, identity, path, at_end=False):
+        try:
+            handle = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+        stat = os.fstat(handle.fileno())
+        if (stat.st_dev, stat.st_ino) != identity:
+            # Replaced between the stat and the open; picked up next poll
+            handle.close()
+            return None
+        state = self.files[identity] = _FileState(path, handle, stat.st_size if at_end else 0)
+        return state
+
+    def poll(self):
+        """
+        Read everything appended since the last poll.
+
+        Returns:
+            int: Number of bytes read
+        """
+        read = 0
+        matching = self._matching_files()
+
+        for identity in list(self.files):
+            if identity not in matching:
+                # Renamed away or deleted: finish reading what the open
+                # handle still sees, then stop following it
+                state = self.files.pop(identity)
+                read += self._read(state)
+                if state.remainder:
+                    self.verifier.observe_text(state.remainder)
+                state.handle.close()
+
+        for identity, path in matching.items():
+            state = self.files.get(identity)
+            if state is None:
+                state = self._open(identity, path)
+                if state is None:
+                    continue
+            state.path = path
+            size = os.fstat(state.handle.fileno()).st_size
+            if size < state.offset:
+                # Truncated in place
+                state.offset = 0
+                state.remainder = ''
+            if size != state.offset:
+                read += self._read(state)
+
+        self.bytes_read += read
+        return read
+
+    def close(self):
+        """Close every file being followed"""
+        for state in self.files.values():
+            state.handle.close()
+        self.files = {}
+
+    def _read(self, state):
+        read = 0
+        f = state.handle
+        f.seek(state.offset)
+        while True:
+            data = f.read(READ_CHUNK_SIZE)
+            if not data:
+                break
+            state.offset += len(data)
+            read += len(data)
+            text = state.remainder + data.decode('utf-8', errors='replace')
+            cut = text.rfind('\n') + 1
+            state.remainder = text[cut:]
+            if cut:
+                self.verifier.observe_text(text[:cut])
+            if len(state.remainder) > READ_CHUNK_SIZE:
+                # Very long line without a newline yet; don't buffer it forever
+                self.verifier.observe_text(state.remainder)
+                state.remainder = ''
+        return read
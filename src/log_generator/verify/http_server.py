@@ -0,0 +1,203 @@
+# src/verify/http_server.py
+from abc import ABC, abstractmethod
+import asyncio
+import gzip
+import zlib
+
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+REASONS = {
+    200: 'OK', 202: 'Accepted', 400: 'Bad Request', 404: 'Not Found',
+    403: 'Forbidden', 405: 'Method Not Allowed', 413: 'Payload Too Large', 429: 'Too Many Requests',
+    500: 'Internal Server Error', 503: 'Service Unavailable'
+}
+
+
+class HTTPRequest:
+    """A parsed HTTP/1.1 request"""
+
+    def __init__(self, method, path, headers, body):
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+
+    @property
+    def keep_alive(self):
+        return self.headers.get('connection', '').lower() != 'close'
+
+
+class HTTPError(Exception):
+    """Raised for requests that cannot be parsed"""
+
+    def __init__(self, status, message=''):
+        super().__init__(message)
+        self.status = status
+
+
+async def read_request(reader):
+    """
+    Read one HTTP/1.1 request from a stream.
+
+    Args:
+        reader: asyncio.StreamReader
+
+    Returns:
+        HTTPRequest: The request, or None when the client closed the connection
+
+    Raises:
+        HTTPError: If the request is malformed or too large
+    """
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, path, _ = request_line.decode('latin-1').split(' ', 2)
+    except ValueError:
+        raise HTTPError(400, 'Malformed request line')
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        chunks = []
+        size = 0
+        while True:
+            size_line = (await reader.readline()).split(b';')[0].strip()
+            try:
+                chunk_size = int(size_line or b'0', 16)
+            except ValueError:
+                raise HTTPError(400, 'Malformed chunk size')
+            if chunk_size < 0:
+                raise HTTPError(400, 'Malformed chunk size')
+            if chunk_size == 0:
+                await reader.readline()
+                break
+            size += chunk_size
+            if size > MAX_BODY_SIZE:
+                raise HTTPError(413, 'Body too large')
+            chunks.append(await reader.readexactly(chunk_size))
+            await reader.readline()
+        body = b''.join(chunks)
+    else:
+        try:
+            length = int(headers.get('content-length', '0') or 0)
+        except ValueError:
+            raise HTTPError(400, 'Malformed Content-Length')
+        if length < 0:
+            raise HTTPError(400, 'Malformed Content-Length')
+        if length > MAX_BODY_SIZE:
+            raise HTTPError(413, 'Body too large')
+        body = await reader.readexactly(length) if length else b''
+
+    return HTTPRequest(method.upper(), path, headers, body)
+
+
+def build_response(status, body=b'', headers=None, keep_alive=True):
+    """
+    Serialize an HTTP/1.1 response.
+
+    Args:
+        status: Status code
+        body: Response body (bytes)
+        headers: Optional dict of extra headers
+        keep_alive: Whether the connection stays open
+
+    Returns:
+        bytes: The response
+    """
+    lines = [f'HTTP/1.1 {status} {REASONS.get(status, "Unknown")}',
+             f'Content-Length: {len(body)}',
+             f'Connection: {"keep-alive" if keep_alive else "close"}']
+    if body:
+        lines.append('Content-Type: application/json')
+    for name, value in (headers or {}).items():
+        lines.append(f'{name}: {value}')
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+
+def decode_body(request):
+    """
+    Decompress a request body according to its Content-Encoding
+    (gzip and deflate; gzip is also detected by its magic bytes).
+
+    Args:
+        request: HTTPRequest
+
+    Returns:
+        str: The decoded body
+
+    Raises:
+        HTTPError: If the body cannot be decompressed
+    """
+    body = request.body
+    encoding = request.headers.get('content-encoding', '').lower()
+    try:
+        if encoding == 'gzip' or body[:2] == b'\x1f\x8b':
+            body = gzip.decompress(body)
+        elif encoding == 'deflate':
+            body = zlib.decompress(body)
+    except (OSError, EOFError, zlib.error) as e:
+        raise HTTPError(400, f'Invalid {encoding or "gzip"} body: {e}')
+    return body.decode('utf-8', errors='replace')
+
+
+class HTTPServer(ABC):
+    """
+    Minimal asyncio HTTP/1.1 server with keep-alive. Subclasses implement
+    handle_request().
+    """
+
+    def __init__(self, host='127.0.0.1', port=8080):
+        self.host = host
+        self.port = port
+        self.server = None
+
+    @abstractmethod
+    async def handle_request(self, request):
+        """
+        Handle one request.
+
+        Args:
+            request: HTTPRequest
+
+        Returns:
+            tuple: (status, body bytes, extra headers dict or None)
+        """
+        pass
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HTTPError as e:
+                    writer.write(build_response(e.status, keep_alive=False))
+                    break
+                if request is None:
+                    break
+                status, body, headers = await self.handle_request(request)
+                writer.write(build_response(status, body, headers, request.keep_alive))
+                await writer.drain()
+                if not request.keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        """Start listening; returns once the socket is bound"""
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        if self.port == 0:
+            self.port = self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
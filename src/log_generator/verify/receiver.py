@@ -0,0 +1,77 @@
+# src/verify/receiver.py
+import json
+import time
+import uuid
+from .http_server import HTTPServer, HTTPError, decode_body
+
+
+class LogsAPIReceiver(HTTPServer):
+    """
+    Local stand-in for the New Relic Logs API (POST /log/v1) that feeds every
+    accepted payload to a Verifier. Bodies may be gzip compressed; they are
+    scanned for sequence stamps without being parsed as JSON, so any batch
+    shape a shipper sends is accepted.
+
+    Usage:
+        receiver = LogsAPIReceiver(Verifier(), port=8080)
+        await receiver.start()
+    """
+
+    def __init__(self, verifier=None, host='127.0.0.1', port=8080, path='/log/v1'):
+        """
+        Initialize the receiver.
+
+        Args:
+            verifier: Verifier receiving the payloads (optional)
+            host: Address to bind
+            port: Port to bind (0 for any free port)
+            path: Request path accepted as the ingest endpoint
+        """
+        super().__init__(host, port)
+        self.verifier = verifier
+        self.path = path
+        self.requests = 0
+        self.accepted_bytes = 0
+
+    async def handle_request(self, request):
+        if request.path.split('?', 1)[0].rstrip('/') != self.path:
+            return 404, b'', None
+        if request.method != 'POST':
+            return 405, b'', None
+        return await self.ingest(request)
+
+    async def ingest(self, request):
+        """
+        Accept an ingest request.
+
+        Args:
+            request: HTTPRequest for the ingest endpoint
+
+        Returns:
+            tuple: (status, body bytes, extra headers dict or None)
+        """
+        receive_ns = time.time_ns()
+        try:
+            text = decode_body(request)
+            self.on_accept(request, text)
+        except HTTPError as e:
+            return e.status, json.dumps({'error': str(e)}).encode(), None
+
+        self.requests += 1
+        self.accepted_bytes += len(request.body)
+        if self.verifier is not None:
+            self.verifier.observe_text(text, receive_ns)
+        return 202, json.dumps({'requestId': str(uuid.uuid4())}).encode(), None
+
+    def on_accept(self, request, text):
+        """
+        Hook called for every decoded payload before it is accepted.
+
+        Args:
+            request: The HTTPRequest
+            text: The decoded body
+
+        Raises:
+            HTTPError: To reject the payload with the error's status
+        """
+        pass
@@ -0,0 +1,208 @@
+# src/verify/verifier.py
+from array import array
+import time
+from generators.stamping import STAMP_PATTERN
+
+# Histogram resolution: 2**SUB_BUCKET_BITS linear sub-buckets per power of two
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+# Largest tracked latency in microseconds (~2.3 hours); larger values are clamped
+MAX_LATENCY_US = (1 << 33) - 1
+
+
+def _bucket_index(value):
+    shift = max(0, value.bit_length() - SUB_BUCKET_BITS - 1)
+    return shift * SUB_BUCKETS + (value >> shift)
+
+
+def _bucket_value(index):
+    """Upper bound of the values in a bucket"""
+    shift = max(0, index // SUB_BUCKETS - 1)
+    return ((index - shift * SUB_BUCKETS + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log-linear histogram of latencies in microseconds (about 3%
+    relative precision). Memory use does not grow with the number of values.
+    """
+
+    def __init__(self):
+        self.counts = array('Q', [0] * (_bucket_index(MAX_LATENCY_US) + 1))
+        self.total = 0
+        self.max = 0
+
+    def record(self, value):
+        """
+        Record a latency.
+
+        Args:
+            value: Latency in microseconds (negative values count as 0)
+        """
+        value = min(max(int(value), 0), MAX_LATENCY_US)
+        self.counts[_bucket_index(value)] += 1
+        self.total += 1
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent):
+        """
+        Get a latency percentile.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            int: Latency in microseconds at that percentile (0 if empty)
+        """
+        if self.total == 0:
+            return 0
+        target = max(1, self.total * percent / 100)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(_bucket_value(index), self.max)
+        return self.max
+
+
+class StreamTracker:
+    """
+    Tracks the sequence numbers received for one stream in constant memory.
+
+    A ring of the last `window` sequence numbers tells duplicates apart from
+    late (reordered) records. Records older than the window cannot be
+    classified and are counted separately.
+    """
+
+    def __init__(self, window=65536):
+        self.window = window
+        self.ring = array('q', [0] * window)
+        self.highest = 0
+        self.received = 0
+        self.duplicates = 0
+        self.reordered = 0
+        self.missing = 0
+        self.out_of_window = 0
+
+    def observe(self, seq):
+        """
+        Record the arrival of a sequence number.
+
+        Args:
+            seq: Sequence number (starting at 1)
+        """
+        self.received += 1
+        slot = seq % self.window
+        if seq > self.highest:
+            self.missing += seq - self.highest - 1
+            self.highest = seq
+            self.ring[slot] = seq
+        elif seq <= self.highest - self.window:
+            self.out_of_window += 1
+        elif self.ring[slot] == seq:
+            self.duplicates += 1
+        else:
+            # Late arrival filling an earlier gap
+            self.reordered += 1
+            self.missing -= 1
+            self.ring[slot] = seq
+
+
+class Verifier:
+    """
+    Consumes received log data, extracts sequence stamps and keeps running
+    loss, duplicate, reordering and emit-to-receive latency statistics.
+
+    Usage:
+        verifier = Verifier()
+        verifier.observe_text(body)
+        print(verifier.report())
+    """
+
+    def __init__(self, window=65536):
+        """
+        Initialize the verifier.
+
+        Args:
+            window: Sequence numbers remembered per stream for duplicate detection
+        """
+        self.window = window
+        self.streams = {}
+        self.latency = LatencyHistogram()
+        self.started = time.monotonic()
+        self.last_receive_ns = 0
+
+    def observe_text(self, text, receive_ns=None):
+        """
+        Extract and record every sequence stamp in a block of received data.
+
+        Args:
+            text: Received data (str)
+            receive_ns: Receive time in ns since the epoch (default: now)
+
+        Returns:
+            int: Number of stamps found
+        """
+        if receive_ns is None:
+            receive_ns = time.time_ns()
+        self.last_receive_ns = receive_ns
+        found = 0
+        streams = self.streams
+        for match in STAMP_PATTERN.finditer(text):
+            run_id, stream_id, seq, emit_ns = match.groups()
+            key = (run_id, stream_id)
+            tracker = streams.get(key)
+            if tracker is None:
+                tracker = streams[key] = StreamTracker(self.window)
+            tracker.observe(int(seq))
+            self.latency.record((receive_ns - int(emit_ns)) // 1000)
+            found += 1
+        return found
+
+    def summary(self):
+        """
+        Get the aggregated statistics.
+
+        Returns:
+            dict: Totals across all streams and latency percentiles in ms
+        """
+        totals = {'received': 0, 'duplicates': 0, 'reordered': 0, 'missing': 0, 'out_of_window': 0}
+        expected = 0
+        for tracker in self.streams.values():
+            totals['received'] += tracker.received
+            totals['duplicates'] += tracker.duplicates
+            totals['reordered'] += tracker.reordered
+            totals['missing'] += tracker.missing
+            totals['out_of_window'] += tracker.out_of_window
+            expected += tracker.highest
+
+        elapsed = time.monotonic() - self.started
+        summary = {
+            'streams': len(self.streams),
+            **totals,
+            'loss_percent': round(100 * totals['missing'] / expected, 4) if expected else 0.0,
+            'records_per_sec': round(totals['received'] / elapsed, 1) if elapsed > 0 else 0.0,
+            'latency_ms': {}
+        }
+        for percent in (50, 90, 99, 99.9):
+            summary['latency_ms'][f'p{percent}'] = self.latency.percentile(percent) / 1000
+        summary['latency_ms']['max'] = self.latency.max / 1000
+        return summary
+
+    def report(self):
+        """
+        Format the statistics as a single status line.
+
+        Returns:
+            str: Human-readable summary
+        """
+        s = self.summary()
+        latency = s['latency_ms']
+        return (
+            f"streams={s['streams']} received={s['received']} missing={s['missing']} "
+            f"({s['loss_percent']}%) duplicates={s['duplicates']} reordered={s['reordered']} "
+            f"out_of_window={s['out_of_window']} rate={s['records_per_sec']}/s "
+            f"latency_ms p50={latency['p50']} p90={latency['p90']} "
+            f"p99={latency['p99']} p99.9={latency['p99.9']} max={latency['max']}"
+        )